@@ -1,7 +1,7 @@
-from typing import List, Type
+from typing import List, Optional, Type
 
 from app.domain.base.events.event import Event
-from app.domain.base.events.observer import Handler, Observer
+from app.domain.base.events.observer import DispatchPolicy, Handler, Observer
 
 
 class EventDispatcher:
@@ -16,8 +16,22 @@ class EventDispatcher:
     async def publish_notifications(self, events: List[Event]):
         await self.notifications.notify(events, data=self.data.copy())
 
-    def register_domain_event(self, event_type: Type[Event], handler: Handler):
-        self.domain_events.register(event_type, handler)
+    def register_domain_event(
+        self,
+        event_type: Type[Event],
+        handler: Handler,
+        policy: Optional[DispatchPolicy] = None,
+    ):
+        self.domain_events.register(event_type, handler, policy)
 
-    def register_notify(self, event_type: Type[Event], handler: Handler):
-        self.notifications.register(event_type, handler)
+    def register_notify(
+        self,
+        event_type: Type[Event],
+        handler: Handler,
+        policy: Optional[DispatchPolicy] = None,
+    ):
+        self.notifications.register(event_type, handler, policy)
+
+    async def wait_background(self):
+        await self.domain_events.wait_background()
+        await self.notifications.wait_background()
@@ -1,27 +1,94 @@
+import asyncio
 import functools
-from typing import Any, Awaitable, Callable, Dict, List, Type
+import logging
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Type
 
 from app.domain.base.events.base import MiddlewareType, NextMiddlewareType
 from app.domain.base.events.event import Event
 
+logger = logging.getLogger(__name__)
+
 Handler = Callable[[Event, Dict[str, Any]], Awaitable[Any]]
 
 
+class DispatchPolicy(Enum):
+    # one after another, error stops dispatching and goes to publisher
+    SEQUENTIAL = "sequential"
+    # all handlers at once, publisher waits for them, errors are logged
+    CONCURRENT = "concurrent"
+    # handlers run in background tasks, errors are logged
+    BACKGROUND = "background"
+
+
 class Observer:
+    """
+    Handlers wrapped in middlewares are compiled on register, not on notify
+
+    Concurrent and background handlers get own copy of data, so middlewares
+    of one handler don't overwrite data of another one (e.g. uow).
+    """
+
     def __init__(self):
         self.handlers: Dict[Type[Event], List[Handler]] = {}
         self.middlewares: List[MiddlewareType] = []
+        self.policies: Dict[Type[Event], DispatchPolicy] = {}
+        self._chains: Dict[Type[Event], List[NextMiddlewareType]] = {}
+        self._tasks: Set[asyncio.Task] = set()
 
     async def notify(self, events: List[Event], data: Dict[str, Any]):
         for event in events:
-            handlers = self.handlers.get(type(event), [])
-            for handler in handlers:
-                wrapped_handler = self._wrap_middleware(self.middlewares, handler)
-                await wrapped_handler(event, data)
+            chains = self._chains.get(type(event))
+            if not chains:
+                continue
 
-    def register(self, event_type: Type[Event], handler: Handler):
+            policy = self.policies.get(type(event), DispatchPolicy.SEQUENTIAL)
+            if policy is DispatchPolicy.SEQUENTIAL:
+                for chain in chains:
+                    await chain(event, data)
+            elif policy is DispatchPolicy.CONCURRENT:
+                await asyncio.gather(
+                    *(self._isolated(chain, event, data.copy()) for chain in chains)
+                )
+            else:
+                for chain in chains:
+                    task = asyncio.create_task(
+                        self._isolated(chain, event, data.copy())
+                    )
+                    # keep reference, event loop holds only weak references
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+
+    def register(
+        self,
+        event_type: Type[Event],
+        handler: Handler,
+        policy: Optional[DispatchPolicy] = None,
+    ):
         handlers = self.handlers.setdefault(event_type, [])
         handlers.append(handler)
+        if policy is not None:
+            self.policies[event_type] = policy
+        self._chains.setdefault(event_type, []).append(
+            self._wrap_middleware(self.middlewares, handler)
+        )
+
+    def set_policy(self, event_type: Type[Event], policy: DispatchPolicy):
+        self.policies[event_type] = policy
+
+    async def wait_background(self):
+        """Wait for handlers running in background, e.g. before shutdown"""
+        while self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    @staticmethod
+    async def _isolated(
+        chain: NextMiddlewareType, event: Event, data: Dict[str, Any]
+    ) -> None:
+        try:
+            await chain(event, data)
+        except Exception:
+            logger.exception("Handler of %s failed", type(event).__name__)
 
     @classmethod
     def _wrap_middleware(
@@ -36,6 +103,15 @@ class Observer:
             middleware = functools.partial(m, middleware)
         return middleware
 
+    def _compile(self):
+        self._chains = {
+            event_type: [
+                self._wrap_middleware(self.middlewares, handler) for handler in handlers
+            ]
+            for event_type, handlers in self.handlers.items()
+        }
+
     def middleware(self, middleware: MiddlewareType):
         self.middlewares.append(middleware)
+        self._compile()
         return middleware
@@ -0,0 +1,8 @@
+from typing import List, Protocol
+
+from app.domain.base.events.event import Event
+
+
+class IOutbox(Protocol):
+    async def add(self, events: List[Event]) -> None:
+        """Save notifications in current transaction, they are sent after commit"""
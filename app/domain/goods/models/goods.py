@@ -78,3 +78,13 @@ class Goods(Aggregate):
 class GoodsCreated(Event):
     def __init__(self, goods: dto.Goods):
         self.goods = goods
+
+
+class GoodsEdited(Event):
+    def __init__(self, goods: dto.Goods):
+        self.goods = goods
+
+
+class GoodsDeleted(Event):
+    def __init__(self, goods_id: UUID):
+        self.goods_id = goods_id
@@ -16,7 +16,7 @@ from app.domain.goods.exceptions.goods import (
     GoodsNotExists,
 )
 from app.domain.goods.interfaces.uow import IGoodsUoW
-from app.domain.goods.models.goods import Goods
+from app.domain.goods.models.goods import Goods, GoodsDeleted, GoodsEdited
 
 logger = logging.getLogger(__name__)
 
@@ -81,12 +81,16 @@ class GetGoods(GoodsUseCase):
 
 class DeleteGoods(GoodsUseCase):
     async def __call__(self, goods_id: Optional[UUID]) -> None:
+        events = [GoodsDeleted(goods_id)]
         try:
             await self.uow.goods.delete_goods(goods_id)
         except CantDeleteWithChildren:
             await self.uow.rollback()
             raise
+
+        await self.event_dispatcher.publish_events(events)
         await self.uow.commit()
+        await self.event_dispatcher.publish_notifications(events)
 
 
 class PatchGoods(GoodsUseCase):
@@ -101,7 +105,13 @@ class PatchGoods(GoodsUseCase):
             goods.change_active_status(patch_goods_data.is_active)
 
         await self.uow.goods.edit_goods(goods=goods)
+        goods.events.append(GoodsEdited(dto.Goods.from_orm(goods)))
+
+        await self.event_dispatcher.publish_events(goods.events)
         await self.uow.commit()
+        await self.event_dispatcher.publish_notifications(goods.events)
+        goods.events.clear()
+
         return dto.Goods.from_orm(goods)
 
 
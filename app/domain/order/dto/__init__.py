@@ -1,14 +1,34 @@
 from .goods import Goods
 from .market import Market
-from .order import Order, OrderCreate, OrderLine, OrderLineCreate, OrderMessageCreate
+from .order import (
+    Order,
+    OrderCreate,
+    OrderCursor,
+    OrderExportRow,
+    OrderLine,
+    OrderLineCreate,
+    OrderMessageCreate,
+    OrderReport,
+    OrderStatsRow,
+    OrderSummariesPage,
+    OrderSummary,
+    PendingOrdersFilter,
+)
 from .user import User
 
 __all__ = [
     "Order",
     "OrderCreate",
+    "OrderCursor",
+    "OrderExportRow",
     "OrderLine",
     "OrderLineCreate",
     "OrderMessageCreate",
+    "OrderReport",
+    "OrderStatsRow",
+    "OrderSummariesPage",
+    "OrderSummary",
+    "PendingOrdersFilter",
     "User",
     "Market",
     "Goods",
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from datetime import datetime
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import date, datetime
+from typing import Optional, Union
 from uuid import UUID
 
 from app.domain.base.dto.base import DTO
@@ -50,9 +52,110 @@ class Order(DTO):
 
     @property
     def confirmed_icon(self):
-        if self.confirmed == ConfirmedStatus.YES:
-            return "✅"
-        elif self.confirmed == ConfirmedStatus.NO:
-            return "❌"
-        else:
-            return ""
+        return _confirmed_icon(self.confirmed)
+
+
+def _confirmed_icon(confirmed: ConfirmedStatus) -> str:
+    if confirmed == ConfirmedStatus.YES:
+        return "✅"
+    elif confirmed == ConfirmedStatus.NO:
+        return "❌"
+    else:
+        return ""
+
+
+class PendingOrdersFilter(DTO):
+    """
+    Not processed orders to change in bulk, omitted fields don't filter
+
+    Filter without fields selects all orders only if all_orders is set.
+    """
+
+    order_ids: Optional[list[UUID]] = None
+    market_name: Optional[str] = None
+    start: Optional[date] = None
+    end: Optional[date] = None
+    all_orders: bool = False
+
+
+class OrderSummary(DTO):
+    """Order as it is shown in history, lines are already rendered to text"""
+
+    id: UUID
+    created_at: datetime
+    creator_id: int
+    creator_name: str
+    recipient_market_id: UUID
+    recipient_market_name: str
+    commentary: str
+    confirmed: ConfirmedStatus
+    line_count: int
+    lines_summary: str
+
+    @property
+    def confirmed_icon(self):
+        return _confirmed_icon(self.confirmed)
+
+
+class OrderSummariesPage(DTO):
+    """Page of order summaries and total count of orders matching the same filter"""
+
+    orders: list[OrderSummary]
+    total: int
+
+
+class OrderExportRow(DTO):
+    """Order line flattened together with its order, one row of export"""
+
+    order_id: UUID
+    creator_id: int
+    creator_name: str
+    recipient_market_id: UUID
+    recipient_market_name: str
+    goods_name: str
+    goods_sku: Optional[str]
+    quantity: int
+    commentary: str
+    created_at: datetime
+    confirmed: ConfirmedStatus
+
+
+class OrderStatsRow(DTO):
+    """Orders of one goods to one market with one status during report period"""
+
+    market_id: UUID
+    market_name: str
+    goods_id: UUID
+    goods_name: str
+    goods_sku: Optional[str]
+    confirmed: ConfirmedStatus
+    order_count: int
+    quantity: int
+
+
+class OrderReport(DTO):
+    """Demand per market and goods, days are inclusive"""
+
+    start: date
+    end: date
+    rows: list[OrderStatsRow]
+
+
+class OrderCursor(DTO):
+    """Keyset pagination position, orders are sorted by (created_at, id) desc"""
+
+    created_at: datetime
+    id: UUID
+
+    @classmethod
+    def from_order(cls, order: Union[Order, OrderSummary]) -> OrderCursor:
+        return cls(created_at=order.created_at, id=order.id)
+
+    def encode(self) -> str:
+        raw = f"{self.created_at.isoformat()}|{self.id}"
+        return urlsafe_b64encode(raw.encode()).decode()
+
+    @classmethod
+    def decode(cls, value: str) -> OrderCursor:
+        created_at, order_id = urlsafe_b64decode(value.encode()).decode().split("|")
+        return cls(created_at=datetime.fromisoformat(created_at), id=UUID(order_id))
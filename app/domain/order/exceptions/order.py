@@ -19,3 +19,7 @@ class OrderLineGoodsHasIncorrectType(OrderException):
 
 class OrderAlreadyExists(OrderException):
     """Order already exists"""
+
+
+class EmptyOrdersFilter(OrderException):
+    """Orders filter is empty and doesn't select all orders explicitly"""
@@ -1,8 +1,11 @@
-from typing import List, Protocol
+from datetime import date, timedelta
+from typing import AsyncIterator, List, Optional, Protocol
 from uuid import UUID
 
+from app.domain.base.events.event import Event
 from app.domain.order import dto
 from app.domain.order.models.order import Order
+from app.domain.order.value_objects import ConfirmedStatus
 
 
 class IOrderReader(Protocol):
@@ -12,33 +15,94 @@ class IOrderReader(Protocol):
     async def order_by_id(self, goods_id: UUID) -> dto.Order:
         ...
 
-    async def get_user_orders(
-        self, user_id: int, limit: int, offset: int
+    def stream_orders_for_export(
+        self,
+        creator_id: Optional[int] = None,
+        confirmed: Optional[ConfirmedStatus] = None,
+    ) -> AsyncIterator[List[dto.OrderExportRow]]:
+        ...
+
+
+class IOrderRepo(Protocol):
+    async def create_order(self, order: dto.OrderCreate) -> Order:
+        ...
+
+    async def order_by_id(self, order_id: UUID) -> Order:
+        ...
+
+    async def change_confirm_status(
+        self, order_id: UUID, confirmed: ConfirmedStatus
+    ) -> dto.Order:
+        """Change status of not processed order, else raise OrderAlreadyConfirmed"""
+
+    async def change_confirm_status_bulk(
+        self, orders: dto.PendingOrdersFilter, confirmed: ConfirmedStatus
     ) -> List[dto.Order]:
+        """Change status of all not processed orders matching filter"""
+
+    async def edit_order(self, goods: Order) -> Order:
+        ...
+
+
+class IOrderSummaryRepo(Protocol):
+    async def apply(self, events: List[Event]) -> None:
+        """Update order summaries from order events in current transaction"""
+
+    async def claim_order_for_confirmation(
+        self,
+        user_id: int,
+        lease: timedelta,
+        after: Optional[dto.OrderCursor] = None,
+    ) -> dto.OrderSummariesPage:
+        """Lease oldest not processed order not leased by others to user
+
+        Total is count of orders not leased by others, the claimed one included
+        """
+
+
+class IOrderSummaryReader(Protocol):
+    """History and export read denormalized summaries instead of aggregates"""
+
+    async def get_user_orders(
+        self,
+        user_id: int,
+        limit: Optional[int],
+        after: Optional[dto.OrderCursor] = None,
+    ) -> dto.OrderSummariesPage:
         ...
 
     async def get_user_orders_count(self, user_id: int) -> int:
         ...
 
-    async def get_orders_for_confirmation(self, limit: int, offset: int) -> List[Order]:
+    async def get_orders_for_confirmation(
+        self, limit: Optional[int], after: Optional[dto.OrderCursor] = None
+    ) -> dto.OrderSummariesPage:
         ...
 
     async def get_orders_for_confirmation_count(self) -> int:
         ...
 
-    async def get_all_orders(self, limit: int, offset: int) -> List[dto.Order]:
+    async def get_all_orders(
+        self, limit: Optional[int], after: Optional[dto.OrderCursor] = None
+    ) -> dto.OrderSummariesPage:
         ...
 
     async def get_all_orders_count(self) -> int:
         ...
 
-
-class IOrderRepo(Protocol):
-    async def create_order(self, order: dto.OrderCreate) -> Order:
+    def stream_orders_for_export(
+        self,
+        creator_id: Optional[int] = None,
+        confirmed: Optional[ConfirmedStatus] = None,
+    ) -> AsyncIterator[List[dto.OrderExportRow]]:
         ...
 
-    async def order_by_id(self, order_id: UUID) -> Order:
-        ...
 
-    async def edit_order(self, goods: Order) -> Order:
+class IOrderStatsRepo(Protocol):
+    async def apply(self, events: List[Event]) -> None:
+        """Update statistics rollup from order events in current transaction"""
+
+
+class IOrderStatsReader(Protocol):
+    async def report(self, start: date, end: date) -> dto.OrderReport:
         ...
@@ -1,7 +1,20 @@
+from app.domain.base.interfaces.outbox import IOutbox
 from app.domain.base.interfaces.uow import IUoW
-from app.domain.order.interfaces.persistence import IOrderReader, IOrderRepo
+from app.domain.order.interfaces.persistence import (
+    IOrderReader,
+    IOrderRepo,
+    IOrderStatsReader,
+    IOrderStatsRepo,
+    IOrderSummaryReader,
+    IOrderSummaryRepo,
+)
 
 
 class IOrderUoW(IUoW):
     order: IOrderRepo
     order_reader: IOrderReader
+    order_summary: IOrderSummaryRepo
+    order_summary_reader: IOrderSummaryReader
+    order_stats: IOrderStatsRepo
+    order_stats_reader: IOrderStatsReader
+    outbox: IOutbox
@@ -11,7 +11,6 @@ from app.domain.base.models.aggregate import Aggregate
 from app.domain.base.models.entity import entity
 from app.domain.order import dto
 from app.domain.order.dto import User
-from app.domain.order.exceptions.order import OrderAlreadyConfirmed
 from app.domain.order.models.goods import Goods
 from app.domain.order.models.market import Market
 from app.domain.order.models.user import TelegramUser
@@ -57,15 +56,6 @@ class Order(Aggregate):
     def add_order_line(self, order_line: OrderLine):
         self.order_lines.append(order_line)
 
-    def change_confirm_status(self, status: ConfirmedStatus, confirmed_by: User):
-        if self.confirmed is not ConfirmedStatus.NOT_PROCESSED:
-            raise OrderAlreadyConfirmed()
-        self.confirmed = status
-        self.confirmed_at = datetime.now()
-        self.events.append(
-            OrderConfirmStatusChanged(dto.order.Order.from_orm(self), confirmed_by)
-        )
-
     def add_order_message(self, order_message: OrderMessage):
         self.order_messages.append(order_message)
 
@@ -1,5 +1,7 @@
 import logging
 from abc import ABC
+from datetime import date, timedelta
+from typing import AsyncIterator, Optional
 from uuid import UUID
 
 from app.domain.base.events.dispatcher import EventDispatcher
@@ -9,7 +11,11 @@ from app.domain.order.access_policy import OrderAccessPolicy
 from app.domain.order.dto import User
 from app.domain.order.exceptions.order import OrderNotExists
 from app.domain.order.interfaces.uow import IOrderUoW
-from app.domain.order.models.order import Order, OrderMessage
+from app.domain.order.models.order import (
+    Order,
+    OrderConfirmStatusChanged,
+    OrderMessage,
+)
 from app.domain.order.value_objects.confirmed_status import ConfirmedStatus
 
 logger = logging.getLogger(__name__)
@@ -26,8 +32,10 @@ class AddOrder(OrderUseCase):
         order = await self.uow.order.create_order(order=order)
 
         await self.event_dispatcher.publish_events(order.events)
+        await self.uow.order_summary.apply(order.events)
+        await self.uow.order_stats.apply(order.events)
+        await self.uow.outbox.add(order.events)
         await self.uow.commit()
-        await self.event_dispatcher.publish_notifications(order.events)
 
         order.events.clear()
 
@@ -40,16 +48,45 @@ class ChangeConfirmStatus(OrderUseCase):
     async def __call__(
         self, order_id: UUID, confirmed_status: ConfirmedStatus, confirmed_by: User
     ) -> dto.Order:
-        order: Order = await self.uow.order.order_by_id(order_id)
-        order.change_confirm_status(confirmed_status, confirmed_by=confirmed_by)
+        # status is checked by update itself, order isn't loaded before it
+        order = await self.uow.order.change_confirm_status(order_id, confirmed_status)
+        events = [OrderConfirmStatusChanged(order, confirmed_by)]
+
+        await self.event_dispatcher.publish_events(events)
+        await self.uow.order_summary.apply(events)
+        await self.uow.order_stats.apply(events)
+        await self.uow.outbox.add(events)
+        await self.uow.commit()
 
-        await self.event_dispatcher.publish_events(order.events)
-        await self.uow.order.edit_order(order)
+        return order
+
+
+class ChangeConfirmStatusBulk(OrderUseCase):
+    async def __call__(
+        self,
+        orders: dto.PendingOrdersFilter,
+        confirmed_status: ConfirmedStatus,
+        confirmed_by: User,
+    ) -> list[dto.Order]:
+        # one set based update, events of all orders are applied as batch
+        changed = await self.uow.order.change_confirm_status_bulk(
+            orders, confirmed_status
+        )
+        events = [OrderConfirmStatusChanged(order, confirmed_by) for order in changed]
+
+        await self.event_dispatcher.publish_events(events)
+        await self.uow.order_summary.apply(events)
+        await self.uow.order_stats.apply(events)
+        await self.uow.outbox.add(events)
         await self.uow.commit()
-        await self.event_dispatcher.publish_notifications(order.events)
-        order.events.clear()
 
-        return dto.Order.from_orm(order)
+        logger.info(
+            "Orders confirm status changed in bulk: status=%s, count=%s, %s",
+            confirmed_status,
+            len(changed),
+            orders,
+        )
+        return changed
 
 
 class AddOrderMessages(OrderUseCase):
@@ -74,37 +111,72 @@ class GetOrder(OrderUseCase):
 
 
 class GetUserOrders(OrderUseCase):
-    async def __call__(self, user_id: int, limit: int, offset: int) -> list[dto.Order]:
-        return await self.uow.order_reader.get_user_orders(
-            user_id=user_id, limit=limit, offset=offset
+    async def __call__(
+        self, user_id: int, limit: Optional[int], after: Optional[dto.OrderCursor]
+    ) -> dto.OrderSummariesPage:
+        return await self.uow.order_summary_reader.get_user_orders(
+            user_id=user_id, limit=limit, after=after
         )
 
 
 class GetUserOrdersCount(OrderUseCase):
     async def __call__(self, user_id: int) -> int:
-        return await self.uow.order_reader.get_user_orders_count(user_id=user_id)
+        return await self.uow.order_summary_reader.get_user_orders_count(
+            user_id=user_id
+        )
 
 
 class GetOrdersForConfirmation(OrderUseCase):
-    async def __call__(self, limit: int, offset: int) -> list[dto.Order]:
-        return await self.uow.order_reader.get_orders_for_confirmation(
-            limit=limit, offset=offset
+    async def __call__(
+        self, limit: Optional[int], after: Optional[dto.OrderCursor]
+    ) -> dto.OrderSummariesPage:
+        return await self.uow.order_summary_reader.get_orders_for_confirmation(
+            limit=limit, after=after
         )
 
 
+class ClaimOrderForConfirmation(OrderUseCase):
+    async def __call__(
+        self, user_id: int, lease: timedelta, after: Optional[dto.OrderCursor]
+    ) -> dto.OrderSummariesPage:
+        page = await self.uow.order_summary.claim_order_for_confirmation(
+            user_id=user_id, lease=lease, after=after
+        )
+        await self.uow.commit()
+        return page
+
+
 class GetOrdersForConfirmationCount(OrderUseCase):
     async def __call__(self) -> int:
-        return await self.uow.order_reader.get_orders_for_confirmation_count()
+        return await self.uow.order_summary_reader.get_orders_for_confirmation_count()
 
 
 class GetAllOrders(OrderUseCase):
-    async def __call__(self, limit: int, offset: int) -> list[dto.Order]:
-        return await self.uow.order_reader.get_all_orders(limit=limit, offset=offset)
+    async def __call__(
+        self, limit: Optional[int], after: Optional[dto.OrderCursor]
+    ) -> dto.OrderSummariesPage:
+        return await self.uow.order_summary_reader.get_all_orders(
+            limit=limit, after=after
+        )
 
 
 class GetAllOrdersCount(OrderUseCase):
     async def __call__(self) -> int:
-        return await self.uow.order_reader.get_all_orders_count()
+        return await self.uow.order_summary_reader.get_all_orders_count()
+
+
+class StreamOrdersForExport(OrderUseCase):
+    def __call__(
+        self, creator_id: Optional[int], confirmed: Optional[ConfirmedStatus]
+    ) -> AsyncIterator[list[dto.OrderExportRow]]:
+        return self.uow.order_summary_reader.stream_orders_for_export(
+            creator_id=creator_id, confirmed=confirmed
+        )
+
+
+class GetOrderReport(OrderUseCase):
+    async def __call__(self, start: date, end: date) -> dto.OrderReport:
+        return await self.uow.order_stats_reader.report(start=start, end=end)
 
 
 class OrderService:
@@ -138,6 +210,22 @@ class OrderService:
             confirmed_by=confirmed_by,
         )
 
+    async def change_confirm_status_bulk(
+        self,
+        orders: dto.PendingOrdersFilter,
+        confirmed_status: ConfirmedStatus,
+        confirmed_by: User,
+    ) -> list[dto.Order]:
+        if not self.access_policy.confirm_orders():
+            raise AccessDenied()
+        return await ChangeConfirmStatusBulk(
+            uow=self.uow, event_dispatcher=self.event_dispatcher
+        )(
+            orders=orders,
+            confirmed_status=confirmed_status,
+            confirmed_by=confirmed_by,
+        )
+
     async def add_order_messages(
         self, order_id: UUID, messages: list[dto.OrderMessageCreate]
     ):
@@ -152,22 +240,26 @@ class OrderService:
             order = await GetOrder(
                 uow=self.uow, event_dispatcher=self.event_dispatcher
             )(order_id=order_id)
-        except OrderNotExists:
+        except OrderNotExists as err:
             order = None
+            not_exists = err
         if not self.access_policy.read_order(order=order):
             raise AccessDenied()
-        return await GetOrder(uow=self.uow, event_dispatcher=self.event_dispatcher)(
-            order_id=order_id
-        )
+        if order is None:
+            raise not_exists
+        return order
 
     async def get_user_orders(
-        self, user_id: int, limit: int, offset: int
-    ) -> list[dto.Order]:
+        self,
+        user_id: int,
+        limit: Optional[int],
+        after: Optional[dto.OrderCursor] = None,
+    ) -> dto.OrderSummariesPage:
         if not self.access_policy.read_user_orders(user_id=user_id):
             raise AccessDenied()
         return await GetUserOrders(
             uow=self.uow, event_dispatcher=self.event_dispatcher
-        )(user_id=user_id, limit=limit, offset=offset)
+        )(user_id=user_id, limit=limit, after=after)
 
     async def get_user_orders_count(self, user_id: int) -> int:
         if not self.access_policy.read_user_orders(user_id=user_id):
@@ -177,13 +269,25 @@ class OrderService:
         )(user_id=user_id)
 
     async def get_orders_for_confirmation(
-        self, limit: int, offset: int
-    ) -> list[dto.Order]:
+        self, limit: Optional[int], after: Optional[dto.OrderCursor] = None
+    ) -> dto.OrderSummariesPage:
         if not self.access_policy.read_all_orders():
             raise AccessDenied()
         return await GetOrdersForConfirmation(
             uow=self.uow, event_dispatcher=self.event_dispatcher
-        )(limit=limit, offset=offset)
+        )(limit=limit, after=after)
+
+    async def claim_order_for_confirmation(
+        self,
+        user_id: int,
+        lease: timedelta,
+        after: Optional[dto.OrderCursor] = None,
+    ) -> dto.OrderSummariesPage:
+        if not self.access_policy.confirm_orders():
+            raise AccessDenied()
+        return await ClaimOrderForConfirmation(
+            uow=self.uow, event_dispatcher=self.event_dispatcher
+        )(user_id=user_id, lease=lease, after=after)
 
     async def get_orders_for_confirmation_count(self) -> int:
         if not self.access_policy.read_all_orders():
@@ -192,11 +296,13 @@ class OrderService:
             uow=self.uow, event_dispatcher=self.event_dispatcher
         )()
 
-    async def get_all_orders(self, limit: int, offset: int) -> list[dto.Order]:
+    async def get_all_orders(
+        self, limit: Optional[int], after: Optional[dto.OrderCursor] = None
+    ) -> dto.OrderSummariesPage:
         if not self.access_policy.read_all_orders():
             raise AccessDenied()
         return await GetAllOrders(uow=self.uow, event_dispatcher=self.event_dispatcher)(
-            limit=limit, offset=offset
+            limit=limit, after=after
         )
 
     async def get_all_orders_count(self) -> int:
@@ -205,3 +311,35 @@ class OrderService:
         return await GetAllOrdersCount(
             uow=self.uow, event_dispatcher=self.event_dispatcher
         )()
+
+    async def get_report(self, start: date, end: date) -> dto.OrderReport:
+        if not self.access_policy.read_all_orders():
+            raise AccessDenied()
+        return await GetOrderReport(
+            uow=self.uow, event_dispatcher=self.event_dispatcher
+        )(start=start, end=end)
+
+    def export_user_orders(
+        self, user_id: int
+    ) -> AsyncIterator[list[dto.OrderExportRow]]:
+        if not self.access_policy.read_user_orders(user_id=user_id):
+            raise AccessDenied()
+        return StreamOrdersForExport(
+            uow=self.uow, event_dispatcher=self.event_dispatcher
+        )(creator_id=user_id, confirmed=None)
+
+    def export_orders_for_confirmation(
+        self,
+    ) -> AsyncIterator[list[dto.OrderExportRow]]:
+        if not self.access_policy.read_all_orders():
+            raise AccessDenied()
+        return StreamOrdersForExport(
+            uow=self.uow, event_dispatcher=self.event_dispatcher
+        )(creator_id=None, confirmed=ConfirmedStatus.NOT_PROCESSED)
+
+    def export_all_orders(self) -> AsyncIterator[list[dto.OrderExportRow]]:
+        if not self.access_policy.read_all_orders():
+            raise AccessDenied()
+        return StreamOrdersForExport(
+            uow=self.uow, event_dispatcher=self.event_dispatcher
+        )(creator_id=None, confirmed=None)
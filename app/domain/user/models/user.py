@@ -55,3 +55,14 @@ class TelegramUser(Aggregate):
 class UserCreated(Event):
     def __init__(self, user: dto.User):
         self.user = user
+
+
+class UserEdited(Event):
+    def __init__(self, old_id: int, user: dto.User):
+        self.old_id = old_id
+        self.user = user
+
+
+class UserDeleted(Event):
+    def __init__(self, user_id: int):
+        self.user_id = user_id
@@ -9,7 +9,7 @@ from app.domain.user import dto
 from app.domain.user.access_policy import UserAccessPolicy
 from app.domain.user.exceptions.user import CantDeleteWithOrders, UserAlreadyExists
 from app.domain.user.interfaces.uow import IUserUoW
-from app.domain.user.models.user import TelegramUser
+from app.domain.user.models.user import TelegramUser, UserDeleted, UserEdited
 
 logger = logging.getLogger(__name__)
 
@@ -95,9 +95,13 @@ class DeleteUser(UserUseCase):
 
 
         """
+        events = [UserDeleted(user_id)]
         try:
             await self.uow.user.delete_user(user_id)
+
+            await self.event_dispatcher.publish_events(events)
             await self.uow.commit()
+            await self.event_dispatcher.publish_notifications(events)
         except CantDeleteWithOrders:
             await self.uow.rollback()
             raise
@@ -131,7 +135,14 @@ class PatchUser(UserUseCase):
             user.access_levels = id_to_access_levels(new_user.user_data.access_levels)
         try:
             updated_user = await self.uow.user.edit_user(user=user)
+            updated_user.events.append(
+                UserEdited(old_id=new_user.id, user=dto.User.from_orm(updated_user))
+            )
+
+            await self.event_dispatcher.publish_events(updated_user.events)
             await self.uow.commit()
+            await self.event_dispatcher.publish_notifications(updated_user.events)
+            updated_user.events.clear()
         except UserAlreadyExists:
             await self.uow.rollback()
             raise
@@ -0,0 +1,17 @@
+from .goods_catalog import GoodsCatalog, GoodsCatalogReader, GoodsSnapshot
+from .identity_map import IdentityMap, IdentityMapStats, MemoizedReader
+from .ttl import MISSING, CacheStats, TTLCache
+from .user_cache import UserCache
+
+__all__ = [
+    "MISSING",
+    "CacheStats",
+    "GoodsCatalog",
+    "GoodsCatalogReader",
+    "GoodsSnapshot",
+    "IdentityMap",
+    "IdentityMapStats",
+    "MemoizedReader",
+    "TTLCache",
+    "UserCache",
+]
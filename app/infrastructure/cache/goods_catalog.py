@@ -0,0 +1,149 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.goods import dto
+from app.domain.goods.exceptions.goods import GoodsNotExists
+from app.domain.goods.interfaces.persistence import IGoodsReader
+from app.infrastructure.database.models.goods import goods_table
+from app.infrastructure.database.trusted_dto import trusted_list
+
+Folder = Optional[UUID]  # None is root of catalog
+
+
+@dataclass(frozen=True)
+class GoodsSnapshot:
+    """
+    Whole goods tree at one moment
+
+    Children of folder are sorted like in GoodsReader.goods_in_folder
+    (folders first, then by name), sorting is done by database, so order
+    is the same for any collation.
+    """
+
+    version: int
+    loaded_at: float
+    goods: Mapping[UUID, dto.Goods]
+    children: Mapping[Folder, Tuple[dto.Goods, ...]]
+    active_children: Mapping[Folder, Tuple[dto.Goods, ...]]
+
+    @classmethod
+    def build(
+        cls, version: int, loaded_at: float, goods: List[dto.Goods]
+    ) -> "GoodsSnapshot":
+        children: Dict[Folder, List[dto.Goods]] = {}
+        active_children: Dict[Folder, List[dto.Goods]] = {}
+        for item in goods:
+            children.setdefault(item.parent_id, []).append(item)
+            if item.is_active:
+                active_children.setdefault(item.parent_id, []).append(item)
+
+        return cls(
+            version=version,
+            loaded_at=loaded_at,
+            goods=MappingProxyType({item.id: item for item in goods}),
+            children=MappingProxyType(
+                {folder: tuple(items) for folder, items in children.items()}
+            ),
+            active_children=MappingProxyType(
+                {folder: tuple(items) for folder, items in active_children.items()}
+            ),
+        )
+
+
+class GoodsCatalog:
+    """
+    Holder of current goods snapshot
+
+    Snapshot is replaced as a whole, so readers never see half-built tree.
+    It is rebuilt after goods are changed by this process, `max_age` limits
+    how long changes made by other processes are not visible.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        max_age: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_age = max_age
+        self._session_factory = session_factory
+        self._clock = clock
+        self._snapshot: Optional[GoodsSnapshot] = None
+        self._lock = asyncio.Lock()
+
+    async def snapshot(self) -> GoodsSnapshot:
+        snapshot = self._snapshot
+        if self._is_fresh(snapshot):
+            return snapshot
+
+        async with self._lock:
+            # other request could load it while this one waited for lock
+            if self._is_fresh(self._snapshot):
+                return self._snapshot
+            return await self._reload()
+
+    async def refresh(self) -> GoodsSnapshot:
+        # reloads run one by one, so the last one started after a commit wins
+        async with self._lock:
+            return await self._reload()
+
+    def _is_fresh(self, snapshot: Optional[GoodsSnapshot]) -> bool:
+        return (
+            snapshot is not None and self._clock() - snapshot.loaded_at < self.max_age
+        )
+
+    async def _reload(self) -> GoodsSnapshot:
+        version = self._snapshot.version + 1 if self._snapshot else 1
+        loaded_at = self._clock()
+        goods = await self._load_goods()
+
+        self._snapshot = GoodsSnapshot.build(version, loaded_at, goods)
+        return self._snapshot
+
+    async def _load_goods(self) -> List[dto.Goods]:
+        query = select(
+            goods_table.c.id,
+            goods_table.c.name,
+            goods_table.c.type,
+            goods_table.c.parent_id,
+            goods_table.c.sku,
+            goods_table.c.is_active,
+        ).order_by(goods_table.c.type.desc(), goods_table.c.name)
+
+        async with self._session_factory() as session:
+            result = await session.execute(query)
+            return trusted_list(dto.Goods, result.all())
+
+
+class GoodsCatalogReader(IGoodsReader):
+    """Goods reader without queries, except of loading snapshot"""
+
+    def __init__(self, catalog: GoodsCatalog) -> None:
+        self.catalog = catalog
+
+    async def goods_in_folder(
+        self, parent_id: Optional[UUID], only_active: bool
+    ) -> List[dto.Goods]:
+        snapshot = await self.catalog.snapshot()
+        children = snapshot.active_children if only_active else snapshot.children
+        return list(children.get(parent_id, ()))
+
+    async def goods_by_id(self, goods_id: UUID) -> dto.Goods:
+        snapshot = await self.catalog.snapshot()
+        try:
+            return snapshot.goods[goods_id]
+        except KeyError:
+            raise GoodsNotExists(f"Goods with id {goods_id} not exists") from None
+
+    async def get_parent_folder(self, child_id: UUID) -> Optional[dto.Goods]:
+        child = await self.goods_by_id(child_id)
+        if child.parent_id is None:
+            return None
+        return await self.goods_by_id(child.parent_id)
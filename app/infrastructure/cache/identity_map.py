@@ -0,0 +1,68 @@
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class IdentityMapStats:
+    hits: int = 0  # reads answered from identity map, i.e. queries saved
+    misses: int = 0  # reads passed to reader
+
+    @property
+    def saved_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class IdentityMap:
+    """
+    Results of reads by key within one update
+
+    Stats object can be shared by identity maps of all updates to see how
+    many queries they saved together.
+    """
+
+    def __init__(self, stats: IdentityMapStats) -> None:
+        self.stats = stats
+        self._entries: Dict[Hashable, Any] = {}
+
+    async def get(self, key: Hashable, load: Callable[[], Awaitable[T]]) -> T:
+        """Return loaded value for key or load it, errors are not remembered"""
+        if key in self._entries:
+            self.stats.hits += 1
+            return self._entries[key]
+
+        self.stats.misses += 1
+        value = await load()
+        self._entries[key] = value
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class MemoizedReader(Generic[T]):
+    """
+    Proxy of reader which reads listed methods through identity map
+
+    Other methods and attributes are passed to reader as is.
+    """
+
+    def __init__(
+        self, reader: T, identity_map: IdentityMap, methods: Tuple[str, ...]
+    ) -> None:
+        self._reader = reader
+        self._identity_map = identity_map
+        self._methods = methods
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._reader, name)
+        if name not in self._methods:
+            return attr
+
+        async def memoized(*args: Hashable, **kwargs: Hashable) -> Any:
+            key = (type(self._reader), name, args, tuple(sorted(kwargs.items())))
+            return await self._identity_map.get(key, lambda: attr(*args, **kwargs))
+
+        return memoized
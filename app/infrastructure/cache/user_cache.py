@@ -0,0 +1,96 @@
+import time
+from typing import Callable, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.user import dto
+from app.domain.user.exceptions.user import UserNotExists
+from app.infrastructure.database.models.user import user_version_table
+from app.infrastructure.database.repositories.user import UserReader
+
+from .ttl import MISSING, CacheStats, TTLCache
+
+user_version_statement = select(user_version_table.c.version)
+
+
+class UserCache:
+    """
+    Users looked up by UserDB middleware, keyed by telegram id
+
+    Users are read from primary, access levels of a lagging replica could be
+    revoked already. Changes made by this process are invalidated at once.
+    Every change of users bumps user version in its transaction, it is
+    checked at most every `check_interval` seconds and all users are dropped
+    when it has changed, so changes made by other processes are seen after
+    `check_interval`. Unknown users aren't cached.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        ttl: float,
+        max_size: int,
+        check_interval: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.check_interval = check_interval
+        self._session_factory = session_factory
+        self._clock = clock
+        self._users: TTLCache[int, dto.User] = TTLCache(
+            ttl=ttl, max_size=max_size, clock=clock
+        )
+        self._version: Optional[int] = None
+        self._checked_at: Optional[float] = None
+        # changed on every drop, user loaded before it isn't cached
+        self._generation = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._users.stats
+
+    async def get(self, user_id: int) -> Optional[dto.User]:
+        """Return user or None if user is unknown"""
+        check = self._check_is_due()
+        user = MISSING if check else self._users.get(user_id)
+        if user is not MISSING:
+            return user
+
+        async with self._session_factory() as session:
+            if check:
+                await self._check_version(session)
+                user = self._users.get(user_id)
+            if user is MISSING:
+                user = await self._load(session, user_id)
+        return user
+
+    def invalidate(self, *user_ids: int) -> None:
+        self._generation += 1
+        self._users.invalidate(*user_ids)
+
+    def _check_is_due(self) -> bool:
+        return (
+            self._checked_at is None
+            or self._clock() - self._checked_at >= self.check_interval
+        )
+
+    async def _check_version(self, session: AsyncSession) -> None:
+        checked_at = self._clock()
+        version = (await session.execute(user_version_statement)).scalar_one()
+        if version != self._version:
+            self._generation += 1
+            self._users.clear()
+            self._version = version
+        self._checked_at = checked_at
+
+    async def _load(self, session: AsyncSession, user_id: int) -> Optional[dto.User]:
+        generation = self._generation
+        try:
+            user = await UserReader(session).user_by_id(user_id)
+        except UserNotExists:
+            # user added by other process is known on next update
+            return None
+
+        if generation == self._generation:
+            self._users.set(user_id, user)
+        return user
@@ -0,0 +1,59 @@
+"""order stats
+
+Revision ID: 2a6c9d4e8f17
+Revises: 7d3b8e1f5a62
+Create Date: 2026-10-18 18:22:45.907113
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "2a6c9d4e8f17"
+down_revision = "7d3b8e1f5a62"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "order_stats",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("market_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("goods_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "confirmed",
+            postgresql.ENUM(
+                "YES", "NO", "NOT_PROCESSED", name="confirmedstatus", create_type=False
+            ),
+            nullable=False,
+        ),
+        sa.Column("order_count", sa.INTEGER(), nullable=False),
+        sa.Column("quantity", sa.BIGINT(), nullable=False),
+        sa.PrimaryKeyConstraint(
+            "day", "market_id", "goods_id", "confirmed", name=op.f("pk_order_stats")
+        ),
+    )
+
+    op.execute(
+        """
+        INSERT INTO order_stats (
+            day, market_id, goods_id, confirmed, order_count, quantity
+        )
+        SELECT
+            o.created_at::date,
+            o.recipient_market_id,
+            l.goods_id,
+            coalesce(o.confirmed, 'NOT_PROCESSED'),
+            count(DISTINCT o.id),
+            sum(l.quantity)
+        FROM "order" o
+        JOIN order_line l ON l.order_id = o.id
+        GROUP BY 1, 2, 3, 4
+        """
+    )
+
+
+def downgrade():
+    op.drop_table("order_stats")
@@ -0,0 +1,29 @@
+"""user version
+
+Revision ID: 3e8a1c5f9d47
+Revises: 7b2d4f6a8c10
+Create Date: 2026-10-18 23:48:05.614392
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3e8a1c5f9d47"
+down_revision = "7b2d4f6a8c10"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    user_version = op.create_table(
+        "user_version",
+        sa.Column("id", sa.INTEGER(), nullable=False),
+        sa.Column("version", sa.BIGINT(), server_default=sa.text("0"), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.bulk_insert(user_version, [{"id": 1, "version": 0}])
+
+
+def downgrade():
+    op.drop_table("user_version")
@@ -0,0 +1,37 @@
+"""outbox
+
+Revision ID: 4f1c2a9e7b30
+Revises: debfc5c8d582
+Create Date: 2026-10-18 14:03:27.518204
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "4f1c2a9e7b30"
+down_revision = "debfc5c8d582"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "outbox",
+        sa.Column("id", sa.BIGINT(), autoincrement=True, nullable=False),
+        sa.Column("event_type", sa.TEXT(), nullable=False),
+        sa.Column("payload", postgresql.JSONB(), nullable=False),
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.Column(
+            "attempts", sa.INTEGER(), server_default=sa.text("0"), nullable=False
+        ),
+        sa.Column("last_error", sa.TEXT(), nullable=True),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_outbox")),
+    )
+
+
+def downgrade():
+    op.drop_table("outbox")
@@ -0,0 +1,27 @@
+"""order summary claims
+
+Revision ID: 5c1e7a9b3d24
+Revises: 2a6c9d4e8f17
+Create Date: 2026-10-18 21:04:17.530218
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5c1e7a9b3d24"
+down_revision = "2a6c9d4e8f17"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("order_summary", sa.Column("claimed_by", sa.BIGINT(), nullable=True))
+    op.add_column(
+        "order_summary", sa.Column("claimed_until", sa.DateTime(), nullable=True)
+    )
+
+
+def downgrade():
+    op.drop_column("order_summary", "claimed_until")
+    op.drop_column("order_summary", "claimed_by")
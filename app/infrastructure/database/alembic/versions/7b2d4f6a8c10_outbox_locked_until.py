@@ -0,0 +1,23 @@
+"""outbox locked until
+
+Revision ID: 7b2d4f6a8c10
+Revises: 5c1e7a9b3d24
+Create Date: 2026-10-18 23:12:41.208734
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "7b2d4f6a8c10"
+down_revision = "5c1e7a9b3d24"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("outbox", sa.Column("locked_until", sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    op.drop_column("outbox", "locked_until")
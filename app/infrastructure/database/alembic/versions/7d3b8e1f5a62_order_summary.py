@@ -0,0 +1,107 @@
+"""order summary
+
+Revision ID: 7d3b8e1f5a62
+Revises: 4f1c2a9e7b30
+Create Date: 2026-10-18 16:41:09.324871
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "7d3b8e1f5a62"
+down_revision = "4f1c2a9e7b30"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "order_summary",
+        sa.Column("order_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("creator_id", sa.BIGINT(), nullable=False),
+        sa.Column("creator_name", sa.TEXT(), nullable=False),
+        sa.Column("recipient_market_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("recipient_market_name", sa.TEXT(), nullable=False),
+        sa.Column("commentary", sa.TEXT(), nullable=False),
+        sa.Column(
+            "confirmed",
+            postgresql.ENUM(
+                "YES", "NO", "NOT_PROCESSED", name="confirmedstatus", create_type=False
+            ),
+            nullable=False,
+        ),
+        sa.Column("line_count", sa.INTEGER(), nullable=False),
+        sa.Column("lines_summary", sa.TEXT(), nullable=False),
+        sa.Column("lines", postgresql.JSONB(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["order_id"],
+            ["order.id"],
+            name=op.f("fk_order_summary_order_id_order"),
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("order_id", name=op.f("pk_order_summary")),
+    )
+    op.create_index(
+        "ix_order_summary_creator_id_created_at",
+        "order_summary",
+        ["creator_id", sa.text("created_at DESC"), sa.text("order_id DESC")],
+    )
+    op.create_index(
+        "ix_order_summary_created_at",
+        "order_summary",
+        [sa.text("created_at DESC"), sa.text("order_id DESC")],
+    )
+    op.create_index(
+        "ix_order_summary_not_processed_created_at",
+        "order_summary",
+        [sa.text("created_at DESC"), sa.text("order_id DESC")],
+        postgresql_where=sa.text("confirmed = 'NOT_PROCESSED'"),
+    )
+
+    # summary of existing orders, lines are rendered as render_lines_summary does
+    op.execute(
+        """
+        INSERT INTO order_summary (
+            order_id, created_at, creator_id, creator_name,
+            recipient_market_id, recipient_market_name, commentary, confirmed,
+            line_count, lines_summary, lines
+        )
+        SELECT
+            o.id, o.created_at, o.creator_id, u.name,
+            o.recipient_market_id, m.name, o.commentary,
+            coalesce(o.confirmed, 'NOT_PROCESSED'),
+            count(l.id),
+            coalesce(
+                string_agg(
+                    g.name || coalesce(' ' || nullif(g.sku, ''), '')
+                    || ' x ' || l.quantity,
+                    E'\\n'
+                ),
+                ''
+            ),
+            coalesce(
+                jsonb_agg(
+                    jsonb_build_object(
+                        'goods_name', g.name,
+                        'goods_sku', g.sku,
+                        'quantity', l.quantity
+                    )
+                ) FILTER (WHERE l.id IS NOT NULL),
+                '[]'::jsonb
+            )
+        FROM "order" o
+        JOIN "user" u ON u.id = o.creator_id
+        JOIN market m ON m.id = o.recipient_market_id
+        LEFT JOIN order_line l ON l.order_id = o.id
+        LEFT JOIN goods g ON g.id = l.goods_id
+        GROUP BY o.id, u.name, m.name
+        """
+    )
+
+
+def downgrade():
+    op.drop_table("order_summary")
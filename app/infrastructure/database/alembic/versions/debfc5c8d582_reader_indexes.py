@@ -0,0 +1,87 @@
+"""reader indexes
+
+Revision ID: debfc5c8d582
+Revises: 9dfdf7059df2
+Create Date: 2026-10-18 10:12:41.215307
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "debfc5c8d582"
+down_revision = "9dfdf7059df2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_order_creator_id_created_at",
+            "order",
+            ["creator_id", sa.text("created_at DESC"), sa.text("id DESC")],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_order_created_at",
+            "order",
+            [sa.text("created_at DESC"), sa.text("id DESC")],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_order_not_processed_created_at",
+            "order",
+            [sa.text("created_at DESC"), sa.text("id DESC")],
+            postgresql_where=sa.text("confirmed = 'NOT_PROCESSED'"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_order_line_order_id",
+            "order_line",
+            ["order_id"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_order_message_order_id",
+            "order_message",
+            ["order_id"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_goods_parent_id_type_name",
+            "goods",
+            ["parent_id", sa.text("type DESC"), "name"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_goods_active_parent_id_type_name",
+            "goods",
+            ["parent_id", sa.text("type DESC"), "name"],
+            postgresql_where=sa.text("is_active IS TRUE"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_user_access_levels_access_level_id",
+            "user_access_levels",
+            ["access_level_id"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for table_name, index_name in (
+            ("user_access_levels", "ix_user_access_levels_access_level_id"),
+            ("goods", "ix_goods_active_parent_id_type_name"),
+            ("goods", "ix_goods_parent_id_type_name"),
+            ("order_message", "ix_order_message_order_id"),
+            ("order_line", "ix_order_line_order_id"),
+            ("order", "ix_order_not_processed_created_at"),
+            ("order", "ix_order_created_at"),
+            ("order", "ix_order_creator_id_created_at"),
+        ):
+            op.drop_index(
+                index_name, table_name=table_name, postgresql_concurrently=True
+            )
@@ -1,7 +1,10 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.config import DB
+from app.infrastructure.database.pool import InstrumentedPool, PoolMetrics
 
 
 def make_connection_string(db: DB, async_fallback: bool = False) -> str:
@@ -13,15 +16,56 @@ def make_connection_string(db: DB, async_fallback: bool = False) -> str:
     return result
 
 
-def sa_sessionmaker(db: DB, echo: bool = False) -> sessionmaker:
+def make_engine(
+    db: DB,
+    echo: bool = False,
+    pool_metrics: Optional[PoolMetrics] = None,
+    replica: bool = False,
+) -> AsyncEngine:
+    server_settings = db.server_settings
+    if replica:
+        # writes to replica fail even if dsn points to primary by mistake
+        server_settings = {**server_settings, "default_transaction_read_only": "on"}
+
+    engine = create_async_engine(
+        db.replica_dsn if replica else make_connection_string(db),
+        echo=echo,
+        poolclass=InstrumentedPool,
+        pool_size=db.pool_size,
+        max_overflow=db.max_overflow,
+        pool_timeout=db.pool_timeout,
+        pool_recycle=db.pool_recycle,
+        pool_pre_ping=db.pool_pre_ping,
+        connect_args={
+            # cache of sqlalchemy asyncpg adapter
+            "prepared_statement_cache_size": db.statement_cache_size,
+            # cache of asyncpg itself
+            "statement_cache_size": db.statement_cache_size,
+            "command_timeout": db.command_timeout,
+            "server_settings": server_settings,
+        },
+    )
+    if pool_metrics is not None:
+        pool_metrics.attach(engine)
+    return engine
+
+
+def sa_sessionmaker(
+    db: DB,
+    echo: bool = False,
+    pool_metrics: Optional[PoolMetrics] = None,
+    replica: bool = False,
+) -> sessionmaker:
     """
     Make sessionmaker
-    :param driver: dialect+driver
-    :param db_path: database path and credential
+    :param db: database credentials and pool settings
+    :param echo: log statements
+    :param pool_metrics: collect metrics of connection pool
+    :param replica: connect to read only replica from db.replica_dsn
     :return: sessionmaker
     :rtype: sqlalchemy.orm.sessionmaker
     """
-    engine = create_async_engine(make_connection_string(db), echo=echo)
+    engine = make_engine(db, echo=echo, pool_metrics=pool_metrics, replica=replica)
     return sessionmaker(
         bind=engine,
         expire_on_commit=False,
@@ -3,6 +3,9 @@ from .goods import Goods
 from .map import map_tables
 from .market import Market
 from .order import Order, OrderLine
+from .order_stats import order_stats_table
+from .order_summary import order_summary_table
+from .outbox import outbox_table
 from .user import AccessLevel, TelegramUser
 
 __all__ = [
@@ -12,6 +15,9 @@ __all__ = [
     "Order",
     "OrderLine",
     "TelegramUser",
+    "order_stats_table",
+    "order_summary_table",
+    "outbox_table",
     "mapper_registry",
     "map_tables",
 ]
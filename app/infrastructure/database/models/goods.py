@@ -1,6 +1,6 @@
 from sqlalchemy import BOOLEAN, TEXT, CheckConstraint, Column
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import ForeignKeyConstraint, Table, UniqueConstraint, func
+from sqlalchemy import ForeignKeyConstraint, Index, Table, UniqueConstraint, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -47,6 +47,21 @@ goods_table = Table(
     UniqueConstraint("id", "type"),
 )
 
+# goods_in_folder filters by parent and sorts folders first, then by name
+Index(
+    "ix_goods_parent_id_type_name",
+    goods_table.c.parent_id,
+    goods_table.c.type.desc(),
+    goods_table.c.name,
+)
+Index(
+    "ix_goods_active_parent_id_type_name",
+    goods_table.c.parent_id,
+    goods_table.c.type.desc(),
+    goods_table.c.name,
+    postgresql_where=text("is_active IS TRUE"),
+)
+
 
 def map_goods():
     mapper_registry.map_imperatively(
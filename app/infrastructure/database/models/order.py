@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from sqlalchemy import BIGINT, INT, TEXT, CheckConstraint, Column, DateTime
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import ForeignKey, ForeignKeyConstraint, Table, func
+from sqlalchemy import ForeignKey, ForeignKeyConstraint, Index, Table, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -103,6 +103,27 @@ order_message_table = Table(
     Column("chat_id", INT, nullable=False),
 )
 
+# indexes match reader queries, orders are sorted by (created_at, id) desc
+Index(
+    "ix_order_creator_id_created_at",
+    order_table.c.creator_id,
+    order_table.c.created_at.desc(),
+    order_table.c.id.desc(),
+)
+Index(
+    "ix_order_created_at",
+    order_table.c.created_at.desc(),
+    order_table.c.id.desc(),
+)
+Index(
+    "ix_order_not_processed_created_at",
+    order_table.c.created_at.desc(),
+    order_table.c.id.desc(),
+    postgresql_where=text("confirmed = 'NOT_PROCESSED'"),
+)
+Index("ix_order_line_order_id", order_line_table.c.order_id)
+Index("ix_order_message_order_id", order_message_table.c.order_id)
+
 
 def map_order():
     mapper_registry.map_imperatively(
@@ -125,7 +146,6 @@ def map_order():
             "order": relationship(
                 Order,
                 back_populates="order_messages",
-                lazy="joined",
                 uselist=False,
             ),
         },
@@ -151,16 +171,18 @@ def map_order():
                 uselist=False,
                 passive_deletes="all",
             ),
+            # collections are loaded with separate queries to avoid
+            # lines x messages cartesian product, readers can override it
             "order_lines": relationship(
                 OrderLine,
                 backref="order",
-                lazy="joined",
+                lazy="selectin",
                 passive_deletes="all",
             ),
             "order_messages": relationship(
                 OrderMessage,
                 back_populates="order",
-                lazy="joined",
+                lazy="selectin",
             ),
         },
     )
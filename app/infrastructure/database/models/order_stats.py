@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from sqlalchemy import BIGINT, INT, Column, Date
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy import PrimaryKeyConstraint, Table
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.domain.order.value_objects.confirmed_status import ConfirmedStatus
+
+from .base import mapper_registry
+
+# rollup of order lines by day of order creation, it is updated from order
+# events in transaction of the order, so reports don't scan order lines
+order_stats_table = Table(
+    "order_stats",
+    mapper_registry.metadata,
+    Column("day", Date, nullable=False),
+    Column("market_id", UUID(as_uuid=True), nullable=False),
+    Column("goods_id", UUID(as_uuid=True), nullable=False),
+    Column("confirmed", SQLEnum(ConfirmedStatus), nullable=False),
+    Column("order_count", INT, nullable=False),
+    Column("quantity", BIGINT, nullable=False),
+    PrimaryKeyConstraint("day", "market_id", "goods_id", "confirmed"),
+)
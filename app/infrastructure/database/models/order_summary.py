@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from sqlalchemy import BIGINT, INT, TEXT, Column, DateTime
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy import ForeignKey, Index, Table, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+
+from app.domain.order.value_objects.confirmed_status import ConfirmedStatus
+
+from .base import mapper_registry
+
+# read model of history and export, one row per order, it is updated from
+# order events in transaction of the order, names are copied at creation
+order_summary_table = Table(
+    "order_summary",
+    mapper_registry.metadata,
+    Column(
+        "order_id",
+        UUID(as_uuid=True),
+        ForeignKey("order.id", ondelete="CASCADE", onupdate="CASCADE"),
+        primary_key=True,
+    ),
+    Column("created_at", DateTime, nullable=False),
+    Column("creator_id", BIGINT, nullable=False),
+    Column("creator_name", TEXT, nullable=False),
+    Column("recipient_market_id", UUID(as_uuid=True), nullable=False),
+    Column("recipient_market_name", TEXT, nullable=False),
+    Column("commentary", TEXT, nullable=False),
+    Column("confirmed", SQLEnum(ConfirmedStatus), nullable=False),
+    Column("line_count", INT, nullable=False),
+    Column("lines_summary", TEXT, nullable=False),
+    # goods_name, goods_sku and quantity of every line for export
+    Column("lines", JSONB, nullable=False),
+    # lease of not processed order to confirmer, it isn't set from events
+    Column("claimed_by", BIGINT, nullable=True),
+    Column("claimed_until", DateTime, nullable=True),
+)
+
+Index(
+    "ix_order_summary_creator_id_created_at",
+    order_summary_table.c.creator_id,
+    order_summary_table.c.created_at.desc(),
+    order_summary_table.c.order_id.desc(),
+)
+Index(
+    "ix_order_summary_created_at",
+    order_summary_table.c.created_at.desc(),
+    order_summary_table.c.order_id.desc(),
+)
+Index(
+    "ix_order_summary_not_processed_created_at",
+    order_summary_table.c.created_at.desc(),
+    order_summary_table.c.order_id.desc(),
+    postgresql_where=text("confirmed = 'NOT_PROCESSED'"),
+)
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from sqlalchemy import BIGINT, INT, TEXT, Column, DateTime, Table, func, text
+from sqlalchemy.dialects.postgresql import JSONB
+
+from .base import mapper_registry
+
+# notifications saved in transaction of aggregate, workers send and delete them
+outbox_table = Table(
+    "outbox",
+    mapper_registry.metadata,
+    Column("id", BIGINT, primary_key=True, autoincrement=True),
+    Column("event_type", TEXT, nullable=False),
+    Column("payload", JSONB, nullable=False),
+    Column("created_at", DateTime, nullable=False, server_default=func.now()),
+    Column("attempts", INT, nullable=False, server_default=text("0")),
+    Column("last_error", TEXT, nullable=True),
+    # message claimed by worker is hidden from other workers till then
+    Column("locked_until", DateTime, nullable=True),
+)
@@ -4,7 +4,7 @@ from enum import Enum
 
 from sqlalchemy import BIGINT, INT, TEXT, Column
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import ForeignKey, Table
+from sqlalchemy import ForeignKey, Index, Table, text
 from sqlalchemy.orm import relationship
 
 from app.domain.access_levels.models import helper
@@ -28,6 +28,8 @@ user_access_levels = Table(
     ),
 )
 
+Index("ix_user_access_levels_access_level_id", user_access_levels.c.access_level_id)
+
 access_level_table = Table(
     "access_level",
     mapper_registry.metadata,
@@ -42,6 +44,14 @@ user_table = Table(
     Column("name", TEXT, nullable=False),
 )
 
+# one row, bumped by every change of users, processes caching users poll it
+user_version_table = Table(
+    "user_version",
+    mapper_registry.metadata,
+    Column("id", INT, primary_key=True),
+    Column("version", BIGINT, nullable=False, server_default=text("0")),
+)
+
 
 def map_user():
     mapper_registry.map_imperatively(
@@ -0,0 +1,93 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PoolMetrics:
+    connects: int = 0  # connections opened to database
+    checkouts: int = 0
+    checked_out: int = 0  # connections in use now
+    max_checked_out: int = 0  # peak of connections used at once
+    overflow: int = 0  # connections above pool_size now
+    max_overflow: int = 0
+    timeouts: int = 0  # checkouts failed after pool_timeout
+    wait_total: float = 0.0  # seconds spent by checkouts waiting for connection
+    wait_max: float = 0.0
+
+    @property
+    def mean_wait_ms(self) -> float:
+        return self.wait_total / self.checkouts * 1000 if self.checkouts else 0.0
+
+    def attach(self, engine: AsyncEngine) -> None:
+        pool = engine.sync_engine.pool
+        if not isinstance(pool, InstrumentedPool):
+            raise TypeError(f"Checkout wait can't be measured with {type(pool)}")
+        pool.metrics = self
+        self._engine = engine.sync_engine
+
+        event.listen(engine.sync_engine, "connect", self._on_connect)
+        event.listen(engine.sync_engine, "checkout", self._on_checkout)
+        event.listen(engine.sync_engine, "checkin", self._on_checkin)
+
+    def observe_wait(self, seconds: float) -> None:
+        self.wait_total += seconds
+        self.wait_max = max(self.wait_max, seconds)
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        self.connects += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        self.checkouts += 1
+        self.checked_out += 1
+        self.max_checked_out = max(self.max_checked_out, self.checked_out)
+        self._update_overflow()
+
+    def _on_checkin(self, dbapi_connection, connection_record) -> None:
+        self.checked_out -= 1
+        self._update_overflow()
+
+    def _update_overflow(self) -> None:
+        # overflow of pool is negative till pool_size connections are opened
+        self.overflow = max(self._engine.pool.overflow(), 0)
+        self.max_overflow = max(self.max_overflow, self.overflow)
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Queue pool which measures how long checkout waits for a free connection"""
+
+    metrics: Optional[PoolMetrics] = None
+
+    def _do_get(self):
+        if self.metrics is None:
+            return super()._do_get()
+
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        finally:
+            self.metrics.observe_wait(time.perf_counter() - started)
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+async def log_pool_metrics(metrics: PoolMetrics, interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        logger.info(
+            "Pool metrics: %s, mean wait %.2f ms", metrics, metrics.mean_wait_ms
+        )
@@ -2,6 +2,10 @@ from .access_level import AccessLevelReader
 from .goods import GoodsReader, GoodsRepo
 from .market import MarketReader, MarketRepo
 from .order import OrderReader, OrderRepo
+from .order_core import CoreOrderReader
+from .order_stats import OrderStatsReader, OrderStatsRepo
+from .order_summary import OrderSummaryReader, OrderSummaryRepo
+from .outbox import OutboxRepo
 from .user import UserReader, UserRepo
 
 __all__ = [
@@ -14,4 +18,10 @@ __all__ = [
     "MarketReader",
     "OrderRepo",
     "OrderReader",
+    "CoreOrderReader",
+    "OrderSummaryRepo",
+    "OrderSummaryReader",
+    "OrderStatsRepo",
+    "OrderStatsReader",
+    "OutboxRepo",
 ]
@@ -1,6 +1,5 @@
 from typing import List
 
-from pydantic import parse_obj_as
 from sqlalchemy import select
 
 from app.domain.access_levels import dto
@@ -10,6 +9,7 @@ from app.domain.user.exceptions.user import UserNotExists
 from app.domain.user.models.user import TelegramUser
 from app.infrastructure.database.exception_mapper import exception_mapper
 from app.infrastructure.database.repositories.repo import SQLAlchemyRepo
+from app.infrastructure.database.trusted_dto import trusted_list
 
 
 class AccessLevelReader(SQLAlchemyRepo, IAccessLevelReader):
@@ -19,7 +19,7 @@ class AccessLevelReader(SQLAlchemyRepo, IAccessLevelReader):
         result = await self.session.execute(query)
         access_levels = result.scalars().all()
 
-        return parse_obj_as(List[dto.AccessLevel], access_levels)
+        return trusted_list(dto.AccessLevel, access_levels)
 
     @exception_mapper
     async def user_access_levels(self, user_id: int) -> List[dto.AccessLevel]:
@@ -28,4 +28,4 @@ class AccessLevelReader(SQLAlchemyRepo, IAccessLevelReader):
         if not user:
             raise UserNotExists
 
-        return parse_obj_as(List[dto.AccessLevel], user.access_levels)
+        return trusted_list(dto.AccessLevel, user.access_levels)
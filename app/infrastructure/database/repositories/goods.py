@@ -2,8 +2,7 @@ import logging
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import parse_obj_as
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.exc import IntegrityError
 
 from app.domain.goods import dto
@@ -18,28 +17,45 @@ from app.domain.goods.exceptions.goods import (
 )
 from app.domain.goods.interfaces.persistence import IGoodsReader, IGoodsRepo
 from app.domain.goods.models.goods import Goods
+from app.infrastructure.database.models.goods import goods_table
 from app.infrastructure.database.repositories.repo import SQLAlchemyRepo
+from app.infrastructure.database.trusted_dto import trusted_from_orm, trusted_list
 
 logger = logging.getLogger(__name__)
 
+# statements are built once, so calls skip building and cache key generation,
+# compiled statement is taken from cache and its sql from asyncpg cache
+_goods = select(
+    goods_table.c.id,
+    goods_table.c.name,
+    goods_table.c.type,
+    goods_table.c.parent_id,
+    goods_table.c.sku,
+    goods_table.c.is_active,
+).order_by(goods_table.c.type.desc(), goods_table.c.name)
+_active = goods_table.c.is_active.is_(True)
+_in_folder = goods_table.c.parent_id == bindparam("parent_id")
+# "parent_id = NULL" doesn't match root goods, so root has own statements
+_in_root = goods_table.c.parent_id.is_(None)
+
+goods_in_folder_statements = {
+    # (in root, only active)
+    (False, False): _goods.where(_in_folder),
+    (False, True): _goods.where(_in_folder, _active),
+    (True, False): _goods.where(_in_root),
+    (True, True): _goods.where(_in_root, _active),
+}
+
 
 class GoodsReader(SQLAlchemyRepo, IGoodsReader):
     async def goods_in_folder(
         self, parent_id: Optional[UUID], only_active: bool
     ) -> List[dto.Goods]:
-        query = (
-            select(Goods)
-            .where(Goods.parent_id == parent_id)
-            .order_by(Goods.type.desc(), Goods.name)
-        )
-
-        if only_active:
-            query = query.where(Goods.is_active.is_(True))
+        query = goods_in_folder_statements[(parent_id is None, only_active)]
 
-        result = await self.session.execute(query)
-        goods = result.scalars().unique().all()
+        result = await self.session.execute(query, {"parent_id": parent_id})
 
-        return parse_obj_as(List[dto.Goods], goods)
+        return trusted_list(dto.Goods, result)
 
     async def goods_by_id(self, goods_id: UUID) -> dto.Goods:
         goods = await self.session.get(Goods, goods_id)
@@ -47,7 +63,7 @@ class GoodsReader(SQLAlchemyRepo, IGoodsReader):
         if not goods:
             raise GoodsNotExists(f"Goods with id {goods_id} not exists")
 
-        return dto.Goods.from_orm(goods)
+        return trusted_from_orm(dto.Goods, goods)
 
 
 class GoodsRepo(SQLAlchemyRepo, IGoodsRepo):
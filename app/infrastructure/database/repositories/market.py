@@ -2,7 +2,6 @@ import logging
 from typing import List
 from uuid import UUID
 
-from pydantic import parse_obj_as
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 
@@ -14,22 +13,28 @@ from app.domain.market.exceptions.market import (
 )
 from app.domain.market.interfaces.persistence import IMarketReader, IMarketRepo
 from app.domain.market.models.market import Market
+from app.infrastructure.database.models.market import market_table
 from app.infrastructure.database.repositories.repo import SQLAlchemyRepo
+from app.infrastructure.database.trusted_dto import trusted_from_orm, trusted_list
 
 logger = logging.getLogger(__name__)
 
+# prebuilt statements, see goods reader
+_markets = select(
+    market_table.c.id, market_table.c.name, market_table.c.is_active
+).order_by(market_table.c.name)
+all_markets_statements = {
+    # only active
+    False: _markets,
+    True: _markets.where(market_table.c.is_active.is_(True)),
+}
+
 
 class MarketReader(SQLAlchemyRepo, IMarketReader):
     async def all_markets(self, only_active: bool = False) -> List[dto.Market]:
-        query = select(Market).order_by(Market.name)
-
-        if only_active:
-            query = query.where(Market.is_active.is_(True))
-
-        result = await self.session.execute(query)
-        goods = result.scalars().all()
+        result = await self.session.execute(all_markets_statements[only_active])
 
-        return parse_obj_as(List[dto.Market], goods)
+        return trusted_list(dto.Market, result)
 
     async def market_by_id(self, market_id: UUID) -> dto.Market:
         goods = await self.session.get(Market, market_id)
@@ -37,7 +42,7 @@ class MarketReader(SQLAlchemyRepo, IMarketReader):
         if not goods:
             raise MarketNotExists(f"Market with id {market_id} not exists")
 
-        return dto.Market.from_orm(goods)
+        return trusted_from_orm(dto.Market, goods)
 
 
 class MarketRepo(SQLAlchemyRepo, IMarketRepo):
@@ -1,22 +1,61 @@
-from typing import List
+from datetime import timedelta
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from pydantic import parse_obj_as
-from sqlalchemy import func, insert, select, desc
+from sqlalchemy import bindparam, desc, func, insert, literal, select, update
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload, make_transient_to_detached
 
 from app.domain.goods.exceptions.goods import GoodsNotExists
-from app.domain.goods.models.goods import Goods
-from app.domain.order import dto
+from app.domain.market.exceptions.market import MarketNotExists
+from app.domain.order import dto, models
 from app.domain.order.exceptions.order import (
+    EmptyOrdersFilter,
+    OrderAlreadyConfirmed,
     OrderAlreadyExists,
     OrderLineGoodsHasIncorrectType,
     OrderNotExists,
 )
 from app.domain.order.interfaces.persistence import IOrderReader, IOrderRepo
 from app.domain.order.models.order import Order, OrderLine
+from app.domain.order.value_objects import GoodsType
 from app.domain.order.value_objects.confirmed_status import ConfirmedStatus
+from app.domain.user.exceptions.user import UserNotExists
+from app.infrastructure.database.models.market import market_table
+from app.infrastructure.database.models.order import order_line_table, order_table
+from app.infrastructure.database.models.user import user_table
+from app.infrastructure.database.repositories.order_rows import (
+    order_columns,
+    order_messages,
+    row_to_order,
+)
 from app.infrastructure.database.repositories.repo import SQLAlchemyRepo
+from app.infrastructure.database.trusted_dto import trusted_from_orm
+
+EXPORT_CHUNK_SIZE = 1000
+
+# status is compared and set by one statement, so only one of concurrent
+# confirmations changes it, confirmed orders are returned as for Core reader
+_change_confirm_status = (
+    update(order_table)
+    .values(
+        confirmed=bindparam("confirmed_status", type_=order_table.c.confirmed.type),
+        confirmed_at=func.now(),
+    )
+    .where(
+        order_table.c.confirmed == ConfirmedStatus.NOT_PROCESSED,
+        order_table.c.creator_id == user_table.c.id,
+        order_table.c.recipient_market_id == market_table.c.id,
+    )
+    .returning(*order_columns, order_messages.label("order_messages"))
+)
+change_confirm_status_statement = _change_confirm_status.where(
+    order_table.c.id == bindparam("order_id")
+)
+
+order_exists_statement = select(
+    select(order_table.c.id).where(order_table.c.id == bindparam("order_id")).exists()
+)
 
 
 class OrderReader(SQLAlchemyRepo, IOrderReader):
@@ -29,117 +68,217 @@ class OrderReader(SQLAlchemyRepo, IOrderReader):
         if not order:
             raise OrderNotExists(f"Order with id {order_id} not exists")
 
-        return dto.Order.from_orm(order)
+        return trusted_from_orm(dto.Order, order)
 
-    async def get_user_orders(
-        self, user_id: int, limit: int, offset: int
-    ) -> List[dto.Order]:
+    async def stream_orders_for_export(
+        self,
+        creator_id: Optional[int] = None,
+        confirmed: Optional[ConfirmedStatus] = None,
+    ) -> AsyncIterator[List[dto.OrderExportRow]]:
         query = (
-            select(Order)
-            .where(Order.creator.has(id=user_id))
-            .order_by(desc(Order.created_at))
-            .limit(limit)
-            .offset(offset)
+            select(
+                Order.id.label("order_id"),
+                Order.creator_id,
+                models.user.TelegramUser.name.label("creator_name"),
+                Order.recipient_market_id,
+                models.market.Market.name.label("recipient_market_name"),
+                models.goods.Goods.name.label("goods_name"),
+                models.goods.Goods.sku.label("goods_sku"),
+                OrderLine.quantity,
+                Order.commentary,
+                Order.created_at,
+                Order.confirmed,
+            )
+            .join(Order.creator)
+            .join(Order.recipient_market)
+            .join(Order.order_lines)
+            .join(OrderLine.goods)
+            .order_by(desc(Order.created_at), desc(Order.id))
+            .execution_options(yield_per=EXPORT_CHUNK_SIZE)
         )
+        if creator_id is not None:
+            query = query.where(Order.creator_id == creator_id)
+        if confirmed is not None:
+            query = query.where(Order.confirmed == confirmed)
 
-        result = await self.session.execute(query)
-        orders = result.unique().scalars().fetchall()
-
-        return parse_obj_as(List[dto.Order], orders)
+        # server side cursor, only one chunk of rows is kept in memory
+        result = await self.session.stream(query)
+        async for rows in result.partitions():
+            yield [trusted_from_orm(dto.OrderExportRow, row) for row in rows]
 
-    async def get_user_orders_count(self, user_id: int) -> int:
-        query = select(func.count(Order.id)).where(Order.creator.has(id=user_id))
 
-        result = await self.session.execute(query)
-        count = result.scalar_one()
+class OrderRepo(SQLAlchemyRepo, IOrderRepo):
+    async def create_order(self, order: dto.OrderCreate) -> Order:
+        """
+        Insert order and its lines with constant count of statements
 
-        return count
+        Related entities are validated before insert and order is built from
+        them, so it isn't loaded back after insert.
+        """
+        creator, market = await self._order_parties(order)
+        goods = await self._order_goods(order.order_lines)
 
-    async def get_orders_for_confirmation(self, limit: int, offset: int) -> List[Order]:
         query = (
-            select(Order)
-            .where(Order.confirmed == ConfirmedStatus.NOT_PROCESSED)
-            .order_by(desc(Order.created_at))
-            .limit(limit)
-            .offset(offset)
+            insert(order_table)
+            .values(
+                creator_id=order.creator_id,
+                recipient_market_id=order.recipient_market_id,
+                commentary=order.commentary,
+            )
+            .returning(order_table.c.id, order_table.c.created_at)
         )
+        new_order_id, created_at = (await self.session.execute(query)).one()
+
+        order_lines = [
+            OrderLine(goods=goods[line.goods_id], quantity=line.quantity)
+            for line in order.order_lines
+        ]
+        if order_lines:
+            # one multi-row insert for all lines
+            await self.session.execute(
+                insert(order_line_table).values(
+                    [
+                        dict(
+                            id=order_line.id,
+                            order_id=new_order_id,
+                            goods_id=order_line.goods.id,
+                            goods_type=order_line.goods.type,
+                            quantity=order_line.quantity,
+                        )
+                        for order_line in order_lines
+                    ]
+                )
+            )
 
-        result = await self.session.execute(query)
-        orders = result.unique().scalars().fetchall()
+        new_order = Order(
+            id=new_order_id,
+            order_lines=order_lines,
+            creator=creator,
+            created_at=created_at,
+            recipient_market=market,
+            commentary=order.commentary,
+        )
+        self._attach(new_order)
 
-        return parse_obj_as(List[dto.Order], orders)
+        new_order.create()
+        return new_order
 
-    async def get_orders_for_confirmation_count(self) -> int:
-        query = select(func.count(Order.id)).where(
-            Order.confirmed == ConfirmedStatus.NOT_PROCESSED
+    async def _order_parties(
+        self, order: dto.OrderCreate
+    ) -> Tuple[models.user.TelegramUser, models.market.Market]:
+        # outer joins from one row, so missing entity is None instead of no row
+        query = (
+            select(models.user.TelegramUser, models.market.Market)
+            .select_from(select(literal(1)).subquery())
+            .outerjoin(
+                models.user.TelegramUser,
+                models.user.TelegramUser.id == order.creator_id,
+            )
+            .outerjoin(
+                models.market.Market,
+                models.market.Market.id == order.recipient_market_id,
+            )
+            # creator stays in session, so it is loaded whole, in the same query
+            .options(joinedload(models.user.TelegramUser.access_levels))
         )
+        creator, market = (await self.session.execute(query)).unique().one()
 
-        result = await self.session.execute(query)
-        count = result.scalar_one()
+        if creator is None:
+            raise UserNotExists(f"User with id {order.creator_id} not exists")
+        if market is None:
+            raise MarketNotExists(
+                f"Market with id {order.recipient_market_id} not exists"
+            )
+        return creator, market
 
-        return count
+    async def _order_goods(
+        self, order_lines: List[dto.OrderLineCreate]
+    ) -> Dict[UUID, models.goods.Goods]:
+        goods_ids = {line.goods_id for line in order_lines}
+        if not goods_ids:
+            return {}
 
-    async def get_all_orders(self, limit: int, offset: int) -> List[dto.Order]:
-        query = select(Order).order_by(desc(Order.created_at)).limit(limit).offset(offset)
+        # parent and children are joined by mapping, goods stays in session whole
+        query = select(models.goods.Goods).where(models.goods.Goods.id.in_(goods_ids))
         result = await self.session.execute(query)
-        orders = result.unique().scalars().fetchall()
+        goods = {item.id: item for item in result.unique().scalars()}
+
+        for line in order_lines:
+            line_goods = goods.get(line.goods_id)
+            if line_goods is None:
+                raise GoodsNotExists(f"Goods with id {line.goods_id} not exists")
+            if (
+                line_goods.type is not GoodsType.GOODS
+                or line.goods_type is not line_goods.type
+            ):
+                raise OrderLineGoodsHasIncorrectType(
+                    f"Goods with id {line.goods_id} is {line_goods.type} type, not GoodsType.GOODS"
+                )
+        return goods
+
+    def _attach(self, order: Order) -> None:
+        """Add already inserted order to session as persistent, without flush"""
+        order.creator_id = order.creator.id
+        order.recipient_market_id = order.recipient_market.id
+        order.updated_at = None
+        for order_line in order.order_lines:
+            order_line.order_id = order.id
+            order_line.goods_id = order_line.goods.id
+            order_line.goods_type = order_line.goods.type
+            make_transient_to_detached(order_line)
+        make_transient_to_detached(order)
+        self.session.add(order)
 
-        return parse_obj_as(List[dto.Order], orders)
+    async def order_by_id(self, order_id: UUID) -> Order:
+        order = await self.session.get(Order, order_id)
 
-    async def get_all_orders_count(self) -> int:
-        query = select(func.count(Order.id))
-        result = await self.session.execute(query)
-        count = result.scalar_one()
+        if not order:
+            raise OrderNotExists(f"Order with id {order_id} not exists")
 
-        return count
+        return order
 
+    async def change_confirm_status(
+        self, order_id: UUID, confirmed: ConfirmedStatus
+    ) -> dto.Order:
+        result = await self.session.execute(
+            change_confirm_status_statement,
+            {"order_id": order_id, "confirmed_status": confirmed},
+        )
+        row = result.one_or_none()
 
-class OrderRepo(SQLAlchemyRepo, IOrderRepo):
-    async def create_order(self, order: dto.OrderCreate) -> Order:
-        query = (
-            insert(Order)
-            .values(
-                creator_id=order.creator_id,
-                recipient_market_id=order.recipient_market_id,
-                commentary=order.commentary,
+        if not row:
+            # the update missed, so the order is either confirmed or missing
+            exists = await self.session.scalar(
+                order_exists_statement, {"order_id": order_id}
             )
-            .returning(Order.id)
-        )
-        result = await self.session.execute(query)
-        new_order_id = result.scalar_one()
-
-        for line in order.order_lines:
-            query = insert(OrderLine).values(
-                order_id=new_order_id,
-                goods_id=line.goods_id,
-                quantity=line.quantity,
-                goods_type=line.goods_type,
+            if not exists:
+                raise OrderNotExists(f"Order with id {order_id} not exists")
+            raise OrderAlreadyConfirmed(
+                f"Order with id {order_id} is already confirmed"
             )
-            try:
-                await self.session.execute(query)
-            except IntegrityError:
-                await self.session.rollback()
-                goods = await self.session.get(Goods, line.goods_id)
-                if not goods:
-                    raise GoodsNotExists(f"Goods with id {line.goods_id} not exists")
-                else:
-                    raise OrderLineGoodsHasIncorrectType(
-                        f"Goods with id {line.goods_id} is {goods.type} type, not GoodsType.GOODS"
-                    )
-
-        new_order: Order = await self.session.get(Order, new_order_id)
 
-        new_order.create()
-        await self.session.flush()
-        return new_order
+        return row_to_order(row, row.order_messages)
 
-    async def order_by_id(self, order_id: UUID) -> Order:
-        order = await self.session.get(Order, order_id)
-
-        if not order:
-            raise OrderNotExists(f"Order with id {order_id} not exists")
+    async def change_confirm_status_bulk(
+        self, orders: dto.PendingOrdersFilter, confirmed: ConfirmedStatus
+    ) -> List[dto.Order]:
+        if orders == dto.PendingOrdersFilter():
+            raise EmptyOrdersFilter(f"Orders filter is empty: {orders}")
+
+        query = _change_confirm_status
+        if orders.order_ids is not None:
+            query = query.where(order_table.c.id.in_(orders.order_ids))
+        if orders.market_name is not None:
+            query = query.where(market_table.c.name == orders.market_name)
+        if orders.start is not None:
+            query = query.where(order_table.c.created_at >= orders.start)
+        if orders.end is not None:
+            query = query.where(
+                order_table.c.created_at < orders.end + timedelta(days=1)
+            )
 
-        return order
+        result = await self.session.execute(query, {"confirmed_status": confirmed})
+        return [row_to_order(row, row.order_messages) for row in result]
 
     async def edit_order(self, order: Order) -> Order:
         order_id = order.id  # copy order id to access in case of exception
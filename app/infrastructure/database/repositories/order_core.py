@@ -0,0 +1,41 @@
+from uuid import UUID
+
+from sqlalchemy import bindparam, select
+
+from app.domain.order import dto
+from app.domain.order.exceptions.order import OrderNotExists
+from app.infrastructure.database.models.order import order_table
+from app.infrastructure.database.repositories.order import OrderReader
+from app.infrastructure.database.repositories.order_rows import (
+    order_columns,
+    order_messages,
+    orders_from,
+    row_to_order,
+)
+
+# prebuilt, it is read on every confirmation and notification
+order_by_id_statement = (
+    select(*order_columns, order_messages.label("order_messages"))
+    .select_from(orders_from)
+    .where(order_table.c.id == bindparam("order_id"))
+)
+
+
+class CoreOrderReader(OrderReader):
+    """
+    Order reader on SQLAlchemy Core, one row per order
+
+    Only columns of DTOs are selected, lines and messages are aggregated to
+    json by database, so there is no identity map and no duplicate rows.
+    """
+
+    async def order_by_id(self, order_id: UUID) -> dto.Order:
+        result = await self.session.execute(
+            order_by_id_statement, {"order_id": order_id}
+        )
+        row = result.one_or_none()
+
+        if not row:
+            raise OrderNotExists(f"Order with id {order_id} not exists")
+
+        return row_to_order(row, row.order_messages)
@@ -0,0 +1,105 @@
+from typing import Any, Dict, List
+from uuid import UUID
+
+from sqlalchemy import JSON, func, literal_column, select, type_coerce
+from sqlalchemy.sql import ColumnElement, Select
+
+from app.domain.order import dto
+from app.domain.order.value_objects import GoodsType
+from app.infrastructure.database.models.goods import goods_table
+from app.infrastructure.database.models.market import market_table
+from app.infrastructure.database.models.order import (
+    order_line_table,
+    order_message_table,
+    order_table,
+)
+from app.infrastructure.database.models.user import user_table
+
+EMPTY_JSON_ARRAY = literal_column("'[]'::json")
+
+
+def _json_object(**fields: ColumnElement) -> ColumnElement:
+    # keys are literals, asyncpg can't infer type of bound parameter there
+    args = []
+    for key, column in fields.items():
+        args.extend((literal_column(f"'{key}'"), column))
+    return func.json_build_object(*args)
+
+
+def _json_array(query: Select) -> ColumnElement:
+    return type_coerce(func.coalesce(query.scalar_subquery(), EMPTY_JSON_ARRAY), JSON)
+
+
+# lines are aggregated per order in correlated subquery, so order is one row
+# and limit is applied to orders before lines are read
+order_lines = _json_array(
+    select(
+        func.json_agg(
+            _json_object(
+                quantity=order_line_table.c.quantity,
+                goods_id=goods_table.c.id,
+                goods_name=goods_table.c.name,
+                goods_type=goods_table.c.type,
+                goods_sku=goods_table.c.sku,
+                goods_is_active=goods_table.c.is_active,
+            )
+        )
+    )
+    .select_from(order_line_table.join(goods_table))
+    .where(order_line_table.c.order_id == order_table.c.id)
+)
+
+order_messages = _json_array(
+    select(
+        func.json_agg(
+            _json_object(
+                message_id=order_message_table.c.message_id,
+                chat_id=order_message_table.c.chat_id,
+            )
+        )
+    ).where(order_message_table.c.order_id == order_table.c.id)
+)
+
+order_columns = (
+    order_table.c.id,
+    order_table.c.created_at,
+    order_table.c.commentary,
+    order_table.c.confirmed,
+    user_table.c.id.label("creator_id"),
+    user_table.c.name.label("creator_name"),
+    market_table.c.id.label("market_id"),
+    market_table.c.name.label("market_name"),
+    market_table.c.is_active.label("market_is_active"),
+    order_lines.label("order_lines"),
+)
+
+orders_from = order_table.join(user_table).join(market_table)
+
+
+def row_to_order(row: Any, messages: List[Dict[str, Any]]) -> dto.Order:
+    # values come from our schema, so DTOs are built without validation
+    return dto.Order.construct(
+        id=row.id,
+        order_lines=[_order_line(line) for line in row.order_lines],
+        creator=dto.User.construct(id=row.creator_id, name=row.creator_name),
+        created_at=row.created_at,
+        recipient_market=dto.Market.construct(
+            id=row.market_id, name=row.market_name, is_active=row.market_is_active
+        ),
+        commentary=row.commentary,
+        confirmed=row.confirmed,
+        order_messages=[dto.order.OrderMessage.construct(**m) for m in messages],
+    )
+
+
+def _order_line(line: Dict[str, Any]) -> dto.OrderLine:
+    return dto.OrderLine.construct(
+        quantity=line["quantity"],
+        goods=dto.Goods.construct(
+            id=UUID(line["goods_id"]),
+            name=line["goods_name"],
+            type=GoodsType[line["goods_type"]],
+            sku=line["goods_sku"],
+            is_active=line["goods_is_active"],
+        ),
+    )
@@ -0,0 +1,133 @@
+from collections import defaultdict
+from datetime import date
+from typing import Dict, List, Tuple
+from uuid import UUID
+
+from sqlalchemy import BIGINT, bindparam, cast, func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from app.domain.base.events.event import Event
+from app.domain.order import dto
+from app.domain.order.interfaces.persistence import IOrderStatsReader, IOrderStatsRepo
+from app.domain.order.models.order import OrderConfirmStatusChanged, OrderCreated
+from app.domain.order.value_objects.confirmed_status import ConfirmedStatus
+from app.infrastructure.database.models.goods import goods_table
+from app.infrastructure.database.models.market import market_table
+from app.infrastructure.database.models.order_stats import order_stats_table
+from app.infrastructure.database.repositories.repo import SQLAlchemyRepo
+from app.infrastructure.database.trusted_dto import trusted_list
+
+stats = order_stats_table
+
+
+# (day, market_id, goods_id, confirmed) -> [order_count, quantity]
+Deltas = Dict[Tuple[date, UUID, UUID, ConfirmedStatus], List[int]]
+
+
+class OrderStatsRepo(SQLAlchemyRepo, IOrderStatsRepo):
+    async def apply(self, events: List[Event]) -> None:
+        # deltas of all events are summed, so a batch is one upsert
+        deltas: Deltas = defaultdict(lambda: [0, 0])
+        for event in events:
+            if isinstance(event, OrderCreated):
+                self._add(deltas, event.order, event.order.confirmed, sign=1)
+            elif isinstance(event, OrderConfirmStatusChanged):
+                # status is changed only once, from not processed
+                self._add(deltas, event.order, ConfirmedStatus.NOT_PROCESSED, sign=-1)
+                self._add(deltas, event.order, event.order.confirmed, sign=1)
+        await self._upsert(deltas)
+
+    @staticmethod
+    def _add(
+        deltas: Deltas, order: dto.Order, confirmed: ConfirmedStatus, sign: int
+    ) -> None:
+        # order is counted once per goods, even if goods is in several lines
+        quantities: Dict[UUID, int] = defaultdict(int)
+        for line in order.order_lines:
+            quantities[line.goods.id] += line.quantity
+
+        day = order.created_at.date()
+        for goods_id, quantity in quantities.items():
+            delta = deltas[(day, order.recipient_market.id, goods_id, confirmed)]
+            delta[0] += sign
+            delta[1] += sign * quantity
+
+    async def _upsert(self, deltas: Deltas) -> None:
+        # rows are sorted, so concurrent batches lock rows in one order
+        rows = []
+        for key in sorted(deltas, key=_row_key):
+            order_count, quantity = deltas[key]
+            if not order_count and not quantity:
+                continue
+            day, market_id, goods_id, confirmed = key
+            rows.append(
+                dict(
+                    day=day,
+                    market_id=market_id,
+                    goods_id=goods_id,
+                    confirmed=confirmed,
+                    order_count=order_count,
+                    quantity=quantity,
+                )
+            )
+        if not rows:
+            return
+
+        query = insert(stats).values(rows)
+        query = query.on_conflict_do_update(
+            index_elements=[
+                stats.c.day,
+                stats.c.market_id,
+                stats.c.goods_id,
+                stats.c.confirmed,
+            ],
+            set_=dict(
+                order_count=stats.c.order_count + query.excluded.order_count,
+                quantity=stats.c.quantity + query.excluded.quantity,
+            ),
+        )
+        await self.session.execute(query)
+
+
+def _row_key(key: Tuple[date, UUID, UUID, ConfirmedStatus]) -> tuple:
+    day, market_id, goods_id, confirmed = key
+    # enum members aren't ordered
+    return day, market_id, goods_id, confirmed.value
+
+
+_order_count = func.sum(stats.c.order_count)
+
+# prebuilt, see goods reader
+report_statement = (
+    select(
+        market_table.c.id.label("market_id"),
+        market_table.c.name.label("market_name"),
+        goods_table.c.id.label("goods_id"),
+        goods_table.c.name.label("goods_name"),
+        goods_table.c.sku.label("goods_sku"),
+        stats.c.confirmed,
+        _order_count.label("order_count"),
+        # sum of bigint is numeric
+        cast(func.sum(stats.c.quantity), BIGINT).label("quantity"),
+    )
+    .join_from(stats, market_table, stats.c.market_id == market_table.c.id)
+    .join(goods_table, stats.c.goods_id == goods_table.c.id)
+    .where(stats.c.day.between(bindparam("start"), bindparam("end")))
+    .group_by(market_table.c.id, goods_table.c.id, stats.c.confirmed)
+    # buckets of confirmed orders are left with zeros
+    .having(_order_count > 0)
+    .order_by(market_table.c.name, goods_table.c.name, stats.c.confirmed)
+)
+
+
+class OrderStatsReader(SQLAlchemyRepo, IOrderStatsReader):
+    async def report(self, start: date, end: date) -> dto.OrderReport:
+        result = await self.session.execute(
+            report_statement, {"start": start, "end": end}
+        )
+
+        return dto.OrderReport.construct(
+            start=start,
+            end=end,
+            rows=trusted_list(dto.OrderStatsRow, result),
+        )
@@ -0,0 +1,341 @@
+from collections import defaultdict
+from datetime import timedelta
+from typing import Any, AsyncIterator, Dict, List, NamedTuple, Optional
+from uuid import UUID
+
+from sqlalchemy import (
+    BIGINT,
+    INT,
+    TEXT,
+    Interval,
+    bindparam,
+    column,
+    desc,
+    func,
+    or_,
+    select,
+    true,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.sql import ColumnElement, Select, Update
+
+from app.domain.base.events.event import Event
+from app.domain.order import dto
+from app.domain.order.interfaces.persistence import (
+    IOrderSummaryReader,
+    IOrderSummaryRepo,
+)
+from app.domain.order.models.order import OrderConfirmStatusChanged, OrderCreated
+from app.domain.order.value_objects.confirmed_status import ConfirmedStatus
+from app.infrastructure.database.models.order_summary import order_summary_table
+from app.infrastructure.database.repositories.order import EXPORT_CHUNK_SIZE
+from app.infrastructure.database.repositories.repo import SQLAlchemyRepo
+from app.infrastructure.database.trusted_dto import trusted_list
+
+summary = order_summary_table
+
+
+def render_lines_summary(order_lines: List[dto.OrderLine]) -> str:
+    return "\n".join(
+        " ".join(filter(None, (line.goods.name, line.goods.sku)))
+        + f" x {line.quantity}"
+        for line in order_lines
+    )
+
+
+def summary_row(order: dto.Order) -> Dict[str, Any]:
+    return dict(
+        order_id=order.id,
+        created_at=order.created_at,
+        creator_id=order.creator.id,
+        creator_name=order.creator.name,
+        recipient_market_id=order.recipient_market.id,
+        recipient_market_name=order.recipient_market.name,
+        commentary=order.commentary,
+        confirmed=order.confirmed,
+        line_count=len(order.order_lines),
+        lines_summary=render_lines_summary(order.order_lines),
+        lines=[
+            dict(
+                goods_name=line.goods.name,
+                goods_sku=line.goods.sku,
+                quantity=line.quantity,
+            )
+            for line in order.order_lines
+        ],
+    )
+
+
+summary_columns = (
+    summary.c.order_id.label("id"),
+    summary.c.created_at,
+    summary.c.creator_id,
+    summary.c.creator_name,
+    summary.c.recipient_market_id,
+    summary.c.recipient_market_name,
+    summary.c.commentary,
+    summary.c.confirmed,
+    summary.c.line_count,
+    summary.c.lines_summary,
+)
+
+# lines are expanded from jsonb, so export doesn't join order tables
+summary_line = (
+    func.jsonb_to_recordset(summary.c.lines)
+    .table_valued(
+        column("goods_name", TEXT),
+        column("goods_sku", TEXT),
+        column("quantity", BIGINT),
+    )
+    .render_derived(name="line", with_types=True)
+)
+
+
+class PageStatements(NamedTuple):
+    page: Select
+    page_after: Select  # page after cursor
+    count: Select
+
+
+def _page_statements(*where: ColumnElement) -> PageStatements:
+    count = select(func.count()).select_from(summary).where(*where)
+    # total is selected along with the page to save a round trip
+    page = (
+        select(*summary_columns, count.scalar_subquery().label("total"))
+        .where(*where)
+        .order_by(desc(summary.c.created_at), desc(summary.c.order_id))
+        # LIMIT NULL is no limit
+        .limit(bindparam("limit", type_=INT))
+    )
+    page_after = page.where(
+        tuple_(summary.c.created_at, summary.c.order_id)
+        < tuple_(
+            bindparam("after_created_at", type_=summary.c.created_at.type),
+            bindparam("after_id", type_=summary.c.order_id.type),
+        )
+    )
+    return PageStatements(page, page_after, count)
+
+
+_not_processed = summary.c.confirmed == ConfirmedStatus.NOT_PROCESSED
+
+# prebuilt statements, see goods reader
+user_orders = _page_statements(summary.c.creator_id == bindparam("user_id"))
+orders_for_confirmation = _page_statements(_not_processed)
+all_orders = _page_statements()
+
+_not_claimed = or_(
+    summary.c.claimed_until.is_(None), summary.c.claimed_until < func.now()
+)
+
+# orders leased to other confirmers aren't in the queue
+queue_count_statement = (
+    select(func.count()).select_from(summary).where(_not_processed, _not_claimed)
+)
+
+release_claims_statement = (
+    update(summary)
+    .where(summary.c.claimed_by == bindparam("user_id"), _not_processed)
+    .values(claimed_by=None, claimed_until=None)
+)
+
+
+def _claim_statement(*where: ColumnElement) -> Update:
+    # orders locked by concurrent claims are skipped instead of waited for
+    claimed_id = (
+        select(summary.c.order_id)
+        .where(_not_processed, _not_claimed, *where)
+        .order_by(summary.c.created_at, summary.c.order_id)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    return (
+        update(summary)
+        .where(summary.c.order_id == claimed_id)
+        .values(
+            claimed_by=bindparam("user_id", type_=BIGINT),
+            claimed_until=func.now() + bindparam("lease", type_=Interval),
+        )
+        # subquery sees rows before update, so claimed order is counted
+        .returning(
+            *summary_columns, queue_count_statement.scalar_subquery().label("total")
+        )
+    )
+
+
+# queue is oldest first, so cursor is compared other way than for pages
+claim_statement = _claim_statement()
+claim_after_statement = _claim_statement(
+    tuple_(summary.c.created_at, summary.c.order_id)
+    > tuple_(
+        bindparam("after_created_at", type_=summary.c.created_at.type),
+        bindparam("after_id", type_=summary.c.order_id.type),
+    )
+)
+
+
+class OrderSummaryRepo(SQLAlchemyRepo, IOrderSummaryRepo):
+    async def apply(self, events: List[Event]) -> None:
+        # status changes are applied after creations, one update per status
+        confirmed: Dict[ConfirmedStatus, List[UUID]] = defaultdict(list)
+        for event in events:
+            if isinstance(event, OrderCreated):
+                await self._save(event.order)
+            elif isinstance(event, OrderConfirmStatusChanged):
+                confirmed[event.order.confirmed].append(event.order.id)
+
+        for status, order_ids in confirmed.items():
+            await self._set_confirmed(order_ids, status)
+
+    async def _save(self, order: dto.Order) -> None:
+        row = summary_row(order)
+        query = insert(summary).values(row)
+        query = query.on_conflict_do_update(
+            index_elements=[summary.c.order_id],
+            set_={key: value for key, value in row.items() if key != "order_id"},
+        )
+        await self.session.execute(query)
+
+    async def _set_confirmed(
+        self, order_ids: List[UUID], confirmed: ConfirmedStatus
+    ) -> None:
+        await self.session.execute(
+            update(summary)
+            .where(summary.c.order_id.in_(order_ids))
+            .values(confirmed=confirmed)
+        )
+
+    async def claim_order_for_confirmation(
+        self,
+        user_id: int,
+        lease: timedelta,
+        after: Optional[dto.OrderCursor] = None,
+    ) -> dto.OrderSummariesPage:
+        # confirmer holds one order at most, previous one is returned to queue
+        await self.session.execute(release_claims_statement, {"user_id": user_id})
+
+        if after is None:
+            query = claim_statement
+            params = {"user_id": user_id, "lease": lease}
+        else:
+            query = claim_after_statement
+            params = {
+                "user_id": user_id,
+                "lease": lease,
+                "after_created_at": after.created_at,
+                "after_id": after.id,
+            }
+        rows = (await self.session.execute(query, params)).fetchall()
+
+        if rows:
+            total_count = rows[0].total
+        else:
+            result = await self.session.execute(queue_count_statement)
+            total_count = result.scalar_one()
+
+        return dto.OrderSummariesPage.construct(
+            orders=trusted_list(dto.OrderSummary, rows), total=total_count
+        )
+
+
+class OrderSummaryReader(SQLAlchemyRepo, IOrderSummaryReader):
+    async def _get_page(
+        self,
+        statements: PageStatements,
+        params: Dict[str, Any],
+        limit: Optional[int],
+        after: Optional[dto.OrderCursor],
+    ) -> dto.OrderSummariesPage:
+        if after is None:
+            query = statements.page
+            page_params = {**params, "limit": limit}
+        else:
+            query = statements.page_after
+            page_params = {
+                **params,
+                "limit": limit,
+                "after_created_at": after.created_at,
+                "after_id": after.id,
+            }
+
+        result = await self.session.execute(query, page_params)
+        rows = result.fetchall()
+
+        if rows:
+            total_count = rows[0].total
+        elif after is None:
+            total_count = 0
+        else:
+            # no rows after cursor, so total wasn't selected
+            total_count = await self._count(statements, params)
+
+        return dto.OrderSummariesPage.construct(
+            orders=trusted_list(dto.OrderSummary, rows), total=total_count
+        )
+
+    async def _count(self, statements: PageStatements, params: Dict[str, Any]) -> int:
+        result = await self.session.execute(statements.count, params)
+        return result.scalar_one()
+
+    async def get_user_orders(
+        self,
+        user_id: int,
+        limit: Optional[int],
+        after: Optional[dto.OrderCursor] = None,
+    ) -> dto.OrderSummariesPage:
+        return await self._get_page(user_orders, {"user_id": user_id}, limit, after)
+
+    async def get_user_orders_count(self, user_id: int) -> int:
+        return await self._count(user_orders, {"user_id": user_id})
+
+    async def get_orders_for_confirmation(
+        self, limit: Optional[int], after: Optional[dto.OrderCursor] = None
+    ) -> dto.OrderSummariesPage:
+        return await self._get_page(orders_for_confirmation, {}, limit, after)
+
+    async def get_orders_for_confirmation_count(self) -> int:
+        return await self._count(orders_for_confirmation, {})
+
+    async def get_all_orders(
+        self, limit: Optional[int], after: Optional[dto.OrderCursor] = None
+    ) -> dto.OrderSummariesPage:
+        return await self._get_page(all_orders, {}, limit, after)
+
+    async def get_all_orders_count(self) -> int:
+        return await self._count(all_orders, {})
+
+    async def stream_orders_for_export(
+        self,
+        creator_id: Optional[int] = None,
+        confirmed: Optional[ConfirmedStatus] = None,
+    ) -> AsyncIterator[List[dto.OrderExportRow]]:
+        query = (
+            select(
+                summary.c.order_id,
+                summary.c.creator_id,
+                summary.c.creator_name,
+                summary.c.recipient_market_id,
+                summary.c.recipient_market_name,
+                summary_line.c.goods_name,
+                summary_line.c.goods_sku,
+                summary_line.c.quantity,
+                summary.c.commentary,
+                summary.c.created_at,
+                summary.c.confirmed,
+            )
+            .select_from(summary.join(summary_line, true()))
+            .order_by(desc(summary.c.created_at), desc(summary.c.order_id))
+            .execution_options(yield_per=EXPORT_CHUNK_SIZE)
+        )
+        if creator_id is not None:
+            query = query.where(summary.c.creator_id == creator_id)
+        if confirmed is not None:
+            query = query.where(summary.c.confirmed == confirmed)
+
+        # server side cursor, only one chunk of rows is kept in memory
+        result = await self.session.stream(query)
+        async for rows in result.mappings().partitions():
+            yield [dto.OrderExportRow.construct(**row) for row in rows]
@@ -0,0 +1,87 @@
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import List
+
+from sqlalchemy import delete, func, insert, or_, select, update
+
+from app.domain.base.events.event import Event
+from app.domain.base.interfaces.outbox import IOutbox
+from app.infrastructure.database.models.outbox import outbox_table
+from app.infrastructure.database.repositories.repo import SQLAlchemyRepo
+from app.infrastructure.outbox.serializer import dump_event
+
+
+@dataclass(frozen=True)
+class OutboxMessage:
+    id: int
+    event_type: str
+    payload: dict
+    attempts: int
+
+
+class OutboxRepo(SQLAlchemyRepo, IOutbox):
+    async def add(self, events: List[Event]) -> None:
+        if not events:
+            return
+
+        rows = []
+        for event in events:
+            event_type, payload = dump_event(event)
+            rows.append({"event_type": event_type, "payload": payload})
+        await self.session.execute(insert(outbox_table), rows)
+
+    async def claim_batch(
+        self, limit: int, max_attempts: int, lease: timedelta
+    ) -> List[OutboxMessage]:
+        """
+        Mark oldest messages as claimed till `lease` ends
+
+        Claim is kept after commit, so messages are sent outside of transaction.
+        Messages locked by concurrent claims are skipped, so workers don't wait
+        for each other and don't send one message twice.
+        """
+        claimed_ids = (
+            select(outbox_table.c.id)
+            .where(
+                outbox_table.c.attempts < max_attempts,
+                or_(
+                    outbox_table.c.locked_until.is_(None),
+                    outbox_table.c.locked_until < func.now(),
+                ),
+            )
+            .order_by(outbox_table.c.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        query = (
+            update(outbox_table)
+            .where(outbox_table.c.id.in_(claimed_ids))
+            .values(locked_until=func.now() + lease)
+            .returning(
+                outbox_table.c.id,
+                outbox_table.c.event_type,
+                outbox_table.c.payload,
+                outbox_table.c.attempts,
+            )
+        )
+        result = await self.session.execute(query)
+        messages = [OutboxMessage(**row) for row in result.mappings()]
+        # RETURNING doesn't keep order of subquery
+        return sorted(messages, key=lambda message: message.id)
+
+    async def delete(self, message_ids: List[int]) -> None:
+        if message_ids:
+            await self.session.execute(
+                delete(outbox_table).where(outbox_table.c.id.in_(message_ids))
+            )
+
+    async def mark_failed(self, message_id: int, error: str) -> None:
+        await self.session.execute(
+            update(outbox_table).where(outbox_table.c.id == message_id)
+            # failed message is retried by next batch, not after lease
+            .values(
+                attempts=outbox_table.c.attempts + 1,
+                last_error=error,
+                locked_until=None,
+            )
+        )
@@ -1,8 +1,7 @@
 import logging
 from typing import List
 
-from pydantic import parse_obj_as
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.exc import IntegrityError
 
 from app.domain.access_levels.exceptions.access_levels import AccessLevelNotExist
@@ -15,7 +14,9 @@ from app.domain.user.exceptions.user import (
 )
 from app.domain.user.interfaces.persistence import IUserReader, IUserRepo
 from app.domain.user.models.user import TelegramUser
+from app.infrastructure.database.models.user import user_version_table
 from app.infrastructure.database.repositories.repo import SQLAlchemyRepo
+from app.infrastructure.database.trusted_dto import trusted_from_orm, trusted_list
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +28,7 @@ class UserReader(SQLAlchemyRepo, IUserReader):
         result = await self.session.execute(query)
         users = result.scalars().all()
 
-        return parse_obj_as(List[dto.User], users)
+        return trusted_list(dto.User, users)
 
     async def users_for_confirmation(self) -> List[dto.User]:
         query = select(TelegramUser).where(
@@ -37,7 +38,7 @@ class UserReader(SQLAlchemyRepo, IUserReader):
         result = await self.session.execute(query)
         users = result.scalars().all()
 
-        return parse_obj_as(List[dto.User], users)
+        return trusted_list(dto.User, users)
 
     async def user_by_id(self, user_id: int) -> dto.User:
         user = await self.session.get(TelegramUser, user_id)
@@ -45,7 +46,13 @@ class UserReader(SQLAlchemyRepo, IUserReader):
         if not user:
             raise UserNotExists(f"User with id {user_id} not exists in database")
 
-        return dto.User.from_orm(user)
+        return trusted_from_orm(dto.User, user)
+
+
+# row lock serializes changes of users, they are rare
+bump_version_statement = update(user_version_table).values(
+    version=user_version_table.c.version + 1
+)
 
 
 class UserRepo(SQLAlchemyRepo, IUserRepo):
@@ -79,6 +86,7 @@ class UserRepo(SQLAlchemyRepo, IUserRepo):
             await self._populate_access_levels(user)
             self.session.add(user)
             await self.session.flush()
+            await self.session.execute(bump_version_statement)
         except IntegrityError as err:
             raise UserAlreadyExists(
                 f"User with id {id} already exists in database"
@@ -94,6 +102,7 @@ class UserRepo(SQLAlchemyRepo, IUserRepo):
             user = await self._user(user_id)
             await self.session.delete(user)
             await self.session.flush()
+            await self.session.execute(bump_version_statement)
         except IntegrityError as err:
             raise CantDeleteWithOrders(
                 f"User with id {user_id} has orders, can't delete"
@@ -104,6 +113,7 @@ class UserRepo(SQLAlchemyRepo, IUserRepo):
         try:
             await self._populate_access_levels(user)
             await self.session.flush()
+            await self.session.execute(bump_version_statement)
         except IntegrityError as err:
             raise UserAlreadyExists(
                 f"User with id {user_id} already exists in database"
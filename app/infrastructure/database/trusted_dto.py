@@ -0,0 +1,80 @@
+"""
+Construction of DTOs from ORM objects and rows without validation
+
+Readers get values from our own database, they already have types declared
+in DTOs, so pydantic validation only costs time. Nested DTOs and lists or
+tuples of them are converted recursively, other values are taken as is.
+Values must match DTO field types exactly: e.g. enum members, not strings.
+"""
+from functools import lru_cache
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+from pydantic.fields import (
+    SHAPE_LIST,
+    SHAPE_SINGLETON,
+    SHAPE_TUPLE_ELLIPSIS,
+    ModelField,
+)
+
+T = TypeVar("T", bound=BaseModel)
+
+Converter = Optional[Callable[[Any], Any]]
+
+_object_setattr = object.__setattr__
+
+
+def trusted_from_orm(dto_type: Type[T], obj: Any) -> T:
+    """Same DTO as `dto_type.from_orm(obj)` gives for valid obj"""
+    values = {}
+    for name, converter in _field_converters(dto_type):
+        value = getattr(obj, name)
+        values[name] = value if converter is None else converter(value)
+
+    # the same as BaseModel.construct does, without defaults of missing fields
+    dto = dto_type.__new__(dto_type)
+    _object_setattr(dto, "__dict__", values)
+    _object_setattr(dto, "__fields_set__", set(values))
+    return dto
+
+
+def trusted_list(dto_type: Type[T], objs: Iterable[Any]) -> List[T]:
+    """Same list as `parse_obj_as(List[dto_type], objs)` gives for valid objs"""
+    return [trusted_from_orm(dto_type, obj) for obj in objs]
+
+
+@lru_cache(maxsize=None)
+def _field_converters(dto_type: Type[BaseModel]) -> Tuple[Tuple[str, Converter], ...]:
+    converters = []
+    for name, field in dto_type.__fields__.items():
+        nested = field.type_
+        if not _has_nested_dto(field):
+            converters.append((name, None))
+        elif _is_dto(nested) and field.shape == SHAPE_SINGLETON:
+            converters.append((name, _nested_converter(nested)))
+        elif _is_dto(nested) and field.shape == SHAPE_LIST:
+            converters.append((name, lambda v, t=nested: trusted_list(t, v)))
+        elif _is_dto(nested) and field.shape == SHAPE_TUPLE_ELLIPSIS:
+            converters.append((name, lambda v, t=nested: tuple(trusted_list(t, v))))
+        else:
+            raise TypeError(
+                f"{dto_type.__name__}.{name} can't be built without validation"
+            )
+    return tuple(converters)
+
+
+def _is_dto(type_: Any) -> bool:
+    return isinstance(type_, type) and issubclass(type_, BaseModel)
+
+
+def _has_nested_dto(field: ModelField) -> bool:
+    return _is_dto(field.type_) or any(
+        _has_nested_dto(sub_field) for sub_field in field.sub_fields or ()
+    )
+
+
+def _nested_converter(dto_type: Type[BaseModel]) -> Callable[[Any], Any]:
+    def convert(value: Any) -> Any:
+        return None if value is None else trusted_from_orm(dto_type, value)
+
+    return convert
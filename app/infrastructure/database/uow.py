@@ -1,49 +1,95 @@
-from typing import Type
+from functools import cached_property
+from typing import Any, Callable, Dict, Optional, Tuple, Type
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.access_levels.interfaces.persistence import IAccessLevelReader
 from app.domain.access_levels.interfaces.uow import IAccessLevelUoW
+from app.domain.base.interfaces.outbox import IOutbox
 from app.domain.base.interfaces.uow import IUoW
 from app.domain.goods.interfaces.persistence import IGoodsReader, IGoodsRepo
 from app.domain.goods.interfaces.uow import IGoodsUoW
 from app.domain.market.interfaces.persistence import IMarketReader, IMarketRepo
 from app.domain.market.interfaces.uow import IMarketUoW
-from app.domain.order.interfaces.persistence import IOrderReader, IOrderRepo
+from app.domain.order.interfaces.persistence import (
+    IOrderReader,
+    IOrderRepo,
+    IOrderStatsReader,
+    IOrderStatsRepo,
+    IOrderSummaryReader,
+    IOrderSummaryRepo,
+)
 from app.domain.order.interfaces.uow import IOrderUoW
 from app.domain.user.interfaces.persistence import IUserReader, IUserRepo
 from app.domain.user.interfaces.uow import IUserUoW
+from app.infrastructure.cache import IdentityMap, MemoizedReader
 from app.infrastructure.database.exception_mapper import exception_mapper
 
 
 class SQLAlchemyBaseUoW(IUoW):
-    def __init__(self, session: AsyncSession):
-        self._session = session
+    """
+    Session is created on first use, so updates which don't touch database
+    don't create it (connection from pool is taken by session on first query)
+
+    Readers use replica session if replica session factory is given, till
+    primary session is opened by repositories. After that reads go to primary
+    too, so rest of update sees its own writes despite replication lag.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        replica_session_factory: Optional[Callable[[], AsyncSession]] = None,
+    ):
+        self._session_factory = session_factory
+        self._session: Optional[AsyncSession] = None
+        self._replica_session_factory = replica_session_factory
+        self._replica_session: Optional[AsyncSession] = None
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self._session_factory()
+        return self._session
+
+    @property
+    def read_session(self) -> AsyncSession:
+        if self._replica_session_factory is None or self._session is not None:
+            return self.session
+        if self._replica_session is None:
+            self._replica_session = self._replica_session_factory()
+        return self._replica_session
 
     @exception_mapper
     async def commit(self) -> None:
-        await self._session.commit()
+        if self._session is not None:
+            await self._session.commit()
 
     async def rollback(self) -> None:
-        await self._session.rollback()
+        if self._session is not None:
+            await self._session.rollback()
+
+    async def close(self) -> None:
+        if self._replica_session is not None:
+            await self._replica_session.close()
+        if self._session is not None:
+            await self._session.close()
 
 
 class SQLAlchemyUoW(
     SQLAlchemyBaseUoW, IUserUoW, IAccessLevelUoW, IGoodsUoW, IMarketUoW, IOrderUoW
 ):
-    user: IUserRepo
-    user_reader: IUserReader
-    access_level_reader: IAccessLevelReader
-    goods: IGoodsRepo
-    goods_reader: IGoodsReader
-    market: IMarketRepo
-    market_reader: IMarketReader
-    order: IOrderRepo
-    order_reader: IOrderReader
+    """
+    Repositories are created on first access
+
+    Reads of readers by id go through identity map if it is given, it is
+    cleared on commit and rollback, so reads after them see new data. It is
+    cleared when readers move from replica to primary as well.
+    """
 
     def __init__(
         self,
-        session: AsyncSession,
+        session_factory: Callable[[], AsyncSession],
         user_repo: Type[IUserRepo],
         user_reader: Type[IUserReader],
         access_level_reader: Type[IAccessLevelReader],
@@ -53,14 +99,121 @@ class SQLAlchemyUoW(
         market_reader: Type[IMarketReader],
         order_repo: Type[IOrderRepo],
         order_reader: Type[IOrderReader],
+        order_summary_repo: Type[IOrderSummaryRepo],
+        order_summary_reader: Type[IOrderSummaryReader],
+        order_stats_repo: Type[IOrderStatsRepo],
+        order_stats_reader: Type[IOrderStatsReader],
+        outbox_repo: Type[IOutbox],
+        identity_map: Optional[IdentityMap] = None,
+        replica_session_factory: Optional[Callable[[], AsyncSession]] = None,
     ):
-        self.user = user_repo(session)
-        self.user_reader = user_reader(session)
-        self.access_level_reader = access_level_reader(session)
-        self.goods = goods_repo(session)
-        self.goods_reader = goods_reader(session)
-        self.market = market_repo(session)
-        self.market_reader = market_reader(session)
-        self.order = order_repo(session)
-        self.order_reader = order_reader(session)
-        super().__init__(session)
+        self._user_repo = user_repo
+        self._user_reader = user_reader
+        self._access_level_reader = access_level_reader
+        self._goods_repo = goods_repo
+        self._goods_reader = goods_reader
+        self._market_repo = market_repo
+        self._market_reader = market_reader
+        self._order_repo = order_repo
+        self._order_reader = order_reader
+        self._order_summary_repo = order_summary_repo
+        self._order_summary_reader = order_summary_reader
+        self._order_stats_repo = order_stats_repo
+        self._order_stats_reader = order_stats_reader
+        self._outbox_repo = outbox_repo
+        self._identity_map = identity_map
+        self._readers: Dict[str, Tuple[AsyncSession, Any]] = {}
+        super().__init__(session_factory, replica_session_factory)
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None and self._replica_session is not None:
+            # entities read from replica can be older than primary
+            self._clear_identity_map()
+        return super().session
+
+    async def commit(self) -> None:
+        try:
+            await super().commit()
+        finally:
+            self._clear_identity_map()
+
+    async def rollback(self) -> None:
+        try:
+            await super().rollback()
+        finally:
+            self._clear_identity_map()
+
+    def _clear_identity_map(self) -> None:
+        if self._identity_map is not None:
+            self._identity_map.clear()
+
+    def _memoized(self, reader, *methods: str):
+        if self._identity_map is None:
+            return reader
+        return MemoizedReader(reader, self._identity_map, methods)
+
+    def _reader(self, name: str, reader_type: Callable[[AsyncSession], Any], *methods):
+        """Reader on current read session, it is created again if session changes"""
+        session = self.read_session
+        cached = self._readers.get(name)
+        if cached is None or cached[0] is not session:
+            cached = (session, self._memoized(reader_type(session), *methods))
+            self._readers[name] = cached
+        return cached[1]
+
+    @cached_property
+    def user(self) -> IUserRepo:
+        return self._user_repo(self.session)
+
+    @property
+    def user_reader(self) -> IUserReader:
+        return self._reader("user_reader", self._user_reader, "user_by_id")
+
+    @property
+    def access_level_reader(self) -> IAccessLevelReader:
+        return self._reader("access_level_reader", self._access_level_reader)
+
+    @cached_property
+    def goods(self) -> IGoodsRepo:
+        return self._goods_repo(self.session)
+
+    @property
+    def goods_reader(self) -> IGoodsReader:
+        return self._reader("goods_reader", self._goods_reader)
+
+    @cached_property
+    def market(self) -> IMarketRepo:
+        return self._market_repo(self.session)
+
+    @property
+    def market_reader(self) -> IMarketReader:
+        return self._reader("market_reader", self._market_reader, "market_by_id")
+
+    @cached_property
+    def order(self) -> IOrderRepo:
+        return self._order_repo(self.session)
+
+    @property
+    def order_reader(self) -> IOrderReader:
+        return self._reader("order_reader", self._order_reader, "order_by_id")
+
+    @cached_property
+    def order_summary(self) -> IOrderSummaryRepo:
+        return self._order_summary_repo(self.session)
+
+    @property
+    def order_summary_reader(self) -> IOrderSummaryReader:
+        return self._reader("order_summary_reader", self._order_summary_reader)
+
+    @cached_property
+    def order_stats(self) -> IOrderStatsRepo:
+        return self._order_stats_repo(self.session)
+
+    @property
+    def order_stats_reader(self) -> IOrderStatsReader:
+        return self._reader("order_stats_reader", self._order_stats_reader)
+
+    @cached_property
+    def outbox(self) -> IOutbox:
+        return self._outbox_repo(self.session)
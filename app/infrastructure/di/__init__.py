@@ -0,0 +1,8 @@
+from .container import Container, DependencyNotRegistered, Scope, ScopedContainer
+
+__all__ = [
+    "Container",
+    "DependencyNotRegistered",
+    "Scope",
+    "ScopedContainer",
+]
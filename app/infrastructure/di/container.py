@@ -0,0 +1,80 @@
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, Type, TypeVar
+
+T = TypeVar("T")
+
+Factory = Callable[["ScopedContainer"], Any]
+
+
+class Scope(Enum):
+    APP = "app"  # created once and shared by all updates and events
+    REQUEST = "request"  # created once for update or event
+
+
+class DependencyNotRegistered(Exception):
+    pass
+
+
+class Container:
+    """
+    Registry of dependency factories
+
+    Dependencies are created lazily on first `get` from a scope, so update
+    pays only for what its handler actually uses.
+    """
+
+    def __init__(self) -> None:
+        self._factories: Dict[type, Factory] = {}
+        self._scopes: Dict[type, Scope] = {}
+        self._app_instances: Dict[type, Any] = {}
+
+    def register(
+        self, key: Type[T], factory: Callable[["ScopedContainer"], T], scope: Scope
+    ) -> None:
+        self._factories[key] = factory
+        self._scopes[key] = scope
+
+    def scope(
+        self,
+        data: Dict[str, Any],
+        overrides: Optional[Dict[type, type]] = None,
+    ) -> "ScopedContainer":
+        """
+        Args:
+            data: handler data (uow, user, event_dispatcher, ...) for factories
+            overrides: resolve other registered key instead of the key,
+                e.g. allowed access policy instead of user based one
+        """
+        return ScopedContainer(self, data, overrides or {})
+
+    def _resolve(self, key: type, scope: "ScopedContainer") -> Any:
+        try:
+            factory = self._factories[key]
+        except KeyError:
+            raise DependencyNotRegistered(f"{key} is not registered") from None
+
+        if self._scopes[key] is Scope.APP:
+            if key not in self._app_instances:
+                self._app_instances[key] = factory(scope)
+            return self._app_instances[key]
+
+        return factory(scope)
+
+
+class ScopedContainer:
+    def __init__(
+        self,
+        container: Container,
+        data: Dict[str, Any],
+        overrides: Dict[type, type],
+    ) -> None:
+        self.data = data
+        self._container = container
+        self._overrides = overrides
+        self._instances: Dict[type, Any] = {}
+
+    def get(self, key: Type[T]) -> T:
+        key = self._overrides.get(key, key)
+        if key not in self._instances:
+            self._instances[key] = self._container._resolve(key, self)
+        return self._instances[key]
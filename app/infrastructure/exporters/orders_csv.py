@@ -1,53 +1,112 @@
+import asyncio
 import csv
+import gzip
 import io
+import zipfile
+from contextlib import contextmanager
+from enum import Enum
+from pathlib import Path
+from typing import AsyncIterable, Iterator, TextIO
 
-from app.domain.order.dto.order import Order
-
-
-# function that get list of orders and save them to csv file in memory as bytes
-def export_orders_to_csv(orders: list[Order]) -> bytes:
-    # create csv writer
-    output = io.StringIO()
-    csv_writer = csv.writer(
-        output,
-        delimiter="\t",
-        quotechar='"',
-        quoting=csv.QUOTE_ALL,
-        lineterminator="\r\n",
-    )
-    # write header
-    csv_writer.writerow(
-        [
-            "id",
-            "creator_id",
-            "creator_name",
-            "recipient_market_id",
-            "recipient_market_name",
-            "goods_name",
-            "goods_sku",
-            "quantity",
-            "commentary",
-            "created_at",
-            "confirmed",
-        ]
-    )
-    # write orders
-    for order in orders:
-        for line in order.order_lines:
-            csv_writer.writerow(
-                [
-                    order.id,
-                    order.creator.id,
-                    order.creator.name,
-                    order.recipient_market.id,
-                    order.recipient_market.name,
-                    line.goods.name,
-                    line.goods.sku,
-                    line.quantity,
-                    order.commentary,
-                    order.created_at,
-                    order.confirmed,
-                ]
-            )
-    # return bytes
-    return output.getvalue().encode("utf-16")
+from app.domain.order.dto.order import OrderExportRow
+
+HEADER = [
+    "id",
+    "creator_id",
+    "creator_name",
+    "recipient_market_id",
+    "recipient_market_name",
+    "goods_name",
+    "goods_sku",
+    "quantity",
+    "commentary",
+    "created_at",
+    "confirmed",
+]
+
+
+class Compression(Enum):
+    NONE = "none"
+    GZIP = "gzip"
+    ZIP = "zip"
+
+    @property
+    def suffix(self) -> str:
+        return {
+            Compression.NONE: "",
+            Compression.GZIP: ".gz",
+            Compression.ZIP: ".zip",
+        }[self]
+
+
+@contextmanager
+def open_csv_file(
+    path: Path, csv_name: str, encoding: str, compression: Compression
+) -> Iterator[TextIO]:
+    if compression is Compression.GZIP:
+        with gzip.open(path, "wt", encoding=encoding, newline="") as file:
+            yield file
+    elif compression is Compression.ZIP:
+        with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            with archive.open(csv_name, "w", force_zip64=True) as binary_file:
+                with io.TextIOWrapper(
+                    binary_file, encoding=encoding, newline=""
+                ) as file:
+                    yield file
+    else:
+        with open(path, "w", encoding=encoding, newline="") as file:
+            yield file
+
+
+def to_csv_row(row: OrderExportRow) -> list:
+    return [
+        row.order_id,
+        row.creator_id,
+        row.creator_name,
+        row.recipient_market_id,
+        row.recipient_market_name,
+        row.goods_name,
+        row.goods_sku,
+        row.quantity,
+        row.commentary,
+        row.created_at,
+        row.confirmed,
+    ]
+
+
+async def export_orders_to_csv(
+    chunks: AsyncIterable[list[OrderExportRow]],
+    directory: Path,
+    name: str,
+    encoding: str = "utf-16",
+    compression: Compression = Compression.NONE,
+) -> Path:
+    """
+    Write orders to csv file chunk by chunk, so only one chunk is kept in memory
+
+    Args:
+        chunks: chunks of order rows, e.g. from server side cursor
+        directory: directory for result file
+        name: csv file name without extension
+        encoding: utf-16 or utf-8-sig, both are recognized by spreadsheet apps
+        compression: compress result file with gzip or zip
+
+    Returns: path to result file
+    """
+    csv_name = f"{name}.csv"
+    path = directory / f"{csv_name}{compression.suffix}"
+
+    with open_csv_file(path, csv_name, encoding, compression) as file:
+        csv_writer = csv.writer(
+            file,
+            delimiter="\t",
+            quotechar='"',
+            quoting=csv.QUOTE_ALL,
+            lineterminator="\r\n",
+        )
+        csv_writer.writerow(HEADER)
+        async for chunk in chunks:
+            # encoding and compression are cpu bound, don't block event loop
+            await asyncio.to_thread(csv_writer.writerows, map(to_csv_row, chunk))
+
+    return path
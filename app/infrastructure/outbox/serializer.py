@@ -0,0 +1,47 @@
+import json
+from typing import Any, Dict, Iterable, Tuple, Type, get_type_hints
+
+from pydantic import parse_obj_as
+from pydantic.json import pydantic_encoder
+
+from app.domain.base.events.event import Event
+
+
+class UnknownEventType(Exception):
+    pass
+
+
+def dump_event(event: Event) -> Tuple[str, Dict[str, Any]]:
+    """
+    Event type name and json compatible payload
+
+    Event attributes are arguments of its __init__, they are DTOs or
+    other values pydantic can serialize.
+    """
+    payload = json.loads(json.dumps(vars(event), default=pydantic_encoder))
+    return type(event).__name__, payload
+
+
+class EventLoader:
+    """Restore events dumped by `dump_event` with types of __init__ arguments"""
+
+    def __init__(self, event_types: Iterable[Type[Event]]) -> None:
+        self._event_types = {
+            event_type.__name__: event_type for event_type in event_types
+        }
+
+    def load(self, event_type: str, payload: Dict[str, Any]) -> Event:
+        try:
+            cls = self._event_types[event_type]
+        except KeyError:
+            raise UnknownEventType(
+                f"Event type {event_type} is not registered"
+            ) from None
+
+        hints = get_type_hints(cls.__init__)
+        return cls(
+            **{
+                name: parse_obj_as(hints[name], value)
+                for name, value in payload.items()
+            }
+        )
@@ -0,0 +1,99 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from typing import AsyncIterator, Callable, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.base.events.dispatcher import EventDispatcher
+from app.infrastructure.database.repositories.outbox import OutboxMessage, OutboxRepo
+from app.infrastructure.outbox.serializer import EventLoader
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxWorker:
+    """
+    Send notifications saved in outbox to notification handlers
+
+    Batch is claimed for `lease` seconds in a short transaction, then its
+    messages are sent concurrently outside of any transaction. Every message
+    is deleted in its own transaction right after its handlers succeed, so it
+    is sent at least once: crash of worker returns only unfinished messages
+    to outbox when lease ends. Failed message is retried till `max_attempts`,
+    then it is kept in the table with last error for investigation.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        event_dispatcher: EventDispatcher,
+        batch_size: int,
+        poll_interval: float,
+        max_attempts: int,
+        lease: float,
+    ) -> None:
+        self._session_factory = session_factory
+        self._event_dispatcher = event_dispatcher
+        self._loader = EventLoader(event_dispatcher.notifications.handlers)
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.lease = timedelta(seconds=lease)
+
+    @asynccontextmanager
+    async def _outbox(self) -> AsyncIterator[OutboxRepo]:
+        session = self._session_factory()
+        try:
+            yield OutboxRepo(session)
+            await session.commit()
+        finally:
+            await session.close()
+
+    async def process_batch(self) -> int:
+        """Send one batch of messages, return number of claimed messages"""
+        async with self._outbox() as outbox:
+            messages = await outbox.claim_batch(
+                self.batch_size, self.max_attempts, self.lease
+            )
+
+        # telegram requests of handlers are bounded by shared FanOut
+        # tasks are started in order of messages, as_completed would shuffle them
+        sends = [asyncio.create_task(self._send(message)) for message in messages]
+        for send in asyncio.as_completed(sends):
+            message, error = await send
+            async with self._outbox() as outbox:
+                if error is None:
+                    await outbox.delete([message.id])
+                else:
+                    await outbox.mark_failed(message.id, error)
+        return len(messages)
+
+    async def _send(
+        self, message: OutboxMessage
+    ) -> Tuple[OutboxMessage, Optional[str]]:
+        try:
+            event = self._loader.load(message.event_type, message.payload)
+            await self._event_dispatcher.publish_notifications([event])
+        except Exception as e:
+            logger.exception("Failed to send outbox message %s", message.id)
+            return message, repr(e)
+        return message, None
+
+    async def run(self) -> None:
+        while True:
+            try:
+                claimed = await self.process_batch()
+            except Exception:
+                logger.exception("Outbox worker failed")
+                claimed = 0
+
+            # full batch means there are probably more messages waiting
+            if claimed < self.batch_size:
+                await asyncio.sleep(self.poll_interval)
+
+
+def start_outbox_workers(worker: OutboxWorker, count: int) -> List[asyncio.Task]:
+    """Workers share settings, SKIP LOCKED keeps their claims apart"""
+    return [asyncio.create_task(worker.run()) for _ in range(count)]
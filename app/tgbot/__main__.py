@@ -8,13 +8,19 @@ from aiogram_dialog import DialogRegistry
 
 from app.config import load_config
 from app.domain.base.events.dispatcher import EventDispatcher
+from app.infrastructure.cache import GoodsCatalog, IdentityMapStats, UserCache
 from app.infrastructure.database.db import sa_sessionmaker
 from app.infrastructure.database.models import map_tables
-from app.tgbot.event_handlers.order import setup_event_handlers
+from app.infrastructure.database.pool import PoolMetrics, log_pool_metrics
+from app.infrastructure.database.repositories import CoreOrderReader, OrderReader
+from app.infrastructure.outbox.worker import OutboxWorker, start_outbox_workers
+from app.tgbot.container import build_container
+from app.tgbot.event_handlers import setup_event_handlers
 from app.tgbot.event_handlers.setup_middlewares import setup_event_middlewares
 from app.tgbot.handlers import register_handlers
 from app.tgbot.middlewares import setup_middlewares
 from app.tgbot.services.set_commands import set_commands
+from app.tgbot.webhook import run_webhook
 
 logger = logging.getLogger(__name__)
 
@@ -38,33 +44,109 @@ async def main():
     else:
         storage = MemoryStorage()
 
-    session_factory = sa_sessionmaker(config.db, echo=False)
+    pool_metrics = PoolMetrics()
+    session_factory = sa_sessionmaker(config.db, echo=False, pool_metrics=pool_metrics)
+    if config.db.replica_dsn:
+        replica_session_factory = sa_sessionmaker(config.db, replica=True)
+    else:
+        replica_session_factory = None
+    background_tasks = []
+    if config.db.pool_metrics_interval > 0:
+        background_tasks.append(
+            asyncio.create_task(
+                log_pool_metrics(pool_metrics, config.db.pool_metrics_interval)
+            )
+        )
 
     bot = Bot(token=config.tg_bot.token, parse_mode="HTML")
-    dp = Dispatcher(storage=storage, events_isolation=SimpleEventIsolation())
+    if config.webhook.enabled and config.tg_bot.use_redis:
+        # instances behind load balancer must lock chat across processes
+        events_isolation = storage.create_isolation()
+    else:
+        events_isolation = SimpleEventIsolation()
+    dp = Dispatcher(storage=storage, events_isolation=events_isolation)
 
     dialog_registry = DialogRegistry(dp)
 
+    user_cache = UserCache(
+        session_factory=session_factory,
+        ttl=config.user_cache.ttl,
+        max_size=config.user_cache.max_size,
+        check_interval=config.user_cache.check_interval,
+    )
+
+    goods_catalog = GoodsCatalog(
+        session_factory=session_factory, max_age=config.goods_catalog.max_age
+    )
+
+    identity_map_stats = IdentityMapStats()
+    order_reader = CoreOrderReader if config.db.order_reader == "core" else OrderReader
+
+    container = build_container(config)
+
     setup_middlewares(
         dp=dp,
         sessionmaker=session_factory,
+        user_cache=user_cache,
+        container=container,
+        goods_catalog=goods_catalog,
+        identity_map_stats=identity_map_stats,
+        order_reader=order_reader,
+        replica_sessionmaker=replica_session_factory,
+    )
+    event_dispatcher = EventDispatcher(
+        bot=bot, user_cache=user_cache, goods_catalog=goods_catalog
     )
-    event_dispatcher = EventDispatcher(bot=bot)
     setup_event_handlers(event_dispatcher=event_dispatcher)
+    # notifications are handled right after commit, a lagging replica
+    # may not have their data yet, so they read primary
     setup_event_middlewares(
         dp=event_dispatcher,
         sessionmaker=session_factory,
+        container=container,
+        goods_catalog=goods_catalog,
+        identity_map_stats=identity_map_stats,
+        order_reader=order_reader,
     )
 
     register_handlers(dp=dp, dialog_registry=dialog_registry)
 
     map_tables()
 
+    outbox_worker = OutboxWorker(
+        session_factory=session_factory,
+        event_dispatcher=event_dispatcher,
+        batch_size=config.outbox.batch_size,
+        poll_interval=config.outbox.poll_interval,
+        max_attempts=config.outbox.max_attempts,
+        lease=config.outbox.lease,
+    )
+    background_tasks.extend(start_outbox_workers(outbox_worker, config.outbox.workers))
+
     try:
         await set_commands(bot, config)
-        await bot.get_updates(offset=-1)
-        await dp.start_polling(bot, config=config, event_dispatcher=event_dispatcher)
+        if config.webhook.enabled:
+            await run_webhook(
+                dp,
+                bot,
+                config.webhook,
+                config=config,
+                event_dispatcher=event_dispatcher,
+            )
+        else:
+            await bot.delete_webhook()
+            await bot.get_updates(offset=-1)
+            await dp.start_polling(
+                bot, config=config, event_dispatcher=event_dispatcher
+            )
     finally:
+        for task in background_tasks:
+            task.cancel()
+        await asyncio.gather(*background_tasks, return_exceptions=True)
+        await event_dispatcher.wait_background()
+        logger.info("User cache stats: %s", user_cache.stats)
+        logger.info("Identity map stats: %s", identity_map_stats)
+        logger.info("Pool metrics: %s", pool_metrics)
         await dp.fsm.storage.close()
         await bot.session.close()
 
@@ -0,0 +1,141 @@
+from app.config import Settings
+from app.domain.access_levels.access_policy import (
+    AccessLevelsAccessPolicy,
+    AllowedAccessLevelsPolicy,
+    UserBasedAccessLevelsAccessPolicy,
+)
+from app.domain.access_levels.usecases.access_levels import AccessLevelsService
+from app.domain.goods.access_policy import (
+    AllowedGoodsAccessPolicy,
+    GoodsAccessPolicy,
+    UserBasedGoodsAccessPolicy,
+)
+from app.domain.goods.usecases.goods import GoodsService
+from app.domain.market.access_policy import (
+    AllowedMarketAccessPolicy,
+    MarketAccessPolicy1,
+    UserBasedMarketAccessPolicy,
+)
+from app.domain.market.usecases.market import MarketService
+from app.domain.order.access_policy import (
+    AllowedOrderAccessPolicy,
+    OrderAccessPolicy,
+    UserBasedOrderAccessPolicy,
+)
+from app.domain.order.usecases.order import OrderService
+from app.domain.user.access_policy import (
+    AllowedUserAccessPolicy,
+    UserAccessPolicy,
+    UserBasedUserAccessPolicy,
+)
+from app.domain.user.usecases.user import UserService
+from app.infrastructure.di import Container, Scope
+from app.tgbot.services.fan_out import FanOut
+
+# event handlers act on behalf of the bot, not of a user
+ALLOWED_POLICIES = {
+    AccessLevelsAccessPolicy: AllowedAccessLevelsPolicy,
+    GoodsAccessPolicy: AllowedGoodsAccessPolicy,
+    MarketAccessPolicy1: AllowedMarketAccessPolicy,
+    OrderAccessPolicy: AllowedOrderAccessPolicy,
+    UserAccessPolicy: AllowedUserAccessPolicy,
+}
+
+
+def register_access_policies(container: Container):
+    # allowed policies are stateless, so one instance is shared by app
+    for policy in ALLOWED_POLICIES.values():
+        container.register(policy, lambda c, policy=policy: policy(), Scope.APP)
+
+    container.register(
+        AccessLevelsAccessPolicy,
+        lambda c: UserBasedAccessLevelsAccessPolicy(c.data.get("user")),
+        Scope.REQUEST,
+    )
+    container.register(
+        GoodsAccessPolicy,
+        lambda c: UserBasedGoodsAccessPolicy(c.data.get("user")),
+        Scope.REQUEST,
+    )
+    container.register(
+        MarketAccessPolicy1,
+        lambda c: UserBasedMarketAccessPolicy(c.data.get("user")),
+        Scope.REQUEST,
+    )
+    container.register(
+        OrderAccessPolicy,
+        lambda c: UserBasedOrderAccessPolicy(c.data.get("user")),
+        Scope.REQUEST,
+    )
+    container.register(
+        UserAccessPolicy,
+        lambda c: UserBasedUserAccessPolicy(c.data.get("user")),
+        Scope.REQUEST,
+    )
+
+
+def register_services(container: Container):
+    container.register(
+        AccessLevelsService,
+        lambda c: AccessLevelsService(
+            uow=c.data["uow"],
+            access_policy=c.get(AccessLevelsAccessPolicy),
+            event_dispatcher=c.data["event_dispatcher"],
+        ),
+        Scope.REQUEST,
+    )
+    container.register(
+        GoodsService,
+        lambda c: GoodsService(
+            uow=c.data["uow"],
+            access_policy=c.get(GoodsAccessPolicy),
+            event_dispatcher=c.data["event_dispatcher"],
+        ),
+        Scope.REQUEST,
+    )
+    container.register(
+        MarketService,
+        lambda c: MarketService(
+            uow=c.data["uow"],
+            access_policy=c.get(MarketAccessPolicy1),
+            event_dispatcher=c.data["event_dispatcher"],
+        ),
+        Scope.REQUEST,
+    )
+    container.register(
+        OrderService,
+        lambda c: OrderService(
+            uow=c.data["uow"],
+            access_policy=c.get(OrderAccessPolicy),
+            event_dispatcher=c.data["event_dispatcher"],
+        ),
+        Scope.REQUEST,
+    )
+    container.register(
+        UserService,
+        lambda c: UserService(
+            uow=c.data["uow"],
+            access_policy=c.get(UserAccessPolicy),
+            event_dispatcher=c.data["event_dispatcher"],
+        ),
+        Scope.REQUEST,
+    )
+
+
+def register_telegram(container: Container, config: Settings):
+    container.register(
+        FanOut,
+        lambda c: FanOut(
+            max_concurrent=config.fan_out.max_concurrent,
+            max_retries=config.fan_out.max_retries,
+        ),
+        Scope.APP,
+    )
+
+
+def build_container(config: Settings) -> Container:
+    container = Container()
+    register_access_policies(container)
+    register_services(container)
+    register_telegram(container, config)
+    return container
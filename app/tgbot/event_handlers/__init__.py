@@ -0,0 +1,3 @@
+from .setup import setup_event_handlers
+
+__all__ = ["setup_event_handlers"]
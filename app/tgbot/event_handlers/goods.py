@@ -0,0 +1,17 @@
+from typing import Any
+
+from app.domain.base.events.dispatcher import EventDispatcher
+from app.domain.base.events.event import Event
+from app.domain.goods.models.goods import GoodsCreated, GoodsDeleted, GoodsEdited
+from app.infrastructure.cache import GoodsCatalog
+
+
+async def goods_changed_handler(event: Event, data: dict[str, Any]):
+    goods_catalog: GoodsCatalog = data["goods_catalog"]
+    await goods_catalog.refresh()
+
+
+def setup_event_handlers(event_dispatcher: EventDispatcher):
+    event_dispatcher.register_notify(GoodsCreated, goods_changed_handler)
+    event_dispatcher.register_notify(GoodsEdited, goods_changed_handler)
+    event_dispatcher.register_notify(GoodsDeleted, goods_changed_handler)
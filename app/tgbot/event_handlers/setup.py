@@ -0,0 +1,9 @@
+from app.domain.base.events.dispatcher import EventDispatcher
+
+from . import goods, order, user
+
+
+def setup_event_handlers(event_dispatcher: EventDispatcher):
+    goods.setup_event_handlers(event_dispatcher)
+    order.setup_event_handlers(event_dispatcher)
+    user.setup_event_handlers(event_dispatcher)
@@ -1,11 +1,25 @@
+from typing import Type
+
 import sqlalchemy.orm
 
 from app.domain.base.events.dispatcher import EventDispatcher
+from app.domain.order.interfaces.persistence import IOrderReader
+from app.infrastructure.cache import GoodsCatalog, IdentityMapStats
+from app.infrastructure.di import Container
+from app.tgbot.container import ALLOWED_POLICIES
 from app.tgbot.middlewares.database import Database
+from app.tgbot.middlewares.services import Services
 
 
 def setup_event_middlewares(
     dp: EventDispatcher,
     sessionmaker: sqlalchemy.orm.sessionmaker,
+    container: Container,
+    goods_catalog: GoodsCatalog,
+    identity_map_stats: IdentityMapStats,
+    order_reader: Type[IOrderReader],
 ):
-    dp.notifications.middleware(Database(sessionmaker))
+    dp.notifications.middleware(
+        Database(sessionmaker, goods_catalog, identity_map_stats, order_reader)
+    )
+    dp.notifications.middleware(Services(container, overrides=ALLOWED_POLICIES))
@@ -0,0 +1,26 @@
+from typing import Any
+
+from app.domain.base.events.dispatcher import EventDispatcher
+from app.domain.user.models.user import UserCreated, UserDeleted, UserEdited
+from app.infrastructure.cache import UserCache
+
+
+async def user_created_handler(event: UserCreated, data: dict[str, Any]):
+    user_cache: UserCache = data["user_cache"]
+    user_cache.invalidate(event.user.id)
+
+
+async def user_edited_handler(event: UserEdited, data: dict[str, Any]):
+    user_cache: UserCache = data["user_cache"]
+    user_cache.invalidate(event.old_id, event.user.id)
+
+
+async def user_deleted_handler(event: UserDeleted, data: dict[str, Any]):
+    user_cache: UserCache = data["user_cache"]
+    user_cache.invalidate(event.user_id)
+
+
+def setup_event_handlers(event_dispatcher: EventDispatcher):
+    event_dispatcher.register_notify(UserCreated, user_created_handler)
+    event_dispatcher.register_notify(UserEdited, user_edited_handler)
+    event_dispatcher.register_notify(UserDeleted, user_deleted_handler)
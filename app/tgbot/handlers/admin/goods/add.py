@@ -68,7 +68,7 @@ async def add_goods_yes_no(
     item_id: str,
     **kwargs,
 ):
-    goods_service: GoodsService = manager.data.get("goods_service")
+    goods_service = manager.data["container"].get(GoodsService)
     data = manager.current_context().dialog_data
 
     if item_id == NO:
@@ -28,6 +28,7 @@ from app.domain.goods.exceptions.goods import (
 )
 from app.domain.goods.models.goods_type import GoodsType
 from app.domain.goods.usecases.goods import GoodsService
+from app.infrastructure.di import ScopedContainer
 from app.tgbot import states
 from app.tgbot.constants import GOODS, SELECTED_GOODS, SELECTOR_GOODS_ID
 from app.tgbot.handlers.admin.user.common import copy_start_data_to_context
@@ -44,7 +45,7 @@ async def go_to_next_level(
     manager: DialogManager,
     item_id: str,
 ):
-    goods_service: GoodsService = manager.data.get("goods_service")
+    goods_service = manager.data["container"].get(GoodsService)
 
     if (await goods_service.get_goods_by_id(UUID(item_id))).type == GoodsType.GOODS:
         await manager.start(
@@ -56,8 +57,9 @@ async def go_to_next_level(
 
 
 async def get_goods(
-    dialog_manager: DialogManager, goods_service: GoodsService, **kwargs
+    dialog_manager: DialogManager, container: ScopedContainer, **kwargs
 ):
+    goods_service = container.get(GoodsService)
     parent_id = dialog_manager.current_context().dialog_data.get(SELECTED_GOODS)
     parent_id_as_uuid = UUID(str(parent_id)) if parent_id else None
     goods = await goods_service.get_goods_in_folder(
@@ -67,8 +69,9 @@ async def get_goods(
 
 
 async def get_current_goods(
-    dialog_manager: DialogManager, goods_service: GoodsService, **kwargs
+    dialog_manager: DialogManager, container: ScopedContainer, **kwargs
 ):
+    goods_service = container.get(GoodsService)
     goods_id = dialog_manager.current_context().dialog_data.get(SELECTED_GOODS)
     if not goods_id:
         current_goods = None
@@ -125,7 +128,7 @@ async def edit_this_folder(
 async def change_active_status(
     query: CallbackQuery, button: Button, manager: DialogManager, **kwargs
 ):
-    goods_service: GoodsService = manager.data.get("goods_service")
+    goods_service = manager.data["container"].get(GoodsService)
 
     parent_id = manager.current_context().dialog_data.get(SELECTED_GOODS)
     parent_id_as_uuid = UUID(parent_id) if parent_id is not None else None
@@ -148,7 +151,7 @@ async def change_active_status(
 async def delete_goods(
     query: CallbackQuery, button: Button, manager: DialogManager, **kwargs
 ):
-    goods_service: GoodsService = manager.data.get("goods_service")
+    goods_service = manager.data["container"].get(GoodsService)
 
     parent_id = manager.current_context().dialog_data.get(SELECTED_GOODS)
     try:
@@ -167,7 +170,7 @@ async def delete_goods(
 async def go_to_parent_folder(
     query: CallbackQuery, button: Button, manager: DialogManager, **kwargs
 ):
-    goods_service: GoodsService = manager.data.get("goods_service")
+    goods_service = manager.data["container"].get(GoodsService)
     parent_id = manager.current_context().dialog_data.get(SELECTED_GOODS)
     parent_id_as_uuid = UUID(parent_id) if parent_id is not None else None
     try:
@@ -197,7 +200,7 @@ async def edit_field_dialog_start(
 async def request_name(
     message: Message, dialog: ManagedDialogAdapterProto, manager: DialogManager
 ):
-    service: GoodsService = manager.data.get("goods_service")
+    service = manager.data["container"].get(GoodsService)
     selected_goods = UUID(manager.current_context().dialog_data.get(SELECTED_GOODS))
     await service.patch_goods(GoodsPatch(id=selected_goods, name=message.text))
     await manager.done()
@@ -206,7 +209,7 @@ async def request_name(
 async def request_sku(
     message: Message, dialog: ManagedDialogAdapterProto, manager: DialogManager
 ):
-    service: GoodsService = manager.data.get("goods_service")
+    service = manager.data["container"].get(GoodsService)
     selected_goods = UUID(manager.current_context().dialog_data.get(SELECTED_GOODS))
     await service.patch_goods(GoodsPatch(id=selected_goods, sku=message.text))
     await manager.done()
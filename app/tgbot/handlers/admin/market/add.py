@@ -42,7 +42,7 @@ async def add_market_yes_no(
     item_id: str,
     **kwargs,
 ):
-    market_service: MarketService = manager.data.get("market_service")
+    market_service = manager.data["container"].get(MarketService)
     data = manager.current_context().dialog_data
 
     if item_id == NO:
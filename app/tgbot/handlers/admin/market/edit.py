@@ -20,6 +20,7 @@ from aiogram_dialog.widgets.text import Const, Format
 from app.domain.market.dto import MarketPatch
 from app.domain.market.exceptions.market import CantDeleteWithOrders
 from app.domain.market.usecases import MarketService
+from app.infrastructure.di import ScopedContainer
 from app.tgbot import states
 from app.tgbot.constants import MARKET, SELECTED_MARKET, SELECTOR_MARKET_ID
 from app.tgbot.handlers.admin.user.common import copy_start_data_to_context
@@ -35,8 +36,9 @@ async def add_new_market(
 
 
 async def get_markets(
-    dialog_manager: DialogManager, market_service: MarketService, **kwargs
+    dialog_manager: DialogManager, container: ScopedContainer, **kwargs
 ):
+    market_service = container.get(MarketService)
     markets = await market_service.get_all_markets(only_active=False)
     return {MARKET: markets}
 
@@ -64,7 +66,7 @@ async def start_edit_market_name_dialog(
 async def request_name(
     message: Message, dialog: ManagedDialogAdapterProto, manager: DialogManager
 ):
-    service: MarketService = manager.data.get("market_service")
+    service = manager.data["container"].get(MarketService)
     selected_market = UUID(manager.current_context().dialog_data.get(SELECTED_MARKET))
     await service.patch_market(MarketPatch(id=selected_market, name=message.text))
     await manager.done()
@@ -73,7 +75,7 @@ async def request_name(
 async def delete_market(
     query: CallbackQuery, button: Button, manager: DialogManager, **kwargs
 ):
-    goods_service: MarketService = manager.data.get("market_service")
+    goods_service = manager.data["container"].get(MarketService)
 
     parent_id = manager.current_context().dialog_data.get(SELECTED_MARKET)
     try:
@@ -89,7 +91,7 @@ async def delete_market(
 async def change_market_active_status(
     query: CallbackQuery, button: Button, manager: DialogManager, **kwargs
 ):
-    market_service: MarketService = manager.data.get("market_service")
+    market_service = manager.data["container"].get(MarketService)
 
     market_id = manager.current_context().dialog_data.get(SELECTED_MARKET)
     market_id_as_uuid = UUID(market_id) if market_id is not None else None
@@ -101,8 +103,9 @@ async def change_market_active_status(
 
 
 async def get_selected_market(
-    dialog_manager: DialogManager, market_service: MarketService, **kwargs
+    dialog_manager: DialogManager, container: ScopedContainer, **kwargs
 ):
+    market_service = container.get(MarketService)
     market = dialog_manager.current_context().dialog_data.get(SELECTED_MARKET)
     market = await market_service.get_market_by_id(UUID(market))
     return {MARKET: market}
@@ -22,6 +22,7 @@ from app.domain.access_levels.usecases.access_levels import AccessLevelsService
 from app.domain.user.dto.user import UserCreate
 from app.domain.user.exceptions.user import BlockedUserWithOtherRole, UserAlreadyExists
 from app.domain.user.usecases.user import UserService
+from app.infrastructure.di import ScopedContainer
 from app.tgbot import states
 from app.tgbot.constants import ALL_ACCESS_LEVELS, NO, USER_ID, YES_NO
 from app.tgbot.handlers.admin.user.common import (
@@ -53,15 +54,16 @@ async def request_name(
 
 
 async def get_access_levels(
-    dialog_manager: DialogManager, access_levels_service: AccessLevelsService, **kwargs
+    dialog_manager: DialogManager, container: ScopedContainer, **kwargs
 ):
+    access_levels_service = container.get(AccessLevelsService)
     access_levels = await access_levels_service.get_access_levels()
     access_levels = [(level.name.name, level.id) for level in access_levels]
 
     access_levels = {
         ALL_ACCESS_LEVELS: access_levels,
     }
-    user_data = await get_user_data(dialog_manager, access_levels_service)
+    user_data = await get_user_data(dialog_manager, container)
 
     return user_data | access_levels
 
@@ -72,7 +74,7 @@ async def add_user_yes_no(
     manager: DialogManager,
     item_id: str,
 ):
-    user_service: UserService = manager.data.get("user_service")
+    user_service = manager.data["container"].get(UserService)
     data = manager.current_context().dialog_data
 
     if item_id == NO:
@@ -8,11 +8,15 @@ from aiogram_dialog.widgets.text import Format, Multi
 from app.domain.access_levels.usecases.access_levels import AccessLevelsService
 from app.domain.user.exceptions.user import UserNotExists
 from app.domain.user.usecases.user import UserService
+from app.infrastructure.di import ScopedContainer
 from app.tgbot.constants import ACCESS_LEVELS, USER, USER_ID, USER_NAME, USERS
 from app.tgbot.handlers.dialogs.common import when_not
 
 
-async def get_users(dialog_manager: DialogManager, user_service: UserService, **kwargs):
+async def get_users(
+    dialog_manager: DialogManager, container: ScopedContainer, **kwargs
+):
+    user_service = container.get(UserService)
     users = await user_service.get_users()
     return {USERS: users}
 
@@ -28,7 +32,8 @@ async def save_user_id(
     await query.answer()
 
 
-async def get_user(dialog_manager: DialogManager, user_service: UserService, **kwargs):
+async def get_user(dialog_manager: DialogManager, container: ScopedContainer, **kwargs):
+    user_service = container.get(UserService)
     user_id = dialog_manager.current_context().dialog_data[USER_ID]
     try:
         user = await user_service.get_user(int(user_id))
@@ -48,8 +53,9 @@ user_adding_process = Multi(
 
 
 async def get_user_data(
-    dialog_manager: DialogManager, access_levels_service: AccessLevelsService, **kwargs
+    dialog_manager: DialogManager, container: ScopedContainer, **kwargs
 ):
+    access_levels_service = container.get(AccessLevelsService)
     dialog_data = dialog_manager.current_context().dialog_data
 
     levels = []
@@ -21,7 +21,7 @@ async def delete_user_yes_no(
     manager: DialogManager,
     item_id: str,
 ):
-    user_service: UserService = manager.data.get("user_service")
+    user_service = manager.data["container"].get(UserService)
     data = manager.current_context().dialog_data
 
     if item_id == NO:
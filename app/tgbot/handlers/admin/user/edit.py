@@ -30,6 +30,7 @@ from app.domain.user.exceptions.user import (
 from app.domain.user.interfaces.uow import IUserUoW
 from app.domain.user.usecases.user import UserService
 from app.infrastructure.database.models import TelegramUser
+from app.infrastructure.di import ScopedContainer
 from app.tgbot import states
 from app.tgbot.constants import (
     ACCESS_LEVELS,
@@ -63,8 +64,9 @@ async def save_user_id(
 
 
 async def get_old_user(
-    dialog_manager: DialogManager, user_service: UserService, **kwargs
+    dialog_manager: DialogManager, container: ScopedContainer, **kwargs
 ):
+    user_service = container.get(UserService)
     user_id = dialog_manager.current_context().dialog_data[OLD_USER_ID]
     try:
         user = await user_service.get_user(int(user_id))
@@ -110,10 +112,10 @@ async def on_field_selected(
 
 async def get_user_edit_data(
     dialog_manager: DialogManager,
-    user_service: UserService,
-    access_levels_service: AccessLevelsService,
+    container: ScopedContainer,
     **kwargs,
 ):
+    user_service = container.get(UserService)
     user_id = dialog_manager.current_context().dialog_data[OLD_USER_ID]
 
     user = await user_service.get_user(int(user_id))
@@ -123,7 +125,7 @@ async def get_user_edit_data(
 
     dialog_manager.current_context().dialog_data[USER] = user.json()
 
-    user_data = await get_user_data(dialog_manager, access_levels_service)
+    user_data = await get_user_data(dialog_manager, container)
 
     return {USER: user, "fields": fields} | user_data
 
@@ -143,10 +145,10 @@ async def process_result(start_data: Data, result: Any, dialog_manager: DialogMa
 
 async def get_access_levels(
     dialog_manager: DialogManager,
-    access_levels_service: AccessLevelsService,
-    user_service: UserService,
+    container: ScopedContainer,
     **kwargs,
 ):
+    access_levels_service = container.get(AccessLevelsService)
 
     user_id = dialog_manager.current_context().dialog_data[OLD_USER_ID]
     access_levels = await access_levels_service.get_access_levels()
@@ -165,7 +167,7 @@ async def get_access_levels(
     access_levels = {
         ALL_ACCESS_LEVELS: [(level.name.name, level.id) for level in access_levels],
     }
-    user_data = await get_old_user(dialog_manager, user_service)
+    user_data = await get_old_user(dialog_manager, container)
 
     return user_data | access_levels
 
@@ -190,7 +192,7 @@ async def save_access_levels(
 async def save_edited_user(
     query: CallbackQuery, button, dialog_manager: DialogManager, **kwargs
 ):
-    user_service: UserService = dialog_manager.data.get("user_service")
+    user_service = dialog_manager.data["container"].get(UserService)
     data = dialog_manager.current_context().dialog_data
 
     user = UserPatch(
@@ -0,0 +1,45 @@
+from aiogram import Bot, Router
+from aiogram.dispatcher.filters.command import CommandObject
+from aiogram.dispatcher.fsm.state import any_state
+from aiogram.types import Message
+
+from app.domain.access_levels.models.access_level import LevelName
+from app.domain.order.usecases.order import OrderService
+from app.domain.order.value_objects.confirmed_status import ConfirmedStatus
+from app.domain.user.dto import User
+from app.infrastructure.di import ScopedContainer
+from app.tgbot.filters import AccessLevelFilter
+from app.tgbot.handlers.chief.order_confirm import edit_order_messages
+from app.tgbot.services.bulk_confirmation import USAGE, parse_bulk_confirmation
+from app.tgbot.services.fan_out import FanOut
+
+
+async def confirm_pending_orders(
+    message: Message,
+    command: CommandObject,
+    container: ScopedContainer,
+    user: User,
+    bot: Bot,
+):
+    try:
+        status, orders = parse_bulk_confirmation(command.args)
+    except ValueError:
+        await message.answer(USAGE)
+        return
+
+    changed = await container.get(OrderService).change_confirm_status_bulk(
+        orders, confirmed_status=status, confirmed_by=user
+    )
+    action = "Confirmed" if status is ConfirmedStatus.YES else "Canceled"
+    await message.answer(f"{action} orders: {len(changed)}")
+
+    await edit_order_messages(bot, container.get(FanOut), changed)
+
+
+def register_bulk_confirm(router: Router):
+    router.message.register(
+        confirm_pending_orders,
+        any_state,
+        AccessLevelFilter(access_levels=[LevelName.CONFIRMATION]),
+        commands=["confirm_pending"],
+    )
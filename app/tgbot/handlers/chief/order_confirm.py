@@ -1,4 +1,4 @@
-import logging
+from functools import partial
 from uuid import UUID
 
 from aiogram import Bot, Router
@@ -6,13 +6,14 @@ from aiogram.dispatcher.filters.callback_data import CallbackData
 from aiogram.exceptions import TelegramAPIError
 from aiogram.types import CallbackQuery, InlineKeyboardButton, InlineKeyboardMarkup
 
-from app.domain.order.exceptions.order import OrderAlreadyConfirmed
+from app.domain.order.dto import Order
+from app.domain.order.exceptions.order import OrderAlreadyConfirmed, OrderNotExists
 from app.domain.order.usecases.order import OrderService
 from app.domain.order.value_objects.confirmed_status import ConfirmedStatus
 from app.domain.user.dto import User
+from app.infrastructure.di import ScopedContainer
 from app.tgbot.handlers.message_templates import format_order_message
-
-logger = logging.getLogger(__name__)
+from app.tgbot.services.fan_out import FanOut
 
 
 class OrderConfirm(CallbackData, prefix="order_confirm"):
@@ -45,6 +46,7 @@ async def confirm_order_usecase(
     order_service: OrderService,
     user: User,
     bot: Bot,
+    fan_out: FanOut,
     order_id: UUID,
     result: bool,
     delete_reply_markup: bool,
@@ -52,48 +54,61 @@ async def confirm_order_usecase(
     confirmed_status = ConfirmedStatus.YES if result else ConfirmedStatus.NO
 
     try:
-        await order_service.change_confirm_status(
+        order = await order_service.change_confirm_status(
             order_id, confirmed_status=confirmed_status, confirmed_by=user
         )
-    except OrderAlreadyConfirmed:
-        await query.answer("Order already confirmed")
+    except (OrderAlreadyConfirmed, OrderNotExists) as err:
+        if isinstance(err, OrderNotExists):
+            await query.answer("Order not found")
+        else:
+            await query.answer("Order already confirmed")
         try:
             if delete_reply_markup:
                 await query.message.edit_reply_markup(reply_markup=None)
         except TelegramAPIError:
             #  If reply_markup is already deleted
             pass
+        return
     if result:
         await query.answer("Order confirmed")
     else:
         await query.answer("Order canceled")
-    order = await order_service.get_order_by_id(order_id)
 
-    for message in order.order_messages:
-        try:
-            await bot.edit_message_text(
-                text=format_order_message(order),
+    await edit_order_messages(bot, fan_out, [order])
+
+
+async def edit_order_messages(bot: Bot, fan_out: FanOut, orders: list[Order]):
+    """Replace messages sent to confirmers with orders status, by one fan-out"""
+    calls = []
+    for order in orders:
+        message_text = format_order_message(order)
+        calls.extend(
+            partial(
+                bot.edit_message_text,
+                text=message_text,
                 chat_id=message.chat_id,
                 message_id=message.message_id,
                 reply_markup=None,
             )
-        except TelegramAPIError as e:
-            logger.error(e)
-            continue
+            for message in order.order_messages
+        )
+    await fan_out.run(calls)
 
 
 async def confirm_order(
     query: CallbackQuery,
     callback_data: OrderConfirm,
-    order_service: OrderService,
+    container: ScopedContainer,
     user: User,
     bot: Bot,
 ):
+    order_service = container.get(OrderService)
     await confirm_order_usecase(
         query=query,
         order_service=order_service,
         user=user,
         bot=bot,
+        fan_out=container.get(FanOut),
         order_id=callback_data.order_id,
         result=callback_data.result,
         delete_reply_markup=True,
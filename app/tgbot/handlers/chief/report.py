@@ -0,0 +1,59 @@
+import datetime
+from typing import Optional, Tuple
+
+from aiogram import Router
+from aiogram.dispatcher.filters.command import CommandObject
+from aiogram.dispatcher.fsm.state import any_state
+from aiogram.types import Message
+
+from app.domain.access_levels.models.access_level import LevelName
+from app.domain.order.usecases.order import OrderService
+from app.infrastructure.di import ScopedContainer
+from app.tgbot.filters import AccessLevelFilter
+from app.tgbot.handlers.message_templates import format_order_report
+
+DEFAULT_REPORT_DAYS = 7
+
+USAGE = (
+    "Usage: /report [start] [end]\n"
+    "Dates are YYYY-MM-DD, by default report is for the last "
+    f"{DEFAULT_REPORT_DAYS} days"
+)
+
+
+def parse_period(
+    args: Optional[str], today: datetime.date
+) -> Tuple[datetime.date, datetime.date]:
+    """Period of report, end is today if it is omitted"""
+    dates = [datetime.date.fromisoformat(arg) for arg in (args or "").split()]
+    if not dates:
+        return today - datetime.timedelta(days=DEFAULT_REPORT_DAYS - 1), today
+    if len(dates) == 1:
+        return dates[0], today
+    if len(dates) == 2 and dates[0] <= dates[1]:
+        return dates[0], dates[1]
+    raise ValueError(f"Incorrect report period: {args}")
+
+
+async def order_report(
+    message: Message, command: CommandObject, container: ScopedContainer
+):
+    try:
+        start, end = parse_period(command.args, today=datetime.date.today())
+    except ValueError:
+        await message.answer(USAGE)
+        return
+
+    report = await container.get(OrderService).get_report(start=start, end=end)
+    await message.answer(format_order_report(report))
+
+
+def register_report(router: Router):
+    router.message.register(
+        order_report,
+        any_state,
+        AccessLevelFilter(
+            access_levels=[LevelName.ADMINISTRATOR, LevelName.CONFIRMATION]
+        ),
+        commands=["report"],
+    )
@@ -1,7 +1,11 @@
 from aiogram import Router
 
+from app.tgbot.handlers.chief.bulk_confirm import register_bulk_confirm
 from app.tgbot.handlers.chief.order_confirm import register_handlers
+from app.tgbot.handlers.chief.report import register_report
 
 
 def register_chief_handlers(router: Router):
     register_handlers(router=router)
+    register_report(router=router)
+    register_bulk_confirm(router=router)
@@ -2,6 +2,9 @@ from aiogram.utils.text_decorations import html_decoration as fmt
 
 from app.domain.order import dto
 
+# telegram message length limit
+MESSAGE_LIMIT = 4096
+
 
 def format_order_message(order: dto.Order):
     result = fmt.quote(
@@ -20,3 +23,39 @@ def format_order_message(order: dto.Order):
         )
     result = result
     return result
+
+
+def format_order_summary_message(order: dto.OrderSummary):
+    return fmt.quote(
+        f"Id: {str(order.id)}\n"
+        f"Created at: {order.created_at}\n"
+        f"Creator: {order.creator_name}\n"
+        f"Market: {order.recipient_market_name}\n"
+        f"Comments: {order.commentary}\n\n"
+        f"Status: {order.confirmed.value} {order.confirmed_icon}\n"
+        f"Goods ({order.line_count}):\n"
+        f"{order.lines_summary}\n"
+    )
+
+
+def format_order_report(report: dto.OrderReport):
+    result = fmt.quote(f"Orders from {report.start} to {report.end}\n")
+    if not report.rows:
+        return result + fmt.quote("No orders")
+
+    market_id = None
+    for row in report.rows:
+        if row.market_id != market_id:
+            market_id = row.market_id
+            line = f"\n{row.market_name}:\n"
+        else:
+            line = ""
+        line += (
+            f"  {row.goods_name} {row.goods_sku or ''}".rstrip()
+            + f" [{row.confirmed.value}]: {row.quantity} in {row.order_count} orders\n"
+        )
+        line = fmt.quote(line)
+        if len(result) + len(line) > MESSAGE_LIMIT - 1:
+            return result + "…"
+        result += line
+    return result
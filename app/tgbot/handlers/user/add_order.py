@@ -22,6 +22,7 @@ from app.domain.goods.usecases.goods import GoodsService
 from app.domain.market.usecases import MarketService
 from app.domain.order.dto import OrderCreate, OrderLineCreate
 from app.domain.order.usecases.order import OrderService
+from app.infrastructure.di import ScopedContainer
 from app.tgbot import states
 from app.tgbot.constants import (
     GOODS,
@@ -46,8 +47,9 @@ from app.tgbot.handlers.message_templates import format_order_message
 
 
 async def get_active_goods(
-    dialog_manager: DialogManager, goods_service: GoodsService, **kwargs
+    dialog_manager: DialogManager, container: ScopedContainer, **kwargs
 ):
+    goods_service = container.get(GoodsService)
     parent_id = dialog_manager.current_context().dialog_data.get(SELECTED_GOODS)
     parent_id_as_uuid = UUID(str(parent_id)) if parent_id else None
     goods = await goods_service.get_goods_in_folder(parent_id_as_uuid, only_active=True)
@@ -60,7 +62,7 @@ async def go_to_next_level(
     manager: DialogManager,
     item_id: str,
 ):
-    goods_service: GoodsService = manager.data.get("goods_service")
+    goods_service = manager.data["container"].get(GoodsService)
 
     if (await goods_service.get_goods_by_id(UUID(item_id))).type == GoodsType.GOODS:
         manager.current_context().dialog_data[SELECTED_GOODS] = item_id
@@ -85,7 +87,7 @@ async def add_order_yes_no(
     manager: DialogManager,
     item_id: str,
 ):
-    order_service: OrderService = manager.data.get("order_service")
+    order_service = manager.data["container"].get(OrderService)
     data = manager.current_context().dialog_data
 
     if item_id == NO:
@@ -121,8 +123,9 @@ async def new_order_id_getter(dialog_manager: DialogManager, **kwargs):
 
 
 async def get_active_markets(
-    dialog_manager: DialogManager, market_service: MarketService, **kwargs
+    dialog_manager: DialogManager, container: ScopedContainer, **kwargs
 ):
+    market_service = container.get(MarketService)
     markets = await market_service.get_all_markets(only_active=True)
     return {MARKET: markets}
 
@@ -157,10 +160,11 @@ def order_adding_process(only_filled=True):
 
 async def order_adding_process_getter(
     dialog_manager: DialogManager,
-    market_service: MarketService,
-    goods_service: GoodsService,
+    container: ScopedContainer,
     **kwargs,
 ):
+    market_service = container.get(MarketService)
+    goods_service = container.get(GoodsService)
     data = dialog_manager.current_context().dialog_data
     market_id = data.get(SELECTED_MARKET)
     goods_id = data.get(SELECTED_GOODS)
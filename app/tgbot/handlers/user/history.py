@@ -1,20 +1,30 @@
 import datetime
 import math
-from typing import Optional
-from uuid import UUID
+import tempfile
+from pathlib import Path
+from typing import AsyncIterator, Optional
 
-from aiogram.types import BufferedInputFile, CallbackQuery
+from aiogram.types import CallbackQuery, FSInputFile
 from aiogram.utils.text_decorations import html_decoration as fmt
 from aiogram_dialog import Dialog, DialogManager, ShowMode, Window
 from aiogram_dialog.widgets.kbd import Back, Button, Cancel, Next, Row
 from aiogram_dialog.widgets.text import Const, Format
 
+from app.config import Settings
 from app.domain.access_levels.models.access_level import LevelName
+from app.domain.order.dto import (
+    OrderCursor,
+    OrderExportRow,
+    OrderSummariesPage,
+    OrderSummary,
+)
 from app.domain.order.usecases.order import OrderService
 from app.domain.user.dto import User
-from app.infrastructure.exporters.orders_csv import export_orders_to_csv
+from app.infrastructure.di import ScopedContainer
+from app.infrastructure.exporters.orders_csv import Compression, export_orders_to_csv
 from app.tgbot.handlers.chief.order_confirm import confirm_order_usecase
-from app.tgbot.handlers.message_templates import format_order_message
+from app.tgbot.handlers.message_templates import format_order_summary_message
+from app.tgbot.services.fan_out import FanOut
 from app.tgbot.states import history
 
 my_orders_access_levels = [
@@ -30,11 +40,11 @@ ORDERS_FOR_CONFIRMATION = "orders_for_confirmation"
 ALL_ORDERS = "all_orders"
 
 ORDERS_ON_PAGE_LIMIT = 2
-ORDERS_FOR_CONFIRMATION_LIMIT = 1
+# order shown to confirmer isn't shown to others till confirmed or lease ends
+CONFIRMATION_LEASE = datetime.timedelta(minutes=10)
 
 limit = {
     MY_ORDERS: ORDERS_ON_PAGE_LIMIT,
-    ORDERS_FOR_CONFIRMATION: ORDERS_FOR_CONFIRMATION_LIMIT,
     ALL_ORDERS: ORDERS_ON_PAGE_LIMIT,
 }
 
@@ -57,143 +67,199 @@ async def import_orders_csv(
     query: CallbackQuery, button: Button, manager: DialogManager, **kwargs
 ):
     history_level = manager.current_context().dialog_data["history_level"]
-    order_service = manager.data["order_service"]
+    order_service = manager.data["container"].get(OrderService)
     user = manager.data["user"]
+    config: Settings = manager.data["config"]
 
-    orders = await get_orders(
-        order_service=order_service,
-        user=user,
-        history_level=history_level,
-        offset=0,
-        limit=None,
+    chunks = export_orders(
+        order_service=order_service, user=user, history_level=history_level
     )
 
-    csv = export_orders_to_csv(orders)
-    await query.message.answer_document(
-        BufferedInputFile(
-            csv,
-            filename=f"{history_level}-{datetime.datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.csv",
+    with tempfile.TemporaryDirectory() as directory:
+        path = await export_orders_to_csv(
+            chunks,
+            directory=Path(directory),
+            name=f"{history_level}-{datetime.datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}",
+            encoding=config.export.encoding,
+            compression=Compression(config.export.compression),
         )
-    )
+        await query.message.answer_document(FSInputFile(path))
+
     manager.show_mode = ShowMode.SEND
     await manager.dialog().show()
 
 
-async def get_orders(
+def export_orders(
     order_service: OrderService,
     user: User,
     history_level: str,
-    offset: int,
-    limit: Optional[int],
-):
+) -> AsyncIterator[list[OrderExportRow]]:
     if history_level == MY_ORDERS:
-        orders = await order_service.get_user_orders(
-            user_id=user.id, offset=offset, limit=limit
-        )
+        chunks = order_service.export_user_orders(user_id=user.id)
     elif history_level == ORDERS_FOR_CONFIRMATION:
-        orders = await order_service.get_orders_for_confirmation(
-            offset=offset, limit=limit
-        )
+        chunks = order_service.export_orders_for_confirmation()
     elif history_level == ALL_ORDERS:
-        orders = await order_service.get_all_orders(offset=offset, limit=limit)
+        chunks = order_service.export_all_orders()
     else:
         raise ValueError(f"Unknown history level: {history_level}")
 
-    return orders
+    return chunks
 
 
-async def get_orders_count(
+async def get_orders(
     order_service: OrderService,
     user: User,
     history_level: str,
-):
+    after: Optional[OrderCursor],
+    limit: Optional[int],
+) -> OrderSummariesPage:
     if history_level == MY_ORDERS:
-        orders_count = await order_service.get_user_orders_count(user_id=user.id)
-    elif history_level == ORDERS_FOR_CONFIRMATION:
-        orders_count = await order_service.get_orders_for_confirmation_count()
+        page = await order_service.get_user_orders(
+            user_id=user.id, after=after, limit=limit
+        )
     elif history_level == ALL_ORDERS:
-        orders_count = await order_service.get_all_orders_count()
+        page = await order_service.get_all_orders(after=after, limit=limit)
     else:
         raise ValueError(f"Unknown history level: {history_level}")
 
-    return orders_count
+    return page
 
 
-async def orders_getter(
-    dialog_manager: DialogManager, order_service: OrderService, user: User, **kwargs
-):
-    history_level = dialog_manager.current_context().dialog_data["history_level"]
-    offset = dialog_manager.current_context().dialog_data.setdefault("offset", 0)
+def current_cursor(dialog_data: dict) -> Optional[OrderCursor]:
+    # "cursors" is a stack with the start position of every page after the first
+    cursors = dialog_data.setdefault("cursors", [])
+    return OrderCursor.decode(cursors[-1]) if cursors else None
 
-    orders_count = await get_orders_count(
-        order_service=order_service, user=user, history_level=history_level
+
+async def claim_order(manager: DialogManager, after: Optional[OrderCursor]) -> None:
+    """Lease next order of the queue to user, getter only shows the claimed order"""
+    dialog_data = manager.current_context().dialog_data
+    order_service = manager.data["container"].get(OrderService)
+    user = manager.data["user"]
+
+    # confirmers work the queue in parallel, every one is given own order
+    page = await order_service.claim_order_for_confirmation(
+        user_id=user.id, lease=CONFIRMATION_LEASE, after=after
     )
+    if not page.orders and after is not None:
+        # end of the queue, start over from the oldest order
+        page = await order_service.claim_order_for_confirmation(
+            user_id=user.id, lease=CONFIRMATION_LEASE
+        )
+
+    dialog_data["claimed_order"] = page.orders[0].json() if page.orders else None
+    dialog_data["queue_count"] = page.total
 
-    if orders_count <= offset != 0:
-        offset = orders_count - 1
-        dialog_manager.current_context().dialog_data["offset"] = offset
 
-    orders = await get_orders(
+def claimed_order(dialog_data: dict) -> Optional[OrderSummary]:
+    raw = dialog_data.get("claimed_order")
+    return OrderSummary.parse_raw(raw) if raw else None
+
+
+def confirmation_queue(dialog_data: dict) -> dict:
+    order = claimed_order(dialog_data)
+    queue_count = dialog_data["queue_count"]
+
+    message = f"Orders for confirmation: {queue_count}\n\n"
+    if order is not None:
+        message += f"Order {fmt.pre(order.id)}:\n\n{format_order_summary_message(order)}{'-'*89}\n"
+
+    # queue has no pages, other orders are reached by skipping claimed one
+    return {
+        "result": message,
+        "has_next": False,
+        "has_prev": False,
+        "can_skip": order is not None and queue_count > 1,
+        ORDERS_FOR_CONFIRMATION: order is not None,
+    }
+
+
+async def orders_getter(
+    dialog_manager: DialogManager, container: ScopedContainer, user: User, **kwargs
+):
+    order_service = container.get(OrderService)
+    dialog_data = dialog_manager.current_context().dialog_data
+    history_level = dialog_data["history_level"]
+    if history_level == ORDERS_FOR_CONFIRMATION:
+        return confirmation_queue(dialog_data)
+    page_limit = limit.get(history_level)
+
+    # fetch one extra order to know if there is a next page
+    orders_page = await get_orders(
         order_service=order_service,
         user=user,
         history_level=history_level,
-        offset=offset,
-        limit=ORDERS_FOR_CONFIRMATION_LIMIT
-        if history_level == ORDERS_FOR_CONFIRMATION
-        else ORDERS_ON_PAGE_LIMIT,
+        after=current_cursor(dialog_data),
+        limit=page_limit + 1,
     )
+    # orders of the current page can disappear (e.g. confirmed), step back
+    while not orders_page.orders and dialog_data["cursors"]:
+        dialog_data["cursors"].pop()
+        orders_page = await get_orders(
+            order_service=order_service,
+            user=user,
+            history_level=history_level,
+            after=current_cursor(dialog_data),
+            limit=page_limit + 1,
+        )
 
-    page = offset // limit.get(history_level) + 1
-    last_page = math.ceil(orders_count / limit.get(history_level))
-    has_next = offset + limit.get(history_level) < orders_count
+    orders_count = orders_page.total
+    has_next = len(orders_page.orders) > page_limit
+    orders = orders_page.orders[:page_limit]
+    if has_next:
+        dialog_data["next_cursor"] = OrderCursor.from_order(orders[-1]).encode()
+
+    page = len(dialog_data["cursors"]) + 1
+    last_page = math.ceil(orders_count / page_limit)
 
     message = f"Orders:\n\nPage: {page}/{last_page}\n\n"
     for order in orders:
-        message += (
-            f"Order {fmt.pre(order.id)}:\n\n{format_order_message(order)}{'-'*89}\n"
-        )
-
-    if len(orders) > 0 and history_level == ORDERS_FOR_CONFIRMATION:
-        dialog_manager.current_context().dialog_data["order_id"] = str(orders[0].id)
-        orders_for_confirmation = True
-    else:
-        orders_for_confirmation = False
+        message += f"Order {fmt.pre(order.id)}:\n\n{format_order_summary_message(order)}{'-'*89}\n"
 
     return {
         "result": message,
         "has_next": has_next,
-        "has_prev": offset > 0,
-        ORDERS_FOR_CONFIRMATION: orders_for_confirmation,
+        "has_prev": bool(dialog_data["cursors"]),
+        "can_skip": False,
+        ORDERS_FOR_CONFIRMATION: False,
     }
 
 
 async def previous_page(
     query: CallbackQuery, button: Button, manager: DialogManager, **kwargs
 ):
-    history_level = manager.current_context().dialog_data["history_level"]
-    manager.current_context().dialog_data["offset"] -= limit.get(history_level)
+    manager.current_context().dialog_data["cursors"].pop()
 
 
 async def next_page(
     query: CallbackQuery, button: Button, manager: DialogManager, **kwargs
 ):
-    history_level = manager.current_context().dialog_data["history_level"]
-    manager.current_context().dialog_data["offset"] += limit.get(history_level)
+    dialog_data = manager.current_context().dialog_data
+    dialog_data["cursors"].append(dialog_data["next_cursor"])
 
 
-async def reset_offset(
+async def reset_pagination(
     query: CallbackQuery, button: Button, manager: DialogManager, **kwargs
 ):
-    manager.current_context().dialog_data["offset"] = 0
+    manager.current_context().dialog_data["cursors"] = []
 
 
 async def save_history_level(
     query: CallbackQuery, button: Button, manager: DialogManager, **kwargs
 ):
     manager.current_context().dialog_data["history_level"] = button.widget_id
+    if button.widget_id == ORDERS_FOR_CONFIRMATION:
+        await claim_order(manager, after=None)
     await manager.dialog().next()
 
 
+async def skip_order(
+    query: CallbackQuery, button: Button, manager: DialogManager, **kwargs
+):
+    order = claimed_order(manager.current_context().dialog_data)
+    await claim_order(manager, after=OrderCursor.from_order(order))
+
+
 async def confirm_order(
     query: CallbackQuery, button: Button, manager: DialogManager, **kwargs
 ):
@@ -201,16 +267,19 @@ async def confirm_order(
         result = True
     else:
         result = False
+    order = claimed_order(manager.current_context().dialog_data)
 
     await confirm_order_usecase(
         query=query,
-        order_service=manager.data["order_service"],
+        order_service=manager.data["container"].get(OrderService),
         user=manager.data["user"],
         bot=manager.data["bot"],
-        order_id=UUID(manager.current_context().dialog_data["order_id"]),
+        fan_out=manager.data["container"].get(FanOut),
+        order_id=order.id,
         result=result,
         delete_reply_markup=False,
     )
+    await claim_order(manager, after=OrderCursor.from_order(order))
 
 
 history_dialog = Dialog(
@@ -246,6 +315,9 @@ history_dialog = Dialog(
             Button(Const("❌ Cancel"), id="cancel_order", on_click=confirm_order),
             when=ORDERS_FOR_CONFIRMATION,
         ),
+        Button(
+            Const("⏭ Skip order"), id="skip_order", on_click=skip_order, when="can_skip"
+        ),
         # add 2 buttons for previous and next page
         Row(
             Button(
@@ -264,7 +336,7 @@ history_dialog = Dialog(
         Button(
             Const("💾 Import data"), id="import_orders_csv", on_click=import_orders_csv
         ),
-        Back(Const("↩️ Back to history"), on_click=reset_offset),
+        Back(Const("↩️ Back to history"), on_click=reset_pagination),
         Cancel(Const("❌ Close")),
         state=history.History.show,
         getter=[orders_getter],
@@ -1,20 +1,47 @@
-from typing import Any, Awaitable, Callable, Dict
+from typing import Any, Awaitable, Callable, Dict, Optional, Type
 
 from aiogram import BaseMiddleware
 from aiogram.types import Update
 from sqlalchemy.orm import sessionmaker
 
+from app.domain.order.interfaces.persistence import IOrderReader
+from app.infrastructure.cache import (
+    GoodsCatalog,
+    GoodsCatalogReader,
+    IdentityMap,
+    IdentityMapStats,
+)
 from app.infrastructure.database.repositories import AccessLevelReader, UserRepo
-from app.infrastructure.database.repositories.goods import GoodsReader, GoodsRepo
+from app.infrastructure.database.repositories.goods import GoodsRepo
 from app.infrastructure.database.repositories.market import MarketReader, MarketRepo
 from app.infrastructure.database.repositories.order import OrderReader, OrderRepo
+from app.infrastructure.database.repositories.order_stats import (
+    OrderStatsReader,
+    OrderStatsRepo,
+)
+from app.infrastructure.database.repositories.order_summary import (
+    OrderSummaryReader,
+    OrderSummaryRepo,
+)
+from app.infrastructure.database.repositories.outbox import OutboxRepo
 from app.infrastructure.database.repositories.user import UserReader
 from app.infrastructure.database.uow import SQLAlchemyUoW
 
 
 class Database(BaseMiddleware):
-    def __init__(self, sm: sessionmaker) -> None:
+    def __init__(
+        self,
+        sm: sessionmaker,
+        goods_catalog: GoodsCatalog,
+        identity_map_stats: IdentityMapStats,
+        order_reader: Type[IOrderReader] = OrderReader,
+        replica_sm: Optional[sessionmaker] = None,
+    ) -> None:
         self.Session = sm
+        self.ReplicaSession = replica_sm
+        self.goods_catalog = goods_catalog
+        self.identity_map_stats = identity_map_stats
+        self.order_reader = order_reader
 
     async def __call__(
         self,
@@ -23,19 +50,30 @@ class Database(BaseMiddleware):
         data: Dict[str, Any],
     ) -> Any:
 
-        async with self.Session() as session:
-            data["session"] = session
-            data["uow"] = SQLAlchemyUoW(
-                session=session,
-                user_repo=UserRepo,
-                access_level_reader=AccessLevelReader,
-                user_reader=UserReader,
-                goods_repo=GoodsRepo,
-                goods_reader=GoodsReader,
-                market_repo=MarketRepo,
-                market_reader=MarketReader,
-                order_repo=OrderRepo,
-                order_reader=OrderReader,
-            )
+        uow = SQLAlchemyUoW(
+            session_factory=self.Session,
+            user_repo=UserRepo,
+            access_level_reader=AccessLevelReader,
+            user_reader=UserReader,
+            goods_repo=GoodsRepo,
+            # catalog navigation is served from snapshot without queries
+            goods_reader=lambda session: GoodsCatalogReader(self.goods_catalog),
+            market_repo=MarketRepo,
+            market_reader=MarketReader,
+            order_repo=OrderRepo,
+            order_reader=self.order_reader,
+            order_summary_repo=OrderSummaryRepo,
+            order_summary_reader=OrderSummaryReader,
+            order_stats_repo=OrderStatsRepo,
+            order_stats_reader=OrderStatsReader,
+            outbox_repo=OutboxRepo,
+            # getters of one window often read the same entities
+            identity_map=IdentityMap(self.identity_map_stats),
+            replica_session_factory=self.ReplicaSession,
+        )
+        data["uow"] = uow
 
+        try:
             return await handler(event, data)
+        finally:
+            await uow.close()
@@ -1,6 +1,12 @@
+from typing import Optional, Type
+
 import sqlalchemy.orm
 from aiogram import Dispatcher
 
+from app.domain.order.interfaces.persistence import IOrderReader
+from app.infrastructure.cache import GoodsCatalog, IdentityMapStats, UserCache
+from app.infrastructure.di import Container
+
 from .database import Database
 from .services import Services
 from .user import UserDB
@@ -9,7 +15,21 @@ from .user import UserDB
 def setup_middlewares(
     dp: Dispatcher,
     sessionmaker: sqlalchemy.orm.sessionmaker,
+    user_cache: UserCache,
+    container: Container,
+    goods_catalog: GoodsCatalog,
+    identity_map_stats: IdentityMapStats,
+    order_reader: Type[IOrderReader],
+    replica_sessionmaker: Optional[sqlalchemy.orm.sessionmaker] = None,
 ):
-    dp.update.outer_middleware(Database(sessionmaker))
-    dp.update.outer_middleware(UserDB())
-    dp.update.outer_middleware(Services())
+    dp.update.outer_middleware(
+        Database(
+            sessionmaker,
+            goods_catalog,
+            identity_map_stats,
+            order_reader,
+            replica_sm=replica_sessionmaker,
+        )
+    )
+    dp.update.outer_middleware(UserDB(user_cache))
+    dp.update.outer_middleware(Services(container))
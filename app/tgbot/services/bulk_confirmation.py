@@ -0,0 +1,59 @@
+import datetime
+import re
+from typing import Optional, Tuple
+from uuid import UUID
+
+from app.domain.order.dto import PendingOrdersFilter
+from app.domain.order.value_objects.confirmed_status import ConfirmedStatus
+
+USAGE = (
+    "Usage: /confirm_pending yes|no [start] [end] [market]\n"
+    "or: /confirm_pending yes|no <order id> ...\n"
+    "or: /confirm_pending yes|no all\n"
+    "Dates are YYYY-MM-DD, at least one filter is required, "
+    "all changes every not processed order"
+)
+
+STATUSES = {"yes": ConfirmedStatus.YES, "no": ConfirmedStatus.NO}
+ALL_ORDERS = "all"
+
+# hex digits and dashes, a mistyped id must not be taken for market name
+ID_LIKE = re.compile(r"^(?=.*-)[0-9a-fA-F-]{8,}$")
+
+
+def parse_bulk_confirmation(
+    args: Optional[str],
+) -> Tuple[ConfirmedStatus, PendingOrdersFilter]:
+    """Status to set and orders to change, order ids exclude other filters"""
+    words = (args or "").split()
+    if not words or words[0].lower() not in STATUSES:
+        raise ValueError(f"Incorrect bulk confirmation: {args}")
+    status, words = STATUSES[words[0].lower()], words[1:]
+
+    # changing every pending order must be asked for explicitly
+    if not words:
+        raise ValueError(f"Bulk confirmation without filters: {args}")
+    if len(words) == 1 and words[0].lower() == ALL_ORDERS:
+        return status, PendingOrdersFilter(all_orders=True)
+
+    dates = []
+    while words and len(dates) < 2:
+        try:
+            dates.append(datetime.date.fromisoformat(words[0]))
+        except ValueError:
+            break
+        words = words[1:]
+    if len(dates) == 2 and dates[0] > dates[1]:
+        raise ValueError(f"Incorrect bulk confirmation period: {args}")
+
+    if not dates and ID_LIKE.match(words[0]):
+        # raises ValueError on the first malformed id
+        order_ids = [UUID(word) for word in words]
+        return status, PendingOrdersFilter(order_ids=order_ids)
+
+    return status, PendingOrdersFilter(
+        start=dates[0] if dates else None,
+        end=dates[1] if len(dates) == 2 else None,
+        # rest is market name, it can contain spaces
+        market_name=" ".join(words) or None,
+    )
@@ -0,0 +1,52 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Iterable, List, Optional, Tuple, TypeVar
+
+from aiogram.exceptions import TelegramAPIError, TelegramRetryAfter
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+Call = Callable[[], Awaitable[T]]
+
+
+class FanOut:
+    """
+    Run telegram requests concurrently
+
+    One instance is shared by the app, so `max_concurrent` bounds requests of
+    all fan-outs together. Request hit by flood control frees its slot while
+    waiting for `retry_after`, so it doesn't stall other requests.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        max_retries: int,
+        sleep: Callable[[float], Awaitable] = asyncio.sleep,
+    ) -> None:
+        self.max_retries = max_retries
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._sleep = sleep
+
+    async def run(self, calls: Iterable[Call[T]]) -> List[T]:
+        """Return results of successful calls in order of calls, errors are logged"""
+        results = await asyncio.gather(*(self._call(call) for call in calls))
+        return [result for ok, result in results if ok]
+
+    async def _call(self, call: Call[T]) -> Tuple[bool, Optional[T]]:
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with self._semaphore:
+                    return True, await call()
+            except TelegramRetryAfter as e:
+                if attempt == self.max_retries:
+                    logger.error(e)
+                    break
+                # slot is free while waiting, so other requests go on
+                await self._sleep(e.retry_after)
+            except TelegramAPIError as e:
+                logger.error(e)
+                break
+        return False, None
@@ -19,6 +19,12 @@ async def set_commands(bot: Bot, settings: Settings):
             description="Admin panel",
         )
     )
+    admin_commands.append(
+        BotCommand(
+            command="report",
+            description="Orders report",
+        )
+    )
 
     await bot.set_my_commands(commands=commands, scope=BotCommandScopeDefault())
 
@@ -0,0 +1,87 @@
+import asyncio
+import logging
+from typing import Any, Dict, Set
+
+from aiogram import Bot, Dispatcher
+from aiogram.dispatcher.webhook.aiohttp_server import (
+    SimpleRequestHandler,
+    setup_application,
+)
+from aiohttp import web
+
+from app.config import Webhook
+
+logger = logging.getLogger(__name__)
+
+
+class BoundedRequestHandler(SimpleRequestHandler):
+    """
+    Answer telegram right away and process update in background
+
+    Not more than `max_concurrent_updates` are processed at once, next request
+    waits for a free slot before answer, so telegram slows down instead of
+    piling up tasks (telegram doesn't send more than max_connections at once).
+    """
+
+    def __init__(
+        self,
+        dispatcher: Dispatcher,
+        bot: Bot,
+        max_concurrent_updates: int,
+        **data: Any,
+    ) -> None:
+        super().__init__(dispatcher, bot, handle_in_background=True, **data)
+        self._semaphore = asyncio.Semaphore(max_concurrent_updates)
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def _handle_request_background(
+        self, bot: Bot, request: web.Request
+    ) -> web.Response:
+        update = await request.json(loads=bot.session.json_loads)
+
+        await self._semaphore.acquire()
+        task = asyncio.create_task(self._process_update(bot, update))
+        # keep reference, event loop holds only weak references to tasks
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+        return web.json_response({}, dumps=bot.session.json_dumps)
+
+    async def _process_update(self, bot: Bot, update: Dict[str, Any]) -> None:
+        try:
+            await self._background_feed_update(bot, update)
+        except Exception:
+            logger.exception("Failed to process update %s", update.get("update_id"))
+        finally:
+            self._semaphore.release()
+
+    async def close(self) -> None:
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        await super().close()
+
+
+async def run_webhook(dp: Dispatcher, bot: Bot, config: Webhook, **kwargs: Any) -> None:
+    app = web.Application()
+    BoundedRequestHandler(
+        dispatcher=dp,
+        bot=bot,
+        max_concurrent_updates=config.max_concurrent_updates,
+        **kwargs,
+    ).register(app, path=config.path)
+    setup_application(app, dp, bot=bot, **kwargs)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    try:
+        await web.TCPSite(runner, host=config.host, port=config.port).start()
+        await bot.set_webhook(
+            url=f"{config.url}{config.path}",
+            max_connections=config.max_connections,
+            allowed_updates=dp.resolve_used_update_types(),
+        )
+        logger.info("Webhook server started on %s:%s", config.host, config.port)
+
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
@@ -0,0 +1,128 @@
+"""
+Morning backlog: confirm pending orders one by one vs one bulk update
+
+    python -m benchmarks.bulk_confirmation
+
+Every order has messages of confirmers, their edits are sent through FanOut
+to fake telegram with fixed latency. One by one, edits of an order are sent
+after its confirmation, like the confirm button does.
+"""
+import asyncio
+import statistics
+import time
+from functools import partial
+from typing import Awaitable, Callable, List
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.config import FanOut as FanOutConfig
+from app.domain.order import dto
+from app.domain.order.models.order import OrderConfirmStatusChanged
+from app.domain.order.value_objects import ConfirmedStatus
+from app.infrastructure.database.repositories import (
+    OrderRepo,
+    OrderStatsRepo,
+    OrderSummaryRepo,
+    OutboxRepo,
+)
+from app.tgbot.services.fan_out import FanOut
+
+from .common import (
+    NETWORK_DELAY_MS,
+    bench_connection,
+    load_bench_config,
+    session_factory,
+)
+from .seed import BENCH_USER_ID, seed_orders
+
+ORDERS = 300
+LINES_PER_ORDER = 3
+MESSAGES_PER_ORDER = 2
+TELEGRAM_LATENCY = 0.05
+REPEAT = 3
+
+CONFIRMED_BY = dto.User(id=BENCH_USER_ID, name="Benchmark")
+
+Confirm = Callable[[AsyncSession, FanOut, List], Awaitable[int]]
+
+
+async def edit_message(**kwargs) -> None:
+    await asyncio.sleep(TELEGRAM_LATENCY)
+
+
+def edits(orders: List[dto.Order]) -> List:
+    return [
+        partial(edit_message, chat_id=message.chat_id, message_id=message.message_id)
+        for order in orders
+        for message in order.order_messages
+    ]
+
+
+async def apply(session: AsyncSession, events: List) -> None:
+    await OrderSummaryRepo(session).apply(events)
+    await OrderStatsRepo(session).apply(events)
+    await OutboxRepo(session).add(events)
+
+
+async def one_by_one(session: AsyncSession, fan_out: FanOut, order_ids: List) -> int:
+    for order_id in order_ids:
+        order = await OrderRepo(session).change_confirm_status(
+            order_id, ConfirmedStatus.YES
+        )
+        await apply(session, [OrderConfirmStatusChanged(order, CONFIRMED_BY)])
+        await fan_out.run(edits([order]))
+    return len(order_ids)
+
+
+async def bulk(session: AsyncSession, fan_out: FanOut, order_ids: List) -> int:
+    orders = await OrderRepo(session).change_confirm_status_bulk(
+        dto.PendingOrdersFilter(all_orders=True), ConfirmedStatus.YES
+    )
+    await apply(
+        session, [OrderConfirmStatusChanged(order, CONFIRMED_BY) for order in orders]
+    )
+    await fan_out.run(edits(orders))
+    return len(orders)
+
+
+async def measure(
+    connection: AsyncConnection, name: str, confirm: Confirm, order_ids: List
+) -> None:
+    """Every run is rolled back to savepoint, so all orders are pending again"""
+    fan_out = FanOut(
+        max_concurrent=FanOutConfig().max_concurrent,
+        max_retries=FanOutConfig().max_retries,
+    )
+    measured = []
+    for _ in range(REPEAT):
+        async with session_factory(connection)() as session:
+            savepoint = await session.begin_nested()
+            started = time.perf_counter()
+            confirmed = await confirm(session, fan_out, order_ids)
+            measured.append(time.perf_counter() - started)
+            await savepoint.rollback()
+        assert confirmed == len(order_ids)
+
+    print(f"{name:<40}{statistics.median(measured):>12.2f}")
+
+
+async def main():
+    async with bench_connection(load_bench_config()) as connection:
+        seeded = await seed_orders(
+            connection, ORDERS, LINES_PER_ORDER, MESSAGES_PER_ORDER
+        )
+
+        title = (
+            f"\n{ORDERS} pending orders x {MESSAGES_PER_ORDER} messages, "
+            f"telegram latency {TELEGRAM_LATENCY * 1000:.0f} ms"
+        )
+        if NETWORK_DELAY_MS:
+            title += f", network delay {NETWORK_DELAY_MS} ms"
+        print(title)
+        print(f"{'case':<40}{'median s':>12}")
+        await measure(connection, "one by one", one_by_one, seeded.order_ids)
+        await measure(connection, "bulk", bulk, seeded.order_ids)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
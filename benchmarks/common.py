@@ -0,0 +1,141 @@
+"""
+Helpers for benchmarks
+
+Benchmarks run against migrated database from env file (.env.test by default,
+can be changed with BENCH_ENV_FILE), all seeded data is rolled back at the end.
+Local database has almost zero round trip time, BENCH_NETWORK_DELAY_MS adds
+delay to every statement to make results closer to a remote database.
+"""
+import os
+import statistics
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable, List, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, create_async_engine
+from sqlalchemy.orm import clear_mappers, sessionmaker
+
+from app.config import Settings, load_config
+from app.infrastructure.database.db import make_connection_string
+from app.infrastructure.database.models import map_tables
+
+BenchCall = Callable[[AsyncSession], Awaitable]
+
+NETWORK_DELAY_MS = float(os.getenv("BENCH_NETWORK_DELAY_MS", 0))
+
+
+@dataclass(frozen=True)
+class Result:
+    name: str
+    queries: int
+    rows: int
+    median_ms: float
+    p95_ms: float
+
+
+def network_delay(conn, cursor, statement, parameters, context, executemany):
+    # connection is used by one benchmark at a time, so blocking sleep is fine
+    time.sleep(NETWORK_DELAY_MS / 1000)
+
+
+def load_bench_config() -> Settings:
+    return load_config(env_file=os.getenv("BENCH_ENV_FILE", ".env.test"))
+
+
+@asynccontextmanager
+async def bench_connection(config: Settings) -> AsyncIterator[AsyncConnection]:
+    """Connection inside outer transaction, it is rolled back on exit"""
+    clear_mappers()
+    map_tables()
+
+    engine = create_async_engine(make_connection_string(config.db))
+    try:
+        async with engine.connect() as connection:
+            if NETWORK_DELAY_MS:
+                event.listen(
+                    connection.sync_connection, "before_cursor_execute", network_delay
+                )
+            transaction = await connection.begin()
+            try:
+                yield connection
+            finally:
+                await transaction.rollback()
+    finally:
+        await engine.dispose()
+
+
+def session_factory(connection: AsyncConnection) -> sessionmaker:
+    return sessionmaker(
+        bind=connection,
+        expire_on_commit=False,
+        class_=AsyncSession,
+        future=True,
+        autoflush=False,
+    )
+
+
+async def fetched_rows(connection: AsyncConnection, call: BenchCall) -> Tuple[int, int]:
+    """Run call in new session and return count of executed queries and fetched rows"""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(connection.sync_connection, "before_cursor_execute", capture)
+    try:
+        async with session_factory(connection)() as session:
+            await call(session)
+    finally:
+        event.remove(connection.sync_connection, "before_cursor_execute", capture)
+
+    rows = 0
+    for statement, parameters in statements:
+        result = await connection.exec_driver_sql(statement, parameters)
+        rows += len(result.fetchall())
+
+    return len(statements), rows
+
+
+async def timings(
+    connection: AsyncConnection, call: BenchCall, repeat: int
+) -> List[float]:
+    """Run call in new session (empty identity map) every time, return ms"""
+    factory = session_factory(connection)
+    result = []
+    for _ in range(repeat):
+        async with factory() as session:
+            started = time.perf_counter()
+            await call(session)
+            result.append((time.perf_counter() - started) * 1000)
+    return result
+
+
+async def run(
+    connection: AsyncConnection, name: str, call: BenchCall, repeat: int = 50
+) -> Result:
+    queries, rows = await fetched_rows(connection, call)
+    # warm up statement caches and connection before measure
+    await timings(connection, call, repeat=3)
+    measured = sorted(await timings(connection, call, repeat=repeat))
+
+    return Result(
+        name=name,
+        queries=queries,
+        rows=rows,
+        median_ms=statistics.median(measured),
+        p95_ms=measured[int(len(measured) * 0.95) - 1],
+    )
+
+
+def print_results(title: str, results: List[Result]) -> None:
+    if NETWORK_DELAY_MS:
+        title += f", network delay {NETWORK_DELAY_MS} ms"
+    print(f"\n{title}")
+    print(f"{'case':<40}{'queries':>8}{'rows':>8}{'median ms':>12}{'p95 ms':>10}")
+    for result in results:
+        print(
+            f"{result.name:<40}{result.queries:>8}{result.rows:>8}"
+            f"{result.median_ms:>12.2f}{result.p95_ms:>10.2f}"
+        )
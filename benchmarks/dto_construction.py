@@ -0,0 +1,72 @@
+"""
+Order DTO construction from loaded ORM objects: validated vs trusted
+
+    python -m benchmarks.dto_construction
+
+Orders are loaded once, only conversion of ORM objects to DTOs is measured.
+"""
+import asyncio
+import statistics
+import time
+from typing import Any, Callable, List
+
+from pydantic import parse_obj_as
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from app.domain.order import dto
+from app.domain.order.models.order import Order
+from app.infrastructure.database.trusted_dto import trusted_list
+
+from .common import bench_connection, load_bench_config, session_factory
+from .seed import seed_orders
+
+ORDERS = 100
+LINES_PER_ORDER = (1, 10, 50)
+MESSAGES_PER_ORDER = 5
+REPEAT = 20
+
+
+def per_order_us(convert: Callable[[List[Any]], List[dto.Order]], orders) -> float:
+    timings = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        convert(orders)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) / len(orders) * 1_000_000
+
+
+async def main():
+    cases = {
+        "parse_obj_as": lambda orders: parse_obj_as(List[dto.Order], orders),
+        "trusted_list": lambda orders: trusted_list(dto.Order, orders),
+    }
+
+    print(f"{ORDERS} orders, {MESSAGES_PER_ORDER} messages per order")
+    print(f"{'lines':>8}" + "".join(f"{name + ' us':>18}" for name in cases))
+
+    for lines in LINES_PER_ORDER:
+        async with bench_connection(load_bench_config()) as connection:
+            await seed_orders(connection, ORDERS, lines, MESSAGES_PER_ORDER)
+
+            async with session_factory(connection)() as session:
+                result = await session.execute(
+                    select(Order).options(
+                        selectinload(Order.order_lines),
+                        selectinload(Order.order_messages),
+                    )
+                )
+                orders = result.scalars().all()
+
+                assert cases["parse_obj_as"](orders) == cases["trusted_list"](orders)
+                print(
+                    f"{lines:>8}"
+                    + "".join(
+                        f"{per_order_us(convert, orders):>18.1f}"
+                        for convert in cases.values()
+                    )
+                )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,83 @@
+"""
+Publishing many events: middleware chain built on every notify vs compiled
+
+    python -m benchmarks.observer_publish
+
+Handlers yield to event loop once, like handler awaiting something fast,
+so dispatch policies are compared too.
+"""
+import asyncio
+import statistics
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+from app.domain.base.events.event import Event
+from app.domain.base.events.observer import DispatchPolicy, Observer
+
+EVENTS = 10000
+HANDLERS = 3
+MIDDLEWARES = 2
+REPEAT = 10
+
+
+class Published(Event):
+    pass
+
+
+class RewrappingObserver(Observer):
+    """Observer before compiled chains, wraps handlers on every notify"""
+
+    async def notify(self, events: List[Event], data: Dict[str, Any]):
+        for event in events:
+            for handler in self.handlers.get(type(event), []):
+                wrapped_handler = self._wrap_middleware(self.middlewares, handler)
+                await wrapped_handler(event, data)
+
+
+async def handler(event: Event, data: Dict[str, Any]):
+    await asyncio.sleep(0)
+
+
+async def middleware(
+    handler: Callable[[Event, Dict[str, Any]], Awaitable[Any]],
+    event: Event,
+    data: Dict[str, Any],
+):
+    return await handler(event, data)
+
+
+def make_observer(observer: Observer, policy: DispatchPolicy) -> Observer:
+    for _ in range(MIDDLEWARES):
+        observer.middleware(middleware)
+    for _ in range(HANDLERS):
+        observer.register(Published, handler, policy)
+    return observer
+
+
+async def measure(observer: Observer) -> float:
+    events = [Published() for _ in range(EVENTS)]
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        await observer.notify(events, data={})
+        await observer.wait_background()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+async def main():
+    cases = [
+        ("rewrap on notify", RewrappingObserver(), DispatchPolicy.SEQUENTIAL),
+        ("compiled, sequential", Observer(), DispatchPolicy.SEQUENTIAL),
+        ("compiled, concurrent", Observer(), DispatchPolicy.CONCURRENT),
+        ("compiled, background", Observer(), DispatchPolicy.BACKGROUND),
+    ]
+
+    print(f"{EVENTS} events x {HANDLERS} handlers, {MIDDLEWARES} middlewares")
+    for name, observer, policy in cases:
+        elapsed = await measure(make_observer(observer, policy))
+        print(f"{name:<24}{elapsed * 1000:>10.2f} ms{EVENTS / elapsed:>12.0f} events/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
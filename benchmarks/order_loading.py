@@ -0,0 +1,89 @@
+"""
+Order loading strategies: previous global joined eager loads vs current readers
+
+History page is read from order summaries, order by id by ORM and Core readers.
+
+    python -m benchmarks.order_loading
+"""
+import asyncio
+from typing import List
+
+from pydantic import parse_obj_as
+from sqlalchemy import desc, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from app.domain.order import dto
+from app.domain.order.models.order import Order
+from app.infrastructure.database.repositories import (
+    CoreOrderReader,
+    OrderReader,
+    OrderSummaryReader,
+)
+
+from .common import bench_connection, load_bench_config, print_results, run
+from .seed import seed_orders
+
+ORDERS = 50
+LINES_PER_ORDER = 30
+MESSAGES_PER_ORDER = 10
+PAGE_LIMIT = 3
+
+
+async def joined_page(session: AsyncSession) -> List[dto.Order]:
+    query = (
+        select(Order)
+        .options(joinedload(Order.order_lines), joinedload(Order.order_messages))
+        .order_by(desc(Order.created_at), desc(Order.id))
+        .limit(PAGE_LIMIT)
+    )
+    result = await session.execute(query)
+    return parse_obj_as(List[dto.Order], result.unique().scalars().fetchall())
+
+
+async def summary_reader_page(session: AsyncSession) -> List[dto.OrderSummary]:
+    page = await OrderSummaryReader(session).get_all_orders(limit=PAGE_LIMIT)
+    return page.orders
+
+
+async def main():
+    async with bench_connection(load_bench_config()) as connection:
+        seeded = await seed_orders(
+            connection, ORDERS, LINES_PER_ORDER, MESSAGES_PER_ORDER
+        )
+        order_id = seeded.order_ids[0]
+
+        async def joined_order(session: AsyncSession) -> dto.Order:
+            order = await session.get(
+                Order,
+                order_id,
+                options=[
+                    joinedload(Order.order_lines),
+                    joinedload(Order.order_messages),
+                ],
+            )
+            return dto.Order.from_orm(order)
+
+        async def reader_order(session: AsyncSession) -> dto.Order:
+            return await OrderReader(session).order_by_id(order_id)
+
+        async def core_reader_order(session: AsyncSession) -> dto.Order:
+            return await CoreOrderReader(session).order_by_id(order_id)
+
+        results = [
+            await run(connection, "history page, joined lines+messages", joined_page),
+            await run(connection, "history page, summary reader", summary_reader_page),
+            await run(connection, "order by id, joined lines+messages", joined_order),
+            await run(connection, "order by id, reader", reader_order),
+            await run(connection, "order by id, core reader", core_reader_order),
+        ]
+
+    print_results(
+        f"{ORDERS} orders x {LINES_PER_ORDER} lines x {MESSAGES_PER_ORDER} messages, "
+        f"page limit {PAGE_LIMIT}",
+        results,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,106 @@
+"""
+Orders report: aggregate order lines vs read statistics rollup
+
+    python -m benchmarks.order_report
+"""
+import asyncio
+from datetime import date, timedelta
+
+from sqlalchemy import BIGINT, cast, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.order import dto
+from app.infrastructure.database.models.goods import goods_table
+from app.infrastructure.database.models.market import market_table
+from app.infrastructure.database.models.order import order_line_table, order_table
+from app.infrastructure.database.models.order_stats import order_stats_table
+from app.infrastructure.database.repositories import OrderStatsReader
+
+from .common import bench_connection, load_bench_config, print_results, run
+from .seed import seed_orders
+
+# one order a minute, about two weeks of orders
+ORDERS = 20000
+LINES_PER_ORDER = 5
+START = date(2022, 1, 1)
+END = START + timedelta(days=6)
+
+day = func.date(order_table.c.created_at)
+
+
+async def scan_order_lines(session: AsyncSession) -> dto.OrderReport:
+    query = (
+        select(
+            market_table.c.id.label("market_id"),
+            market_table.c.name.label("market_name"),
+            goods_table.c.id.label("goods_id"),
+            goods_table.c.name.label("goods_name"),
+            goods_table.c.sku.label("goods_sku"),
+            order_table.c.confirmed,
+            func.count(order_table.c.id.distinct()).label("order_count"),
+            cast(func.sum(order_line_table.c.quantity), BIGINT).label("quantity"),
+        )
+        .join_from(order_table, order_line_table)
+        .join(market_table, order_table.c.recipient_market_id == market_table.c.id)
+        .join(goods_table, order_line_table.c.goods_id == goods_table.c.id)
+        .where(day.between(START, END))
+        .group_by(market_table.c.id, goods_table.c.id, order_table.c.confirmed)
+        .order_by(market_table.c.name, goods_table.c.name, order_table.c.confirmed)
+    )
+    result = await session.execute(query)
+    return dto.OrderReport.construct(
+        start=START,
+        end=END,
+        rows=[dto.OrderStatsRow.construct(**row) for row in result.mappings()],
+    )
+
+
+async def read_rollup(session: AsyncSession) -> dto.OrderReport:
+    return await OrderStatsReader(session).report(start=START, end=END)
+
+
+async def main():
+    async with bench_connection(load_bench_config()) as connection:
+        await seed_orders(connection, ORDERS, LINES_PER_ORDER, messages_per_order=0)
+        # rollup is filled the same way as by migration
+        await connection.execute(
+            insert(order_stats_table).from_select(
+                [
+                    "day",
+                    "market_id",
+                    "goods_id",
+                    "confirmed",
+                    "order_count",
+                    "quantity",
+                ],
+                select(
+                    day,
+                    order_table.c.recipient_market_id,
+                    order_line_table.c.goods_id,
+                    order_table.c.confirmed,
+                    func.count(order_table.c.id.distinct()),
+                    func.sum(order_line_table.c.quantity),
+                )
+                .join_from(order_table, order_line_table)
+                .group_by(
+                    day,
+                    order_table.c.recipient_market_id,
+                    order_line_table.c.goods_id,
+                    order_table.c.confirmed,
+                ),
+            )
+        )
+        await connection.exec_driver_sql("ANALYZE order_stats")
+
+        results = [
+            await run(connection, "aggregate order lines", scan_order_lines),
+            await run(connection, "read rollup", read_rollup),
+        ]
+
+    print_results(
+        f"{ORDERS} orders x {LINES_PER_ORDER} lines, report for 7 days", results
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,61 @@
+"""
+History window render: separate count and page queries vs page with total
+
+    python -m benchmarks.orders_page
+"""
+import asyncio
+
+from sqlalchemy import desc, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.order import dto
+from app.infrastructure.database.models.order_summary import order_summary_table
+from app.infrastructure.database.repositories import OrderSummaryReader
+from app.infrastructure.database.repositories.order_summary import summary_columns
+from app.infrastructure.database.trusted_dto import trusted_list
+
+from .common import bench_connection, load_bench_config, print_results, run
+from .seed import seed_orders
+
+ORDERS = 5000
+LINES_PER_ORDER = 3
+PAGE_LIMIT = 3
+
+
+async def count_then_page(session: AsyncSession) -> dto.OrderSummariesPage:
+    total = await OrderSummaryReader(session).get_all_orders_count()
+
+    query = (
+        select(*summary_columns)
+        .order_by(
+            desc(order_summary_table.c.created_at), desc(order_summary_table.c.order_id)
+        )
+        .limit(PAGE_LIMIT)
+    )
+    result = await session.execute(query)
+    orders = trusted_list(dto.OrderSummary, result.fetchall())
+
+    return dto.OrderSummariesPage(orders=orders, total=total)
+
+
+async def page_with_total(session: AsyncSession) -> dto.OrderSummariesPage:
+    return await OrderSummaryReader(session).get_all_orders(limit=PAGE_LIMIT)
+
+
+async def main():
+    async with bench_connection(load_bench_config()) as connection:
+        await seed_orders(connection, ORDERS, LINES_PER_ORDER, messages_per_order=0)
+
+        results = [
+            await run(connection, "count query + page query", count_then_page),
+            await run(connection, "page with total", page_with_total),
+        ]
+
+    print_results(
+        f"{ORDERS} orders x {LINES_PER_ORDER} lines, page limit {PAGE_LIMIT}",
+        results,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,130 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import List
+from uuid import UUID, uuid4
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.domain.goods.models.goods_type import GoodsType
+from app.domain.order.value_objects import ConfirmedStatus
+from app.infrastructure.database.models.goods import goods_table
+from app.infrastructure.database.models.market import market_table
+from app.infrastructure.database.models.order import (
+    order_line_table,
+    order_message_table,
+    order_table,
+)
+from app.infrastructure.database.models.order_summary import order_summary_table
+from app.infrastructure.database.models.user import user_table
+
+BENCH_USER_ID = -1
+
+
+@dataclass(frozen=True)
+class SeededOrders:
+    user_id: int
+    market_id: UUID
+    order_ids: List[UUID]
+
+
+async def seed_orders(
+    connection: AsyncConnection,
+    orders: int,
+    lines_per_order: int,
+    messages_per_order: int,
+) -> SeededOrders:
+    """Insert orders of one user and their summaries, every line has its own goods"""
+    market_id = uuid4()
+    await connection.execute(
+        insert(user_table), [{"id": BENCH_USER_ID, "name": "Benchmark"}]
+    )
+    await connection.execute(
+        insert(market_table),
+        [{"id": market_id, "name": f"Benchmark {market_id}", "is_active": True}],
+    )
+
+    goods = [
+        {
+            "id": uuid4(),
+            "name": f"Goods {i}",
+            "type": GoodsType.GOODS,
+            "sku": f"{i:08}",
+            "is_active": True,
+        }
+        for i in range(lines_per_order)
+    ]
+    await connection.execute(insert(goods_table), goods)
+
+    created_at = datetime(2022, 1, 1)
+    order_rows = [
+        {
+            "id": uuid4(),
+            "creator_id": BENCH_USER_ID,
+            "recipient_market_id": market_id,
+            "commentary": "Benchmark order",
+            "created_at": created_at + timedelta(minutes=i),
+            "confirmed": ConfirmedStatus.NOT_PROCESSED,
+        }
+        for i in range(orders)
+    ]
+    await connection.execute(insert(order_table), order_rows)
+
+    await connection.execute(
+        insert(order_line_table),
+        [
+            {
+                "order_id": order["id"],
+                "goods_id": item["id"],
+                "goods_type": item["type"],
+                "quantity": 1,
+            }
+            for order in order_rows
+            for item in goods
+        ],
+    )
+    if messages_per_order:
+        await connection.execute(
+            insert(order_message_table),
+            [
+                {"order_id": order["id"], "message_id": i, "chat_id": i}
+                for order in order_rows
+                for i in range(messages_per_order)
+            ],
+        )
+
+    lines = [
+        {"goods_name": item["name"], "goods_sku": item["sku"], "quantity": 1}
+        for item in goods
+    ]
+    await connection.execute(
+        insert(order_summary_table),
+        [
+            {
+                "order_id": order["id"],
+                "created_at": order["created_at"],
+                "creator_id": BENCH_USER_ID,
+                "creator_name": "Benchmark",
+                "recipient_market_id": market_id,
+                "recipient_market_name": f"Benchmark {market_id}",
+                "commentary": order["commentary"],
+                "confirmed": order["confirmed"],
+                "line_count": len(lines),
+                "lines_summary": "\n".join(
+                    f"{line['goods_name']} {line['goods_sku']} x 1" for line in lines
+                ),
+                "lines": lines,
+            }
+            for order in order_rows
+        ],
+    )
+
+    await connection.exec_driver_sql(
+        'ANALYZE "order", order_line, order_message, goods, order_summary'
+    )
+
+    return SeededOrders(
+        user_id=BENCH_USER_ID,
+        market_id=market_id,
+        order_ids=[order["id"] for order in order_rows],
+    )
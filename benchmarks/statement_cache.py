@@ -0,0 +1,184 @@
+"""
+Hot reader queries: statement built on every call vs prebuilt statement
+
+Python CPU time is measured, database time is mostly excluded from it,
+so the difference is time of building statement and generating its cache key.
+
+    python -m benchmarks.statement_cache
+"""
+import asyncio
+import statistics
+import time
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import List
+from uuid import UUID
+
+from sqlalchemy import BIGINT, cast, func, select
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.domain.goods import dto as goods_dto
+from app.domain.order import dto
+from app.infrastructure.database.models.goods import goods_table
+from app.infrastructure.database.models.market import market_table
+from app.infrastructure.database.models.order import order_table
+from app.infrastructure.database.models.order_stats import order_stats_table
+from app.infrastructure.database.models.order_summary import order_summary_table
+from app.infrastructure.database.repositories import (
+    CoreOrderReader,
+    GoodsReader,
+    OrderStatsReader,
+    OrderSummaryReader,
+)
+from app.infrastructure.database.repositories.order_rows import (
+    order_columns,
+    order_messages,
+    orders_from,
+    row_to_order,
+)
+from app.infrastructure.database.trusted_dto import trusted_list
+
+from .common import BenchCall, bench_connection, load_bench_config, session_factory
+from .seed import BENCH_USER_ID, seed_orders
+
+ORDERS = 100
+LINES_PER_ORDER = 5
+REPEAT = 2000
+START = date(2022, 1, 1)
+END = START + timedelta(days=6)
+
+
+@dataclass(frozen=True)
+class CpuResult:
+    name: str
+    cpu_us: float
+    median_us: float
+
+
+async def build_goods_in_root(session) -> List[goods_dto.Goods]:
+    query = (
+        select(
+            goods_table.c.id,
+            goods_table.c.name,
+            goods_table.c.type,
+            goods_table.c.parent_id,
+            goods_table.c.sku,
+            goods_table.c.is_active,
+        )
+        .where(goods_table.c.parent_id.is_(None), goods_table.c.is_active.is_(True))
+        .order_by(goods_table.c.type.desc(), goods_table.c.name)
+    )
+    return trusted_list(goods_dto.Goods, await session.execute(query))
+
+
+def build_order_by_id(order_id: UUID) -> BenchCall:
+    async def call(session) -> dto.Order:
+        query = (
+            select(*order_columns, order_messages.label("order_messages"))
+            .select_from(orders_from)
+            .where(order_table.c.id == order_id)
+        )
+        row = (await session.execute(query)).one()
+        return row_to_order(row, row.order_messages)
+
+    return call
+
+
+async def build_user_orders_count(session) -> int:
+    query = (
+        select(func.count())
+        .select_from(order_summary_table)
+        .where(order_summary_table.c.creator_id == BENCH_USER_ID)
+    )
+    return (await session.execute(query)).scalar_one()
+
+
+async def build_report(session) -> List[dto.OrderStatsRow]:
+    stats = order_stats_table
+    order_count = func.sum(stats.c.order_count)
+    query = (
+        select(
+            market_table.c.id.label("market_id"),
+            market_table.c.name.label("market_name"),
+            goods_table.c.id.label("goods_id"),
+            goods_table.c.name.label("goods_name"),
+            goods_table.c.sku.label("goods_sku"),
+            stats.c.confirmed,
+            order_count.label("order_count"),
+            cast(func.sum(stats.c.quantity), BIGINT).label("quantity"),
+        )
+        .join_from(stats, market_table, stats.c.market_id == market_table.c.id)
+        .join(goods_table, stats.c.goods_id == goods_table.c.id)
+        .where(stats.c.day.between(START, END))
+        .group_by(market_table.c.id, goods_table.c.id, stats.c.confirmed)
+        .having(order_count > 0)
+        .order_by(market_table.c.name, goods_table.c.name, stats.c.confirmed)
+    )
+    return trusted_list(dto.OrderStatsRow, await session.execute(query))
+
+
+async def cpu_run(connection: AsyncConnection, name: str, call: BenchCall) -> CpuResult:
+    """Run call REPEAT times in one session, return CPU and wall time per call"""
+    async with session_factory(connection)() as session:
+        # warm up statement caches
+        for _ in range(10):
+            await call(session)
+
+        wall = []
+        cpu_started = time.process_time()
+        for _ in range(REPEAT):
+            started = time.perf_counter()
+            await call(session)
+            wall.append(time.perf_counter() - started)
+        cpu = time.process_time() - cpu_started
+
+    return CpuResult(
+        name=name,
+        cpu_us=cpu / REPEAT * 1_000_000,
+        median_us=statistics.median(wall) * 1_000_000,
+    )
+
+
+async def main():
+    async with bench_connection(load_bench_config()) as connection:
+        seeded = await seed_orders(
+            connection, ORDERS, LINES_PER_ORDER, messages_per_order=1
+        )
+        order_id = seeded.order_ids[0]
+
+        cases = [
+            (
+                "goods in root",
+                build_goods_in_root,
+                lambda s: GoodsReader(s).goods_in_folder(None, only_active=True),
+            ),
+            (
+                "order by id",
+                build_order_by_id(order_id),
+                lambda s: CoreOrderReader(s).order_by_id(order_id),
+            ),
+            (
+                "user orders count",
+                build_user_orders_count,
+                lambda s: OrderSummaryReader(s).get_user_orders_count(BENCH_USER_ID),
+            ),
+            (
+                "report",
+                build_report,
+                lambda s: OrderStatsReader(s).report(START, END),
+            ),
+        ]
+
+        results = []
+        for name, built, prebuilt in cases:
+            results.append(await cpu_run(connection, f"{name}, built", built))
+            results.append(await cpu_run(connection, f"{name}, prebuilt", prebuilt))
+
+    print(f"\nPython CPU time per query, {REPEAT} calls")
+    print(f"{'case':<40}{'cpu us':>10}{'median us':>12}")
+    for result in results:
+        print(f"{result.name:<40}{result.cpu_us:>10.1f}{result.median_us:>12.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
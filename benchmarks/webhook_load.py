@@ -0,0 +1,112 @@
+"""
+Webhook load generator: updates/s and answer latency for concurrency caps
+
+    python -m benchmarks.webhook_load
+
+Updates are posted to in-process webhook server with a handler that waits
+HANDLER_DELAY_MS like a handler doing database and telegram requests. Cap 1
+is close to processing updates one by one as polling with sequential handling.
+Set WEBHOOK_LOAD_URL to post the same updates to an already running server.
+"""
+import asyncio
+import os
+import statistics
+import time
+from typing import List, Optional
+
+from aiogram import Bot, Dispatcher
+from aiogram.types import Message
+from aiohttp import ClientSession, web
+from aiohttp.test_utils import TestServer
+
+from app.tgbot.webhook import BoundedRequestHandler
+
+UPDATES = 2000
+CLIENT_CONCURRENCY = 50
+HANDLER_DELAY_MS = 20
+CAPS = (1, 10, 100)
+
+
+def message_update(update_id: int) -> dict:
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "date": int(time.time()),
+            "chat": {"id": 1, "type": "private"},
+            "from": {"id": 1, "is_bot": False, "first_name": "Load"},
+            "text": "ping",
+        },
+    }
+
+
+async def post_updates(url: str) -> List[float]:
+    """Post updates with CLIENT_CONCURRENCY connections, return latencies"""
+    update_ids = iter(range(UPDATES))
+    latencies: List[float] = []
+
+    async def worker(session: ClientSession) -> None:
+        for update_id in update_ids:
+            start = time.perf_counter()
+            async with session.post(url, json=message_update(update_id)) as response:
+                response.raise_for_status()
+            latencies.append(time.perf_counter() - start)
+
+    async with ClientSession() as session:
+        await asyncio.gather(*(worker(session) for _ in range(CLIENT_CONCURRENCY)))
+    return latencies
+
+
+async def run_cap(max_concurrent_updates: int) -> None:
+    dp = Dispatcher()
+    processed = 0
+    all_processed = asyncio.Event()
+
+    @dp.message()
+    async def handler(message: Message):
+        nonlocal processed
+        await asyncio.sleep(HANDLER_DELAY_MS / 1000)
+        processed += 1
+        if processed == UPDATES:
+            all_processed.set()
+
+    app = web.Application()
+    BoundedRequestHandler(
+        dispatcher=dp, bot=Bot("42:LOAD"), max_concurrent_updates=max_concurrent_updates
+    ).register(app, path="/webhook")
+
+    async with TestServer(app) as server:
+        start = time.perf_counter()
+        latencies = await post_updates(str(server.make_url("/webhook")))
+        await all_processed.wait()
+        elapsed = time.perf_counter() - start
+
+    print_result(f"cap {max_concurrent_updates}", elapsed, latencies)
+
+
+def print_result(name: str, elapsed: float, latencies: List[float]) -> None:
+    latencies_ms = sorted(latency * 1000 for latency in latencies)
+    p95 = latencies_ms[int(len(latencies_ms) * 0.95) - 1]
+    print(
+        f"{name:<24}{UPDATES / elapsed:>12.0f} updates/s"
+        f"{statistics.median(latencies_ms):>10.2f} ms p50{p95:>10.2f} ms p95"
+    )
+
+
+async def main(url: Optional[str] = os.getenv("WEBHOOK_LOAD_URL")):
+    print(
+        f"{UPDATES} updates, {CLIENT_CONCURRENCY} client connections, "
+        f"handler {HANDLER_DELAY_MS} ms"
+    )
+    if url:
+        start = time.perf_counter()
+        latencies = await post_updates(url)
+        print_result(url, time.perf_counter() - start, latencies)
+        return
+
+    for cap in CAPS:
+        await run_cap(cap)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+
+from app.domain.base.events.event import Event
+from app.domain.base.events.observer import DispatchPolicy, Observer
+
+
+class Created(Event):
+    pass
+
+
+async def test_middlewares_wrap_handlers_registered_before_and_after():
+    observer = Observer()
+    calls = []
+
+    async def first(event, data):
+        calls.append(("first", data["middleware"]))
+
+    async def second(event, data):
+        calls.append(("second", data["middleware"]))
+
+    observer.register(Created, first)
+
+    @observer.middleware
+    async def middleware(handler, event, data):
+        data["middleware"] = True
+        return await handler(event, data)
+
+    observer.register(Created, second)
+
+    await observer.notify([Created()], data={})
+
+    assert calls == [("first", True), ("second", True)]
+
+
+async def test_sequential_error_goes_to_publisher():
+    observer = Observer()
+    calls = []
+
+    async def failing(event, data):
+        raise RuntimeError()
+
+    async def handler(event, data):
+        calls.append(event)
+
+    observer.register(Created, failing)
+    observer.register(Created, handler)
+
+    with pytest.raises(RuntimeError):
+        await observer.notify([Created()], data={})
+    assert calls == []
+
+
+async def test_concurrent_handlers_are_isolated():
+    observer = Observer()
+    started = []
+    both_started = asyncio.Event()
+
+    async def handler(event, data):
+        data["uow"] = object()
+        started.append(data["uow"])
+        if len(started) == 2:
+            both_started.set()
+        await both_started.wait()
+
+    async def failing(event, data):
+        raise RuntimeError()
+
+    observer.register(Created, handler, DispatchPolicy.CONCURRENT)
+    observer.register(Created, failing)
+    observer.register(Created, handler)
+
+    data = {}
+    await asyncio.wait_for(observer.notify([Created()], data=data), timeout=1)
+
+    assert len(started) == 2
+    assert data == {}
+
+
+async def test_background_handlers_dont_block_publisher():
+    observer = Observer()
+    release = asyncio.Event()
+    done = []
+
+    async def handler(event, data):
+        await release.wait()
+        done.append(event)
+
+    observer.register(Created, handler, DispatchPolicy.BACKGROUND)
+
+    event = Created()
+    await observer.notify([event], data={})
+    assert done == []
+
+    release.set()
+    await observer.wait_background()
+    assert done == [event]
@@ -8,6 +8,11 @@ from app.infrastructure.database.repositories import (
     MarketRepo,
     OrderReader,
     OrderRepo,
+    OrderStatsReader,
+    OrderStatsRepo,
+    OrderSummaryReader,
+    OrderSummaryRepo,
+    OutboxRepo,
     UserReader,
     UserRepo,
 )
@@ -18,6 +23,11 @@ __all__ = [
     "goods_repo",
     "order_repo",
     "order_reader",
+    "order_summary_repo",
+    "order_summary_reader",
+    "order_stats_repo",
+    "order_stats_reader",
+    "outbox_repo",
     "market_repo",
     "market_reader",
     "user_repo",
@@ -45,6 +55,31 @@ def order_reader(db_session):
     return OrderReader(session=db_session)
 
 
+@fixture
+def order_summary_repo(db_session):
+    return OrderSummaryRepo(session=db_session)
+
+
+@fixture
+def order_summary_reader(db_session):
+    return OrderSummaryReader(session=db_session)
+
+
+@fixture
+def order_stats_repo(db_session):
+    return OrderStatsRepo(session=db_session)
+
+
+@fixture
+def order_stats_reader(db_session):
+    return OrderStatsReader(session=db_session)
+
+
+@fixture
+def outbox_repo(db_session):
+    return OutboxRepo(session=db_session)
+
+
 @fixture
 def market_repo(db_session):
     return MarketRepo(session=db_session)
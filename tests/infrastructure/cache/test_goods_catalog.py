@@ -0,0 +1,87 @@
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+from app.domain.goods.exceptions.goods import GoodsNotExists
+from app.domain.goods.models.goods import Goods
+from app.domain.goods.models.goods_type import GoodsType
+from app.infrastructure.cache import GoodsCatalog, GoodsCatalogReader
+from app.infrastructure.database.repositories import GoodsReader, GoodsRepo
+from tests.infrastructure.cache.test_ttl import Clock
+
+
+@pytest.fixture
+async def catalog_goods(goods_repo: GoodsRepo) -> Goods:
+    folder = await goods_repo.add_goods(
+        Goods.create(type=GoodsType.FOLDER, name="B-Folder")
+    )
+    await goods_repo.add_goods(Goods.create(type=GoodsType.FOLDER, name="C-Folder"))
+    await goods_repo.add_goods(
+        Goods.create(type=GoodsType.GOODS, name="A-Goods", sku="A-SKU")
+    )
+    await goods_repo.add_goods(
+        Goods.create(type=GoodsType.GOODS, name="b-goods", sku="B-SKU", is_active=False)
+    )
+    await goods_repo.add_goods(
+        Goods.create(type=GoodsType.GOODS, name="Child", sku="C-SKU", parent=folder)
+    )
+    await goods_repo.session.commit()
+    return folder
+
+
+async def test_reader_matches_database_reader(
+    db_session, goods_reader: GoodsReader, catalog_goods: Goods
+):
+    catalog = GoodsCatalog(session_factory=lambda: db_session, max_age=60)
+    catalog_reader = GoodsCatalogReader(catalog)
+
+    for parent_id in (None, catalog_goods.id):
+        for only_active in (True, False):
+            assert await catalog_reader.goods_in_folder(
+                parent_id, only_active
+            ) == await goods_reader.goods_in_folder(parent_id, only_active)
+
+    assert await catalog_reader.goods_by_id(
+        catalog_goods.id
+    ) == await goods_reader.goods_by_id(catalog_goods.id)
+
+    with pytest.raises(GoodsNotExists):
+        await catalog_reader.goods_by_id(uuid4())
+
+
+async def test_snapshot_is_loaded_once_and_reloaded_when_old(
+    db_session, catalog_goods: Goods
+):
+    clock = Clock()
+    session_factory = Mock(return_value=db_session)
+    catalog = GoodsCatalog(session_factory=session_factory, max_age=60, clock=clock)
+
+    snapshot = await catalog.snapshot()
+    clock.now = 59
+    assert await catalog.snapshot() is snapshot
+    session_factory.assert_called_once()
+
+    clock.now = 60
+    reloaded = await catalog.snapshot()
+    assert reloaded.version == snapshot.version + 1
+    assert session_factory.call_count == 2
+
+
+async def test_refresh_shows_new_goods(
+    db_session, goods_repo: GoodsRepo, catalog_goods: Goods
+):
+    catalog = GoodsCatalog(session_factory=lambda: db_session, max_age=60)
+    reader = GoodsCatalogReader(catalog)
+    assert len(await reader.goods_in_folder(catalog_goods.id, only_active=False)) == 1
+
+    await goods_repo.add_goods(
+        Goods.create(
+            type=GoodsType.GOODS, name="New", sku="N-SKU", parent=catalog_goods
+        )
+    )
+    await goods_repo.session.commit()
+    assert len(await reader.goods_in_folder(catalog_goods.id, only_active=False)) == 1
+
+    await catalog.refresh()
+    assert len(await reader.goods_in_folder(catalog_goods.id, only_active=False)) == 2
@@ -0,0 +1,66 @@
+import pytest
+
+from app.infrastructure.cache import IdentityMap, IdentityMapStats, MemoizedReader
+
+
+class Reader:
+    def __init__(self):
+        self.calls = []
+
+    async def item_by_id(self, item_id: int) -> dict:
+        self.calls.append(item_id)
+        if item_id < 0:
+            raise LookupError()
+        return {"id": item_id}
+
+    async def all_items(self) -> list:
+        self.calls.append("all")
+        return []
+
+
+async def test_repeated_reads_are_deduped():
+    stats = IdentityMapStats()
+    reader = Reader()
+    memoized = MemoizedReader(reader, IdentityMap(stats), ("item_by_id",))
+
+    first = await memoized.item_by_id(1)
+    assert await memoized.item_by_id(1) is first
+    assert await memoized.item_by_id(item_id=1) == first
+    await memoized.item_by_id(2)
+
+    assert reader.calls == [1, 1, 2]
+    assert stats.hits == 1
+    assert stats.misses == 3
+
+
+async def test_not_listed_methods_and_errors_are_not_remembered():
+    stats = IdentityMapStats()
+    reader = Reader()
+    memoized = MemoizedReader(reader, IdentityMap(stats), ("item_by_id",))
+
+    await memoized.all_items()
+    await memoized.all_items()
+    for _ in range(2):
+        with pytest.raises(LookupError):
+            await memoized.item_by_id(-1)
+
+    assert reader.calls == ["all", "all", -1, -1]
+    assert stats.hits == 0
+
+
+async def test_stats_are_shared_and_clear_forgets_entries():
+    stats = IdentityMapStats()
+    reader = Reader()
+    first_update = MemoizedReader(reader, IdentityMap(stats), ("item_by_id",))
+    identity_map = IdentityMap(stats)
+    second_update = MemoizedReader(reader, identity_map, ("item_by_id",))
+
+    await first_update.item_by_id(1)
+    await second_update.item_by_id(1)
+    await second_update.item_by_id(1)
+    identity_map.clear()
+    await second_update.item_by_id(1)
+
+    assert reader.calls == [1, 1, 1]
+    assert stats.hits == 1
+    assert stats.saved_ratio == 0.25
@@ -0,0 +1,59 @@
+from app.infrastructure.cache import MISSING, TTLCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_set_and_stats():
+    cache = TTLCache(ttl=10, max_size=10)
+
+    assert cache.get(1) is MISSING
+    cache.set(1, None)
+    assert cache.get(1) is None
+
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.hit_ratio == 0.5
+
+
+def test_entry_expires():
+    clock = Clock()
+    cache = TTLCache(ttl=10, max_size=10, clock=clock)
+    cache.set(1, "user")
+
+    clock.now = 9.9
+    assert cache.get(1) == "user"
+
+    clock.now = 10
+    assert cache.get(1) is MISSING
+    assert len(cache) == 0
+
+
+def test_least_recently_used_is_evicted():
+    cache = TTLCache(ttl=10, max_size=2)
+    cache.set(1, "first")
+    cache.set(2, "second")
+    cache.get(1)
+
+    cache.set(3, "third")
+
+    assert cache.get(2) is MISSING
+    assert cache.get(1) == "first"
+    assert cache.get(3) == "third"
+    assert cache.stats.evictions == 1
+
+
+def test_invalidate():
+    cache = TTLCache(ttl=10, max_size=10)
+    cache.set(1, "first")
+    cache.set(2, "second")
+
+    cache.invalidate(1, 2, 3)
+
+    assert len(cache) == 0
+    assert cache.stats.invalidations == 2
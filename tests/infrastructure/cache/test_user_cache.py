@@ -0,0 +1,82 @@
+from app.domain.access_levels.models.access_level import LevelName
+from app.domain.access_levels.models.helper import name_to_access_levels
+from app.domain.user.models.user import TelegramUser
+from app.infrastructure.cache import UserCache
+from app.infrastructure.database.repositories import UserRepo
+from tests.infrastructure.cache.test_ttl import Clock
+
+
+def make_cache(db_session, clock: Clock) -> UserCache:
+    return UserCache(
+        session_factory=lambda: db_session,
+        ttl=60,
+        max_size=10,
+        check_interval=5,
+        clock=clock,
+    )
+
+
+def level_names(user) -> list:
+    return [level.name for level in user.access_levels]
+
+
+async def test_unknown_user_is_not_cached(db_session, user_repo: UserRepo):
+    cache = make_cache(db_session, Clock())
+
+    assert await cache.get(1) is None
+
+    await user_repo.add_user(
+        TelegramUser.create(
+            id=1, name="User", access_levels=name_to_access_levels([LevelName.USER])
+        )
+    )
+    await db_session.commit()
+
+    # added by other process, nothing was invalidated in this one
+    user = await cache.get(1)
+    assert user is not None
+    assert user.name == "User"
+
+
+async def test_changes_of_other_process_are_seen_after_check_interval(
+    db_session, user_repo: UserRepo
+):
+    clock = Clock()
+    cache = make_cache(db_session, clock)
+    await user_repo.add_user(
+        TelegramUser.create(
+            id=1,
+            name="User",
+            access_levels=name_to_access_levels([LevelName.CONFIRMATION]),
+        )
+    )
+    await db_session.commit()
+
+    assert level_names(await cache.get(1)) == [LevelName.CONFIRMATION]
+
+    user = await user_repo.user_by_id(1)
+    user.access_levels = name_to_access_levels([LevelName.BLOCKED])
+    await user_repo.edit_user(user)
+    await db_session.commit()
+
+    clock.now = 4.9
+    assert level_names(await cache.get(1)) == [LevelName.CONFIRMATION]
+    clock.now = 5
+    assert level_names(await cache.get(1)) == [LevelName.BLOCKED]
+
+
+async def test_invalidated_user_is_reloaded(db_session, user_repo: UserRepo):
+    cache = make_cache(db_session, Clock())
+    await user_repo.add_user(
+        TelegramUser.create(
+            id=1, name="User", access_levels=name_to_access_levels([LevelName.USER])
+        )
+    )
+    await db_session.commit()
+    await cache.get(1)
+
+    await user_repo.delete_user(1)
+    await db_session.commit()
+    cache.invalidate(1)
+
+    assert await cache.get(1) is None
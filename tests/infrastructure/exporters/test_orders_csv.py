@@ -0,0 +1,79 @@
+import csv
+import gzip
+import zipfile
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from app.domain.order.dto import OrderExportRow
+from app.domain.order.value_objects import ConfirmedStatus
+from app.infrastructure.exporters.orders_csv import (
+    HEADER,
+    Compression,
+    export_orders_to_csv,
+)
+
+
+def make_row(quantity: int) -> OrderExportRow:
+    return OrderExportRow(
+        order_id=uuid4(),
+        creator_id=1,
+        creator_name="User",
+        recipient_market_id=uuid4(),
+        recipient_market_name="Ukraine",
+        goods_name="Goods",
+        goods_sku="SKU",
+        quantity=quantity,
+        commentary="commentary",
+        created_at=datetime(2022, 1, 1),
+        confirmed=ConfirmedStatus.NOT_PROCESSED,
+    )
+
+
+async def chunks_of_rows(chunks_count: int, chunk_size: int):
+    for chunk in range(chunks_count):
+        yield [make_row(chunk * chunk_size + i) for i in range(chunk_size)]
+
+
+def read_csv(text: str) -> list[list[str]]:
+    return list(csv.reader(text.splitlines(), delimiter="\t"))
+
+
+@pytest.mark.parametrize("encoding", ["utf-16", "utf-8-sig"])
+async def test_export_orders_to_csv(tmp_path, encoding):
+    path = await export_orders_to_csv(
+        chunks_of_rows(3, 10), tmp_path, "orders", encoding=encoding
+    )
+
+    assert path == tmp_path / "orders.csv"
+    rows = read_csv(path.read_text(encoding=encoding))
+    assert rows[0] == HEADER
+    assert [row[7] for row in rows[1:]] == [str(i) for i in range(30)]
+
+
+async def test_export_orders_to_csv_gzip(tmp_path):
+    path = await export_orders_to_csv(
+        chunks_of_rows(2, 5),
+        tmp_path,
+        "orders",
+        encoding="utf-8-sig",
+        compression=Compression.GZIP,
+    )
+
+    assert path == tmp_path / "orders.csv.gz"
+    with gzip.open(path, "rt", encoding="utf-8-sig") as file:
+        rows = read_csv(file.read())
+    assert len(rows) == 11
+
+
+async def test_export_orders_to_csv_zip(tmp_path):
+    path = await export_orders_to_csv(
+        chunks_of_rows(2, 5), tmp_path, "orders", compression=Compression.ZIP
+    )
+
+    assert path == tmp_path / "orders.csv.zip"
+    with zipfile.ZipFile(path) as archive:
+        rows = read_csv(archive.read("orders.csv").decode("utf-16"))
+    assert rows[0] == HEADER
+    assert len(rows) == 11
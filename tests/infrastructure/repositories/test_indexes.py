@@ -0,0 +1,134 @@
+from datetime import datetime
+from uuid import UUID
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.order.dto import OrderCursor
+from app.infrastructure.database.repositories import OrderReader, UserReader
+from tests.infrastructure.repositories.conftest import OrderWithRelatedData
+
+CURSOR = OrderCursor(
+    created_at=datetime(2022, 1, 1), id=UUID("00000000-0000-0000-0000-000000000000")
+)
+
+
+async def explain_reader_call(session: AsyncSession, reader_call) -> str:
+    """Run reader call and return plans of all statements it executed"""
+    connection = await session.connection()
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(connection.sync_connection, "before_cursor_execute", capture)
+    try:
+        await reader_call()
+    finally:
+        event.remove(connection.sync_connection, "before_cursor_execute", capture)
+
+    # tables are almost empty, so force planner to pick an index if it can
+    await connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+
+    plans = []
+    for statement, parameters in statements:
+        result = await connection.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+        plans.extend(row[0] for row in result)
+
+    return "\n".join(plans)
+
+
+@pytest.mark.parametrize(
+    "reader, method, kwargs, index_name",
+    [
+        (
+            "order_summary_reader",
+            "get_user_orders",
+            {"user_id": 1, "limit": 2},
+            "ix_order_summary_creator_id_created_at",
+        ),
+        (
+            "order_summary_reader",
+            "get_user_orders",
+            {"user_id": 1, "limit": 2, "after": CURSOR},
+            "ix_order_summary_creator_id_created_at",
+        ),
+        (
+            "order_summary_reader",
+            "get_user_orders_count",
+            {"user_id": 1},
+            "ix_order_summary_creator_id_created_at",
+        ),
+        (
+            "order_summary_reader",
+            "get_orders_for_confirmation",
+            {"limit": 1, "after": CURSOR},
+            "ix_order_summary_not_processed_created_at",
+        ),
+        (
+            "order_summary_reader",
+            "get_orders_for_confirmation_count",
+            {},
+            "ix_order_summary_not_processed_created_at",
+        ),
+        (
+            "order_summary_reader",
+            "get_all_orders",
+            {"limit": 2, "after": CURSOR},
+            "ix_order_summary_created_at",
+        ),
+        (
+            "goods_reader",
+            "goods_in_folder",
+            {"parent_id": None, "only_active": False},
+            "ix_goods_parent_id_type_name",
+        ),
+        (
+            "goods_reader",
+            "goods_in_folder",
+            {"parent_id": CURSOR.id, "only_active": True},
+            "ix_goods_active_parent_id_type_name",
+        ),
+    ],
+)
+async def test_reader_query_uses_index(
+    request, db_session: AsyncSession, reader, method, kwargs, index_name
+):
+    reader_method = getattr(request.getfixturevalue(reader), method)
+
+    plan = await explain_reader_call(db_session, lambda: reader_method(**kwargs))
+
+    assert index_name in plan, plan
+
+
+async def test_order_collections_loading_uses_index(
+    db_session: AsyncSession,
+    order_reader: OrderReader,
+    added_order: OrderWithRelatedData,
+):
+    # collections are loaded by separate selectin queries only if order exists
+    db_session.expunge_all()
+    plan = await explain_reader_call(
+        db_session, lambda: order_reader.order_by_id(added_order.order.id)
+    )
+    assert "ix_order_line_order_id" in plan, plan
+    assert "ix_order_message_order_id" in plan, plan
+
+
+async def test_users_for_confirmation_uses_index(
+    db_session: AsyncSession, user_reader: UserReader
+):
+    # on a handful of rows planner prefers primary key of user_access_levels
+    connection = await db_session.connection()
+    await connection.exec_driver_sql(
+        "INSERT INTO \"user\" SELECT g, 'User' FROM generate_series(-2000, -1) g"
+    )
+    await connection.exec_driver_sql(
+        "INSERT INTO user_access_levels SELECT g, 2 FROM generate_series(-2000, -1) g"
+    )
+    await connection.exec_driver_sql('ANALYZE "user", user_access_levels')
+
+    plan = await explain_reader_call(db_session, user_reader.users_for_confirmation)
+
+    assert "ix_user_access_levels_access_level_id" in plan, plan
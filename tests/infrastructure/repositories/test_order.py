@@ -1,11 +1,37 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.domain.access_levels.models.access_level import LevelName
+from app.domain.goods.exceptions.goods import GoodsNotExists
 from app.domain.goods.models.goods import Goods
 from app.domain.goods.models.goods_type import GoodsType
 from app.domain.market.models.market import Market
-from app.domain.order.dto import OrderCreate, OrderLineCreate
-from app.domain.order.models.order import Order, OrderLine
+from app.domain.order.dto import (
+    OrderCreate,
+    OrderLineCreate,
+    PendingOrdersFilter,
+)
+from app.domain.order.exceptions.order import (
+    EmptyOrdersFilter,
+    OrderAlreadyConfirmed,
+    OrderLineGoodsHasIncorrectType,
+    OrderNotExists,
+)
+from app.domain.order.models.order import Order, OrderLine, OrderMessage
 from app.domain.order.models.user import AccessLevel
+from app.domain.order.value_objects import ConfirmedStatus
+from app.domain.user.exceptions.user import UserNotExists
 from app.domain.user.models.user import TelegramUser
+from app.infrastructure.database.repositories import (
+    GoodsRepo,
+    MarketRepo,
+    OrderReader,
+    OrderRepo,
+)
+from tests.infrastructure.repositories.conftest import OrderWithRelatedData
 
 
 class TestOrderRepo:
@@ -54,3 +80,262 @@ class TestOrderRepo:
         assert await order_repo.session.get(Market, market2.id) is not None
         assert await order_repo.session.get(Goods, goods.id) is not None
         assert await order_repo.session.get(TelegramUser, user.id) is not None
+
+    async def test_create_order_with_constant_count_of_statements(
+        self,
+        db_session: AsyncSession,
+        order_repo: OrderRepo,
+        goods_repo: GoodsRepo,
+        added_order: OrderWithRelatedData,
+    ):
+        goods = [
+            await goods_repo.add_goods(
+                Goods.create(type=GoodsType.GOODS, name=f"Goods{i}", sku=f"SKU{i}")
+            )
+            for i in range(5)
+        ]
+        await db_session.commit()
+
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        connection = await db_session.connection()
+        event.listen(connection.sync_connection, "before_cursor_execute", capture)
+        try:
+            order = await order_repo.create_order(
+                OrderCreate(
+                    order_lines=[
+                        OrderLineCreate(
+                            goods_id=item.id, goods_type=item.type, quantity=i + 1
+                        )
+                        for i, item in enumerate(goods)
+                    ],
+                    creator_id=added_order.user.id,
+                    recipient_market_id=added_order.market.id,
+                    commentary="Commentary",
+                )
+            )
+            # order is attached as persistent, nothing is left to flush
+            await db_session.flush()
+        finally:
+            event.remove(connection.sync_connection, "before_cursor_execute", capture)
+
+        # parties, goods, order, lines
+        assert len(statements) == 4
+        [event_] = order.events
+        assert [line.quantity for line in event_.order.order_lines] == [1, 2, 3, 4, 5]
+        assert event_.order.creator.name == added_order.user.name
+        await db_session.commit()
+
+        await order_repo.change_confirm_status(order.id, ConfirmedStatus.YES)
+        await db_session.commit()
+        db_session.expunge_all()
+
+        saved = await order_repo.order_by_id(order.id)
+        assert saved.confirmed is ConfirmedStatus.YES
+        assert saved.created_at == order.created_at
+        assert {line.id for line in saved.order_lines} == {
+            line.id for line in order.order_lines
+        }
+
+    async def test_create_order_keeps_related_entities_whole(
+        self,
+        db_session: AsyncSession,
+        order_repo: OrderRepo,
+        added_order: OrderWithRelatedData,
+    ):
+        db_session.expunge_all()
+
+        order = await order_repo.create_order(
+            OrderCreate(
+                order_lines=[
+                    OrderLineCreate(
+                        goods_id=added_order.goods.id,
+                        goods_type=added_order.goods.type,
+                        quantity=1,
+                    )
+                ],
+                creator_id=added_order.user.id,
+                recipient_market_id=added_order.market.id,
+                commentary="Commentary",
+            )
+        )
+
+        # entities loaded for the order are in identity map of the session
+        # order domain maps its own user and goods entities
+        creator = await db_session.get(type(order.creator), added_order.user.id)
+        assert creator is order.creator
+        assert {level.name for level in creator.access_levels} == {
+            LevelName.USER,
+            LevelName.ADMINISTRATOR,
+        }
+        goods = await db_session.get(
+            type(order.order_lines[0].goods), added_order.goods.id
+        )
+        assert goods is order.order_lines[0].goods
+        assert goods.children == []
+
+    async def test_create_order_validates_goods(
+        self,
+        order_repo: OrderRepo,
+        goods_repo: GoodsRepo,
+        added_order: OrderWithRelatedData,
+    ):
+        folder = await goods_repo.add_goods(
+            Goods.create(type=GoodsType.FOLDER, name="Folder")
+        )
+
+        def order_of(goods_id, goods_type=GoodsType.GOODS, creator_id=None):
+            return OrderCreate(
+                order_lines=[
+                    OrderLineCreate(
+                        goods_id=goods_id, goods_type=goods_type, quantity=1
+                    )
+                ],
+                creator_id=creator_id or added_order.user.id,
+                recipient_market_id=added_order.market.id,
+                commentary="Commentary",
+            )
+
+        with pytest.raises(GoodsNotExists):
+            await order_repo.create_order(order_of(uuid4()))
+        with pytest.raises(OrderLineGoodsHasIncorrectType):
+            await order_repo.create_order(order_of(folder.id))
+        with pytest.raises(OrderLineGoodsHasIncorrectType):
+            await order_repo.create_order(order_of(folder.id, GoodsType.FOLDER))
+        with pytest.raises(UserNotExists):
+            await order_repo.create_order(
+                order_of(added_order.goods.id, creator_id=-100)
+            )
+
+    async def test_change_confirm_status_once(
+        self,
+        db_session: AsyncSession,
+        order_repo: OrderRepo,
+        added_order: OrderWithRelatedData,
+    ):
+        order_id = added_order.order.id
+        order = await order_repo.order_by_id(order_id)
+        order.add_order_message(OrderMessage(message_id=1, chat_id=2))
+        await order_repo.edit_order(order)
+
+        confirmed = await order_repo.change_confirm_status(order_id, ConfirmedStatus.NO)
+        assert confirmed.id == order_id
+        assert confirmed.confirmed is ConfirmedStatus.NO
+        assert confirmed.creator.name == added_order.user.name
+        assert confirmed.recipient_market.name == added_order.market.name
+        assert [line.goods.sku for line in confirmed.order_lines] == ["12345"]
+        assert [m.chat_id for m in confirmed.order_messages] == [2]
+
+        # second confirmation doesn't pass the check of update
+        with pytest.raises(OrderAlreadyConfirmed):
+            await order_repo.change_confirm_status(order_id, ConfirmedStatus.YES)
+        with pytest.raises(OrderNotExists):
+            await order_repo.change_confirm_status(uuid4(), ConfirmedStatus.YES)
+
+        db_session.expunge_all()
+        saved = await order_repo.order_by_id(order_id)
+        assert saved.confirmed is ConfirmedStatus.NO
+        assert saved.confirmed_at is not None
+
+    async def test_change_confirm_status_bulk(
+        self,
+        order_repo: OrderRepo,
+        market_repo: MarketRepo,
+        added_order: OrderWithRelatedData,
+    ):
+        other_market = await market_repo.add_market(Market.create(name="Poland"))
+
+        def order_to(market_id):
+            return OrderCreate(
+                order_lines=[
+                    OrderLineCreate(
+                        goods_id=added_order.goods.id,
+                        goods_type=added_order.goods.type,
+                        quantity=1,
+                    )
+                ],
+                creator_id=added_order.user.id,
+                recipient_market_id=market_id,
+                commentary="Commentary",
+            )
+
+        same_market = await order_repo.create_order(order_to(added_order.market.id))
+        other = await order_repo.create_order(order_to(other_market.id))
+
+        changed = await order_repo.change_confirm_status_bulk(
+            PendingOrdersFilter(market_name="Ukraine"), ConfirmedStatus.YES
+        )
+        assert {order.id for order in changed} == {
+            added_order.order.id,
+            same_market.id,
+        }
+        assert all(order.confirmed is ConfirmedStatus.YES for order in changed)
+        assert [len(order.order_lines) for order in changed] == [1, 1]
+
+        # confirmed orders aren't changed again
+        changed = await order_repo.change_confirm_status_bulk(
+            PendingOrdersFilter(order_ids=[added_order.order.id, other.id]),
+            ConfirmedStatus.NO,
+        )
+        assert [order.id for order in changed] == [other.id]
+
+        day = other.created_at.date()
+        changed = await order_repo.change_confirm_status_bulk(
+            PendingOrdersFilter(start=day, end=day), ConfirmedStatus.NO
+        )
+        assert changed == []
+
+    async def test_change_confirm_status_bulk_requires_filter(
+        self,
+        db_session: AsyncSession,
+        order_repo: OrderRepo,
+        added_order: OrderWithRelatedData,
+    ):
+        with pytest.raises(EmptyOrdersFilter):
+            await order_repo.change_confirm_status_bulk(
+                PendingOrdersFilter(), ConfirmedStatus.YES
+            )
+
+        db_session.expunge_all()
+        saved = await order_repo.order_by_id(added_order.order.id)
+        assert saved.confirmed is ConfirmedStatus.NOT_PROCESSED
+
+        changed = await order_repo.change_confirm_status_bulk(
+            PendingOrdersFilter(all_orders=True), ConfirmedStatus.YES
+        )
+        assert [order.id for order in changed] == [added_order.order.id]
+
+
+class TestOrderReaderExport:
+    async def test_stream_orders_for_export(
+        self, order_reader: OrderReader, added_order: OrderWithRelatedData
+    ):
+        chunks = [
+            chunk
+            async for chunk in order_reader.stream_orders_for_export(
+                creator_id=added_order.user.id
+            )
+        ]
+
+        assert len(chunks) == 1
+        [row] = chunks[0]
+        assert row.order_id == added_order.order.id
+        assert row.creator_name == added_order.user.name
+        assert row.recipient_market_name == added_order.market.name
+        assert row.goods_sku == added_order.goods.sku
+        assert row.quantity == 1
+
+    async def test_stream_orders_for_export_filters(
+        self, order_reader: OrderReader, added_order: OrderWithRelatedData
+    ):
+        chunks = [
+            chunk
+            async for chunk in order_reader.stream_orders_for_export(
+                confirmed=ConfirmedStatus.YES
+            )
+        ]
+
+        assert chunks == []
@@ -0,0 +1,55 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.order.dto import OrderCreate, OrderLineCreate
+from app.domain.order.exceptions.order import OrderNotExists
+from app.domain.order.models.order import OrderMessage
+from app.infrastructure.database.repositories import (
+    CoreOrderReader,
+    OrderReader,
+    OrderRepo,
+)
+from tests.infrastructure.repositories.conftest import OrderWithRelatedData
+
+
+@pytest.fixture
+async def orders(
+    db_session: AsyncSession,
+    order_repo: OrderRepo,
+    added_order: OrderWithRelatedData,
+) -> OrderWithRelatedData:
+    order = added_order.order
+    order.add_order_message(OrderMessage(message_id=1, chat_id=2))
+    order.add_order_message(OrderMessage(message_id=3, chat_id=4))
+    for _ in range(3):
+        await order_repo.create_order(
+            OrderCreate(
+                order_lines=[
+                    OrderLineCreate(
+                        goods_id=added_order.goods.id,
+                        goods_type=added_order.goods.type,
+                        quantity=quantity,
+                    )
+                    for quantity in (1, 2)
+                ],
+                creator_id=added_order.user.id,
+                recipient_market_id=added_order.market.id,
+                commentary="commentary",
+            )
+        )
+    await db_session.commit()
+    db_session.expunge_all()
+    return added_order
+
+
+async def test_order_by_id_matches_orm_reader(
+    db_session: AsyncSession, orders: OrderWithRelatedData
+):
+    core_order = await CoreOrderReader(db_session).order_by_id(orders.order.id)
+    orm_order = await OrderReader(db_session).order_by_id(orders.order.id)
+
+    assert core_order == orm_order
+    assert len(core_order.order_messages) == 2
+
+    with pytest.raises(OrderNotExists):
+        await CoreOrderReader(db_session).order_by_id(orders.market.id)
@@ -0,0 +1,119 @@
+from datetime import timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.order.dto import (
+    OrderCreate,
+    OrderLineCreate,
+    PendingOrdersFilter,
+    User,
+)
+from app.domain.order.models.order import OrderConfirmStatusChanged
+from app.domain.order.value_objects import ConfirmedStatus
+from app.infrastructure.database.repositories import (
+    OrderRepo,
+    OrderStatsReader,
+    OrderStatsRepo,
+)
+from tests.infrastructure.repositories.conftest import OrderWithRelatedData
+
+
+async def test_created_order_is_counted(
+    db_session: AsyncSession,
+    order_stats_repo: OrderStatsRepo,
+    order_stats_reader: OrderStatsReader,
+    added_order: OrderWithRelatedData,
+):
+    order = added_order.order
+    await order_stats_repo.apply(order.events)
+    await order_stats_repo.apply(order.events)
+    await db_session.commit()
+
+    day = order.created_at.date()
+    report = await order_stats_reader.report(start=day, end=day)
+
+    [row] = report.rows
+    assert row.market_name == "Ukraine"
+    assert row.goods_id == added_order.goods.id
+    assert row.goods_name == "Good"
+    assert row.goods_sku == "12345"
+    assert row.confirmed is ConfirmedStatus.NOT_PROCESSED
+    assert row.order_count == 2
+    assert row.quantity == 2
+
+    next_day = day + timedelta(days=1)
+    assert (await order_stats_reader.report(start=next_day, end=next_day)).rows == []
+
+
+async def test_confirmed_order_moves_to_its_status(
+    db_session: AsyncSession,
+    order_repo: OrderRepo,
+    order_stats_repo: OrderStatsRepo,
+    order_stats_reader: OrderStatsReader,
+    added_order: OrderWithRelatedData,
+):
+    order = added_order.order
+    await order_stats_repo.apply(order.events)
+    order.events.clear()
+
+    confirmed = await order_repo.change_confirm_status(order.id, ConfirmedStatus.NO)
+    await order_stats_repo.apply(
+        [
+            OrderConfirmStatusChanged(
+                confirmed, User(id=added_order.user.id, name="User")
+            )
+        ]
+    )
+    await db_session.commit()
+
+    day = order.created_at.date()
+    report = await order_stats_reader.report(start=day, end=day)
+
+    [row] = report.rows
+    assert row.confirmed is ConfirmedStatus.NO
+    assert row.order_count == 1
+    assert row.quantity == 1
+
+
+async def test_batch_of_events_is_summed(
+    db_session: AsyncSession,
+    order_repo: OrderRepo,
+    order_stats_repo: OrderStatsRepo,
+    order_stats_reader: OrderStatsReader,
+    added_order: OrderWithRelatedData,
+):
+    order = added_order.order
+    other_order = await order_repo.create_order(
+        OrderCreate(
+            order_lines=[
+                OrderLineCreate(
+                    goods_id=added_order.goods.id,
+                    goods_type=added_order.goods.type,
+                    quantity=quantity,
+                )
+                for quantity in (2, 3)
+            ],
+            creator_id=added_order.user.id,
+            recipient_market_id=added_order.market.id,
+            commentary="commentary",
+        )
+    )
+    await order_stats_repo.apply(order.events + other_order.events)
+
+    changed = await order_repo.change_confirm_status_bulk(
+        PendingOrdersFilter(all_orders=True), ConfirmedStatus.YES
+    )
+    user = User(id=added_order.user.id, name="User")
+    await order_stats_repo.apply(
+        [OrderConfirmStatusChanged(changed_order, user) for changed_order in changed]
+    )
+    await db_session.commit()
+
+    day = order.created_at.date()
+    report = await order_stats_reader.report(start=day, end=day)
+
+    # lines of one goods are one order
+    [row] = report.rows
+    assert row.confirmed is ConfirmedStatus.YES
+    assert row.order_count == 2
+    assert row.quantity == 6
@@ -0,0 +1,157 @@
+from datetime import timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.order.dto import OrderCreate, OrderCursor, OrderLineCreate, User
+from app.domain.order.models.order import OrderConfirmStatusChanged
+from app.domain.order.value_objects import ConfirmedStatus
+from app.infrastructure.database.repositories import (
+    OrderRepo,
+    OrderSummaryReader,
+    OrderSummaryRepo,
+)
+from tests.infrastructure.repositories.conftest import OrderWithRelatedData
+
+
+async def test_summary_is_saved_from_order_created(
+    db_session: AsyncSession,
+    order_summary_repo: OrderSummaryRepo,
+    order_summary_reader: OrderSummaryReader,
+    added_order: OrderWithRelatedData,
+):
+    order = added_order.order
+    await order_summary_repo.apply(order.events)
+    # event can be delivered twice, summary is overwritten
+    await order_summary_repo.apply(order.events)
+    await db_session.commit()
+
+    page = await order_summary_reader.get_user_orders(user_id=order.creator.id, limit=2)
+
+    assert page.total == 1
+    [summary] = page.orders
+    assert summary.id == order.id
+    assert summary.created_at == order.created_at
+    assert summary.creator_name == "User"
+    assert summary.recipient_market_name == "Ukraine"
+    assert summary.confirmed is ConfirmedStatus.NOT_PROCESSED
+    assert summary.line_count == 1
+    assert summary.lines_summary == "Good 12345 x 1"
+    assert await order_summary_reader.get_orders_for_confirmation_count() == 1
+
+    after = await order_summary_reader.get_all_orders(
+        limit=2, after=OrderCursor.from_order(summary)
+    )
+    assert after.orders == []
+    assert after.total == 1
+
+
+async def test_confirmed_status_is_updated(
+    db_session: AsyncSession,
+    order_repo: OrderRepo,
+    order_summary_repo: OrderSummaryRepo,
+    order_summary_reader: OrderSummaryReader,
+    added_order: OrderWithRelatedData,
+):
+    order = added_order.order
+    await order_summary_repo.apply(order.events)
+    order.events.clear()
+
+    confirmed = await order_repo.change_confirm_status(order.id, ConfirmedStatus.YES)
+    await order_summary_repo.apply(
+        [
+            OrderConfirmStatusChanged(
+                confirmed, User(id=added_order.user.id, name="User")
+            )
+        ]
+    )
+    await db_session.commit()
+
+    page = await order_summary_reader.get_orders_for_confirmation(limit=2)
+    assert page.orders == []
+    assert page.total == 0
+
+    [summary] = (await order_summary_reader.get_all_orders(limit=2)).orders
+    assert summary.confirmed is ConfirmedStatus.YES
+
+
+async def test_export_expands_lines(
+    db_session: AsyncSession,
+    order_summary_repo: OrderSummaryRepo,
+    order_summary_reader: OrderSummaryReader,
+    added_order: OrderWithRelatedData,
+):
+    order = added_order.order
+    await order_summary_repo.apply(order.events)
+    await db_session.commit()
+
+    chunks = [
+        chunk
+        async for chunk in order_summary_reader.stream_orders_for_export(
+            creator_id=order.creator.id
+        )
+    ]
+
+    [[row]] = chunks
+    assert row.order_id == order.id
+    assert row.creator_name == "User"
+    assert row.recipient_market_name == "Ukraine"
+    assert row.goods_name == "Good"
+    assert row.goods_sku == "12345"
+    assert row.quantity == 1
+    assert row.confirmed is ConfirmedStatus.NOT_PROCESSED
+
+    no_rows = order_summary_reader.stream_orders_for_export(
+        confirmed=ConfirmedStatus.YES
+    )
+    assert [chunk async for chunk in no_rows] == []
+
+
+async def test_confirmers_claim_different_orders(
+    db_session: AsyncSession,
+    order_repo: OrderRepo,
+    order_summary_repo: OrderSummaryRepo,
+    added_order: OrderWithRelatedData,
+):
+    other_order = await order_repo.create_order(
+        OrderCreate(
+            order_lines=[
+                OrderLineCreate(
+                    goods_id=added_order.goods.id,
+                    goods_type=added_order.goods.type,
+                    quantity=2,
+                )
+            ],
+            creator_id=added_order.user.id,
+            recipient_market_id=added_order.market.id,
+            commentary="commentary",
+        )
+    )
+    await order_summary_repo.apply(added_order.order.events + other_order.events)
+    lease = timedelta(minutes=10)
+
+    [first] = (await order_summary_repo.claim_order_for_confirmation(1, lease)).orders
+    page = await order_summary_repo.claim_order_for_confirmation(2, lease)
+    [second] = page.orders
+    assert first.id != second.id
+    # order leased to other confirmer isn't in the queue
+    assert page.total == 1
+
+    # claim again keeps own order, others are leased
+    [again] = (await order_summary_repo.claim_order_for_confirmation(1, lease)).orders
+    assert again.id == first.id
+    page = await order_summary_repo.claim_order_for_confirmation(3, lease)
+    assert page.orders == []
+    assert page.total == 0
+
+    # next order after own is leased by other user, own one is released
+    page = await order_summary_repo.claim_order_for_confirmation(
+        1, lease, after=OrderCursor.from_order(first)
+    )
+    assert page.orders == []
+    [third] = (await order_summary_repo.claim_order_for_confirmation(3, lease)).orders
+    assert third.id == first.id
+
+    # expired lease is claimed by other user
+    await order_summary_repo.claim_order_for_confirmation(3, -lease)
+    [fourth] = (await order_summary_repo.claim_order_for_confirmation(1, lease)).orders
+    assert fourth.id == first.id
@@ -0,0 +1,124 @@
+from datetime import timedelta
+
+from sqlalchemy import select
+
+from app.domain.base.events.dispatcher import EventDispatcher
+from app.domain.order import dto
+from app.domain.order.models.order import OrderConfirmStatusChanged, OrderCreated
+from app.infrastructure.database.models import outbox_table
+from app.infrastructure.database.repositories import OutboxRepo
+from app.infrastructure.outbox.worker import OutboxWorker
+from tests.infrastructure.repositories.conftest import OrderWithRelatedData
+
+
+def make_worker(db_session, event_dispatcher, max_attempts=3) -> OutboxWorker:
+    return OutboxWorker(
+        session_factory=lambda: db_session,
+        event_dispatcher=event_dispatcher,
+        batch_size=10,
+        poll_interval=0,
+        max_attempts=max_attempts,
+        lease=60,
+    )
+
+
+async def test_notifications_are_sent_and_deleted(
+    db_session, outbox_repo: OutboxRepo, added_order: OrderWithRelatedData
+):
+    order = dto.Order.from_orm(added_order.order)
+    user = dto.User.from_orm(added_order.user)
+    await outbox_repo.add([OrderCreated(order), OrderConfirmStatusChanged(order, user)])
+    await db_session.commit()
+
+    sent = []
+
+    async def handler(event, data):
+        sent.append(event)
+
+    event_dispatcher = EventDispatcher()
+    event_dispatcher.register_notify(OrderCreated, handler)
+    event_dispatcher.register_notify(OrderConfirmStatusChanged, handler)
+
+    assert await make_worker(db_session, event_dispatcher).process_batch() == 2
+
+    assert [type(event) for event in sent] == [
+        OrderCreated,
+        OrderConfirmStatusChanged,
+    ]
+    assert sent[0].order == order
+    assert sent[1].order == order
+    assert sent[1].user == user
+
+    result = await db_session.execute(select(outbox_table.c.id))
+    assert result.all() == []
+
+
+async def test_failed_notification_is_kept_after_max_attempts(
+    db_session, outbox_repo: OutboxRepo, added_order: OrderWithRelatedData
+):
+    await outbox_repo.add([OrderCreated(dto.Order.from_orm(added_order.order))])
+    await db_session.commit()
+
+    async def handler(event, data):
+        raise RuntimeError("telegram is down")
+
+    event_dispatcher = EventDispatcher()
+    event_dispatcher.register_notify(OrderCreated, handler)
+    worker = make_worker(db_session, event_dispatcher, max_attempts=2)
+
+    assert await worker.process_batch() == 1
+    assert await worker.process_batch() == 1
+    assert await worker.process_batch() == 0
+
+    result = await db_session.execute(
+        select(outbox_table.c.attempts, outbox_table.c.last_error)
+    )
+    assert result.all() == [(2, "RuntimeError('telegram is down')")]
+
+
+async def test_claimed_messages_are_hidden_till_lease_ends(
+    db_session, outbox_repo: OutboxRepo, added_order: OrderWithRelatedData
+):
+    order = dto.Order.from_orm(added_order.order)
+    await outbox_repo.add([OrderCreated(order), OrderCreated(order)])
+    lease = timedelta(minutes=1)
+
+    [first] = await outbox_repo.claim_batch(1, max_attempts=3, lease=lease)
+    [second] = await outbox_repo.claim_batch(10, max_attempts=3, lease=-lease)
+    assert first.id < second.id
+
+    # lease of second message has ended, so it is returned to outbox
+    [reclaimed] = await outbox_repo.claim_batch(10, max_attempts=3, lease=lease)
+    assert reclaimed.id == second.id
+    assert await outbox_repo.claim_batch(10, max_attempts=3, lease=lease) == []
+
+
+async def test_sent_messages_are_deleted_one_by_one(
+    db_session, outbox_repo: OutboxRepo, added_order: OrderWithRelatedData
+):
+    order = dto.Order.from_orm(added_order.order)
+    user = dto.User.from_orm(added_order.user)
+    await outbox_repo.add([OrderCreated(order), OrderConfirmStatusChanged(order, user)])
+    await db_session.commit()
+
+    async def sent(event, data):
+        pass
+
+    async def failed(event, data):
+        raise RuntimeError("telegram is down")
+
+    event_dispatcher = EventDispatcher()
+    event_dispatcher.register_notify(OrderCreated, sent)
+    event_dispatcher.register_notify(OrderConfirmStatusChanged, failed)
+
+    assert await make_worker(db_session, event_dispatcher).process_batch() == 2
+
+    result = await db_session.execute(
+        select(
+            outbox_table.c.event_type,
+            outbox_table.c.attempts,
+            outbox_table.c.locked_until,
+        )
+    )
+    # failed message isn't waiting for lease, it is retried by next batch
+    assert result.all() == [("OrderConfirmStatusChanged", 1, None)]
@@ -0,0 +1,37 @@
+from typing import Dict, List
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.base.dto.base import DTO
+from app.domain.order import dto
+from app.domain.order.models.order import Order, OrderMessage
+from app.domain.user import dto as user_dto
+from app.domain.user.models.user import TelegramUser
+from app.infrastructure.database.trusted_dto import trusted_from_orm, trusted_list
+from tests.infrastructure.repositories.conftest import OrderWithRelatedData
+
+
+async def test_same_dto_as_validated(
+    db_session: AsyncSession, added_order: OrderWithRelatedData
+):
+    order = await db_session.get(Order, added_order.order.id)
+    order.add_order_message(OrderMessage(message_id=1, chat_id=2))
+    await db_session.flush()
+
+    trusted = trusted_from_orm(dto.Order, order)
+    assert trusted == dto.Order.from_orm(order)
+    assert type(trusted.order_lines[0].goods) is dto.Goods
+    assert trusted.order_messages == [dto.order.OrderMessage(message_id=1, chat_id=2)]
+
+    user = await db_session.get(TelegramUser, added_order.user.id)
+    assert trusted_list(user_dto.User, [user]) == [user_dto.User.from_orm(user)]
+    assert isinstance(trusted_list(user_dto.User, [user])[0].access_levels, tuple)
+
+
+def test_unsupported_nested_shape():
+    class Nested(DTO):
+        items: Dict[str, List[dto.Goods]]
+
+    with pytest.raises(TypeError):
+        trusted_from_orm(Nested, object())
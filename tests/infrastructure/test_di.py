@@ -0,0 +1,56 @@
+import pytest
+
+from app.domain.order.access_policy import (
+    AllowedOrderAccessPolicy,
+    OrderAccessPolicy,
+    UserBasedOrderAccessPolicy,
+)
+from app.domain.order.usecases.order import OrderService
+from app.infrastructure.di import Container, DependencyNotRegistered, Scope
+from app.tgbot.container import ALLOWED_POLICIES, build_container
+
+
+class Dependency:
+    pass
+
+
+def test_request_dependency_is_created_once_per_scope():
+    container = Container()
+    created = []
+    container.register(
+        Dependency, lambda c: created.append(1) or Dependency(), Scope.REQUEST
+    )
+
+    scope = container.scope({})
+    assert created == []
+    assert scope.get(Dependency) is scope.get(Dependency)
+    assert container.scope({}).get(Dependency) is not scope.get(Dependency)
+    assert len(created) == 2
+
+
+def test_app_dependency_is_shared_between_scopes():
+    container = Container()
+    container.register(Dependency, lambda c: Dependency(), Scope.APP)
+
+    assert container.scope({}).get(Dependency) is container.scope({}).get(Dependency)
+
+
+def test_not_registered():
+    with pytest.raises(DependencyNotRegistered):
+        Container().scope({}).get(Dependency)
+
+
+def test_services_are_resolved_with_policies(config):
+    container = build_container(config)
+    data = {"uow": object(), "event_dispatcher": object(), "user": None}
+
+    order_service = container.scope(data).get(OrderService)
+    assert isinstance(order_service.access_policy, UserBasedOrderAccessPolicy)
+
+    scope = container.scope(data, overrides=ALLOWED_POLICIES)
+    order_service = scope.get(OrderService)
+    assert isinstance(order_service.access_policy, AllowedOrderAccessPolicy)
+    assert order_service.access_policy is container.scope({}).get(
+        AllowedOrderAccessPolicy
+    )
+    assert scope.get(OrderAccessPolicy) is order_service.access_policy
@@ -0,0 +1,45 @@
+import asyncio
+
+from sqlalchemy import text
+
+from app.infrastructure.database.db import make_connection_string, make_engine
+from app.infrastructure.database.pool import PoolMetrics
+
+
+async def test_pool_metrics_and_connection_settings(config):
+    db = config.db.copy(update={"pool_size": 1, "max_overflow": 0})
+    metrics = PoolMetrics()
+    engine = make_engine(db, pool_metrics=metrics)
+
+    async def hold_connection():
+        async with engine.connect() as connection:
+            await asyncio.sleep(0.05)
+            return (await connection.execute(text("SHOW jit"))).scalar_one()
+
+    try:
+        # second checkout waits till first connection is returned
+        assert await asyncio.gather(hold_connection(), hold_connection()) == [
+            "off",
+            "off",
+        ]
+    finally:
+        await engine.dispose()
+
+    assert metrics.connects == 1
+    assert metrics.checkouts == 2
+    assert metrics.checked_out == 0
+    assert metrics.max_checked_out == 1
+    assert metrics.max_overflow == 0
+    assert metrics.wait_max >= 0.04
+
+
+async def test_replica_connections_are_read_only(config):
+    # primary stands in for replica
+    db = config.db.copy(update={"replica_dsn": make_connection_string(config.db)})
+    engine = make_engine(db, replica=True)
+    try:
+        async with engine.connect() as connection:
+            result = await connection.execute(text("SHOW transaction_read_only"))
+            assert result.scalar_one() == "on"
+    finally:
+        await engine.dispose()
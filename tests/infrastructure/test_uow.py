@@ -0,0 +1,113 @@
+from unittest.mock import AsyncMock, Mock
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.cache import IdentityMap, IdentityMapStats
+from app.infrastructure.database.repositories import (
+    AccessLevelReader,
+    GoodsReader,
+    GoodsRepo,
+    MarketReader,
+    MarketRepo,
+    OrderReader,
+    OrderRepo,
+    OrderStatsReader,
+    OrderStatsRepo,
+    OrderSummaryReader,
+    OrderSummaryRepo,
+    OutboxRepo,
+    UserReader,
+    UserRepo,
+)
+from app.infrastructure.database.uow import SQLAlchemyUoW
+from tests.infrastructure.repositories.conftest import (  # noqa: F401 fixture
+    OrderWithRelatedData,
+    added_order,
+)
+
+
+def make_uow(
+    session_factory, identity_map=None, replica_session_factory=None
+) -> SQLAlchemyUoW:
+    return SQLAlchemyUoW(
+        session_factory=session_factory,
+        user_repo=UserRepo,
+        access_level_reader=AccessLevelReader,
+        user_reader=UserReader,
+        goods_repo=GoodsRepo,
+        goods_reader=GoodsReader,
+        market_repo=MarketRepo,
+        market_reader=MarketReader,
+        order_repo=OrderRepo,
+        order_reader=OrderReader,
+        order_summary_repo=OrderSummaryRepo,
+        order_summary_reader=OrderSummaryReader,
+        order_stats_repo=OrderStatsRepo,
+        order_stats_reader=OrderStatsReader,
+        outbox_repo=OutboxRepo,
+        identity_map=identity_map,
+        replica_session_factory=replica_session_factory,
+    )
+
+
+async def test_session_is_not_created_without_repo_access():
+    session_factory = Mock()
+    uow = make_uow(session_factory)
+
+    await uow.commit()
+    await uow.rollback()
+    await uow.close()
+
+    session_factory.assert_not_called()
+
+
+async def test_repos_share_one_session(db_session: AsyncSession):
+    session_factory = Mock(return_value=db_session)
+    uow = make_uow(session_factory)
+
+    assert uow.user is uow.user
+    assert uow.user.session is db_session
+    assert uow.order_reader.session is db_session
+    session_factory.assert_called_once()
+
+
+async def test_reads_by_id_are_memoized_till_commit(
+    db_session: AsyncSession, added_order: OrderWithRelatedData
+):
+    stats = IdentityMapStats()
+    uow = make_uow(Mock(return_value=db_session), IdentityMap(stats))
+    order_id = added_order.order.id
+
+    order = await uow.order_reader.order_by_id(order_id)
+    assert await uow.order_reader.order_by_id(order_id) is order
+    assert stats.hits == 1
+
+    await uow.commit()
+    assert await uow.order_reader.order_by_id(order_id) is not order
+    assert stats.misses == 2
+
+
+async def test_readers_use_replica_till_primary_is_opened(db_session: AsyncSession):
+    replica_session = AsyncMock(spec=AsyncSession)
+    identity_map = IdentityMap(IdentityMapStats())
+    uow = make_uow(
+        Mock(return_value=db_session),
+        identity_map,
+        replica_session_factory=Mock(return_value=replica_session),
+    )
+
+    assert uow.user_reader.session is replica_session
+    assert uow.order_reader.session is replica_session
+    assert uow.user_reader is uow.user_reader
+
+    await identity_map.get("key", AsyncMock(return_value=1))
+    assert uow.user.session is db_session
+    # rest of update reads its own writes
+    assert uow.user_reader.session is db_session
+    assert uow.order_reader.session is db_session
+    assert await identity_map.get("key", AsyncMock(return_value=2)) == 2
+
+    await uow.commit()
+    replica_session.commit.assert_not_called()
+    await uow.close()
+    replica_session.close.assert_awaited_once()
@@ -0,0 +1,54 @@
+import datetime
+from uuid import uuid4
+
+import pytest
+
+from app.domain.order.dto import PendingOrdersFilter
+from app.domain.order.value_objects.confirmed_status import ConfirmedStatus
+from app.tgbot.services.bulk_confirmation import parse_bulk_confirmation
+
+
+@pytest.mark.parametrize("args", [None, "", "yes", "no", "maybe all"])
+def test_status_and_filter_are_required(args):
+    with pytest.raises(ValueError):
+        parse_bulk_confirmation(args)
+
+
+def test_all_orders_are_changed_only_explicitly():
+    assert parse_bulk_confirmation("no ALL") == (
+        ConfirmedStatus.NO,
+        PendingOrdersFilter(all_orders=True),
+    )
+
+
+def test_period_and_market():
+    status, orders = parse_bulk_confirmation("yes 2022-01-01 2022-01-07 Main st 1")
+
+    assert status is ConfirmedStatus.YES
+    assert orders == PendingOrdersFilter(
+        start=datetime.date(2022, 1, 1),
+        end=datetime.date(2022, 1, 7),
+        market_name="Main st 1",
+    )
+
+
+def test_order_ids():
+    order_ids = [uuid4(), uuid4()]
+
+    _, orders = parse_bulk_confirmation(f"yes {order_ids[0]} {order_ids[1]}")
+
+    assert orders == PendingOrdersFilter(order_ids=order_ids)
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        f"yes {uuid4()} {str(uuid4())[:-1]}",
+        f"yes {str(uuid4())[1:]} {uuid4()}",
+        "yes 2022-13-01",
+        "yes 2022-01-07 2022-01-01",
+    ],
+)
+def test_malformed_filters_are_rejected(args):
+    with pytest.raises(ValueError):
+        parse_bulk_confirmation(args)
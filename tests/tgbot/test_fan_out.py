@@ -0,0 +1,100 @@
+import asyncio
+
+from aiogram.exceptions import TelegramBadRequest, TelegramRetryAfter
+from aiogram.methods import SendMessage
+
+from app.tgbot.services.fan_out import FanOut
+
+METHOD = SendMessage(chat_id=1, text="text")
+
+
+async def test_calls_are_bounded_and_results_keep_order():
+    fan_out = FanOut(max_concurrent=2, max_retries=0)
+    in_flight = 0
+    max_in_flight = 0
+
+    async def call(i: int) -> int:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01 * (5 - i))
+        in_flight -= 1
+        return i
+
+    results = await fan_out.run(lambda i=i: call(i) for i in range(5))
+
+    assert results == [0, 1, 2, 3, 4]
+    assert max_in_flight == 2
+
+
+async def test_failed_calls_are_skipped():
+    fan_out = FanOut(max_concurrent=2, max_retries=0)
+
+    async def fail():
+        raise TelegramBadRequest(method=METHOD, message="chat not found")
+
+    async def ok():
+        return "ok"
+
+    assert await fan_out.run([fail, ok, fail]) == ["ok"]
+
+
+async def test_retry_after_flood_control():
+    sleeps = []
+
+    async def sleep(delay: float):
+        sleeps.append(delay)
+
+    fan_out = FanOut(max_concurrent=1, max_retries=2, sleep=sleep)
+    attempts = 0
+
+    async def flood_once():
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise TelegramRetryAfter(method=METHOD, message="", retry_after=3)
+        return attempts
+
+    async def always_flood():
+        raise TelegramRetryAfter(method=METHOD, message="", retry_after=5)
+
+    assert await fan_out.run([flood_once]) == [2]
+    assert sleeps == [3]
+
+    assert await fan_out.run([always_flood]) == []
+    assert sleeps == [3, 5, 5]
+
+
+async def test_slot_is_free_while_waiting_for_retry():
+    waiting = asyncio.Event()
+    resume = asyncio.Event()
+
+    async def sleep(delay: float):
+        waiting.set()
+        await resume.wait()
+
+    fan_out = FanOut(max_concurrent=1, max_retries=1, sleep=sleep)
+    calls = []
+
+    async def flood_once():
+        calls.append("flood")
+        if len(calls) == 1:
+            raise TelegramRetryAfter(method=METHOD, message="", retry_after=30)
+        return "retried"
+
+    async def ok():
+        calls.append("ok")
+        resume.set()
+        return "ok"
+
+    async def ok_after_flood():
+        await waiting.wait()
+        return await fan_out.run([ok])
+
+    # slot held while waiting would block the second call forever
+    results = await asyncio.wait_for(
+        asyncio.gather(fan_out.run([flood_once]), ok_after_flood()), timeout=1
+    )
+
+    assert results == [["retried"], ["ok"]]
+    assert calls == ["flood", "ok", "flood"]
@@ -0,0 +1,66 @@
+import asyncio
+
+from aiogram import Bot, Dispatcher
+from aiogram.types import Message
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from app.tgbot.webhook import BoundedRequestHandler
+
+MAX_CONCURRENT_UPDATES = 2
+
+
+def message_update(update_id: int) -> dict:
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "date": 0,
+            "chat": {"id": 1, "type": "private"},
+            "from": {"id": 1, "is_bot": False, "first_name": "User"},
+            "text": "text",
+        },
+    }
+
+
+async def test_concurrent_updates_are_limited():
+    dp = Dispatcher()
+    release = asyncio.Event()
+    in_flight = 0
+    max_in_flight = 0
+    processed = []
+
+    @dp.message()
+    async def handler(message: Message):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await release.wait()
+        in_flight -= 1
+        processed.append(message.message_id)
+
+    app = web.Application()
+    request_handler = BoundedRequestHandler(
+        dispatcher=dp,
+        bot=Bot("42:TEST"),
+        max_concurrent_updates=MAX_CONCURRENT_UPDATES,
+    )
+    request_handler.register(app, path="/webhook")
+
+    async with TestClient(TestServer(app)) as client:
+        # answered before processing of the updates is finished
+        for update_id in range(MAX_CONCURRENT_UPDATES):
+            response = await client.post("/webhook", json=message_update(update_id))
+            assert response.status == 200
+
+        # no free slots, so next request waits
+        waiting = asyncio.create_task(client.post("/webhook", json=message_update(2)))
+        await asyncio.sleep(0.1)
+        assert not waiting.done()
+
+        release.set()
+        response = await waiting
+        assert response.status == 200
+
+    assert sorted(processed) == [0, 1, 2]
+    assert max_in_flight == MAX_CONCURRENT_UPDATES